@@ -0,0 +1,55 @@
+"""
+Per-call overhead of ``add_logging``, in nanoseconds, against the bare
+call and a wrapper that only reads the clock twice.
+
+    python benchmarks/bench_add_logging.py [calls]
+"""
+import pathlib
+import sys
+from time import perf_counter_ns
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from melonutils.core import add_logging  # noqa: E402
+
+
+def raw(a, b):
+    return a + b
+
+
+def passthrough(*args, **kwargs):
+    return raw(*args, **kwargs)
+
+
+def clocks(*args, **kwargs):
+    start = perf_counter_ns()
+    try:
+        return raw(*args, **kwargs)
+    finally:
+        perf_counter_ns() - start
+
+
+def bench(func, calls: int, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        for i in range(calls):
+            func(i, 1)
+        best = min(best, (perf_counter_ns() - start) / calls)
+    return best
+
+
+def main(calls: int = 1_000_000) -> None:
+    cases = {
+        "raw call": raw,
+        "*args pass-through": passthrough,
+        "pass-through + 2 clock reads": clocks,
+        "add_logging": add_logging(name="bench.full")(raw),
+        "add_logging, sample_rate=0.01": add_logging(name="bench.sampled", sample_rate=0.01)(raw),
+    }
+    for name, func in cases.items():
+        print("{:<32}{:>8.0f} ns".format(name, bench(func, calls)))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,66 @@
+"""
+Time per date of ``format_date`` and ``format_dates`` against a plain
+``strftime``, in nanoseconds, for a sorted audit log page and for dates
+spread over a month, plus ``discord_timestamps`` for comparison.
+
+The first pass of every case starts from an empty cache.
+
+    python benchmarks/bench_dates.py [count]
+"""
+import pathlib
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from time import perf_counter_ns
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from melonutils.core import DATE_FORMAT, default_date_formatter, discord_timestamps, format_date, format_dates  # noqa: E402
+
+
+def strftime_each(dates):
+    return [date.strftime(DATE_FORMAT) for date in dates]
+
+
+def format_date_each(dates):
+    return [format_date(date) for date in dates]
+
+
+def bench(func, dates, repeat: int = 5):
+    default_date_formatter.cache_clear()
+    start = perf_counter_ns()
+    func(dates)
+    cold = (perf_counter_ns() - start) / len(dates)
+    warm = float("inf")
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        func(dates)
+        warm = min(warm, (perf_counter_ns() - start) / len(dates))
+    return cold, warm
+
+
+def main(count: int = 10_000) -> None:
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    random.seed(0)
+    workloads = {
+        # an entry every few seconds, as in a moderation log
+        "sorted log": [start + timedelta(seconds=3 * i) for i in range(count)],
+        "random, one month": sorted(start + timedelta(seconds=random.randrange(30 * 86400)) for _ in range(count)),
+    }
+    cases = {
+        "strftime": strftime_each,
+        "format_date": format_date_each,
+        "format_dates": format_dates,
+        "discord_timestamps": discord_timestamps,
+    }
+    for workload, dates in workloads.items():
+        assert format_dates(dates) == strftime_each(dates)
+        minutes = len({date.replace(second=0) for date in dates})
+        print("{} ({} dates, {} distinct minutes)".format(workload, len(dates), minutes))
+        print("    {:<22}{:>10}{:>10}".format("", "cold", "warm"))
+        for name, func in cases.items():
+            print("    {:<22}{:>7.0f} ns{:>7.0f} ns".format(name, *bench(func, dates)))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,65 @@
+"""
+Bytes per embed property object, slot-based classes against the same
+attributes kept in a per-instance ``__dict__``.
+
+    python benchmarks/bench_slots.py [count]
+"""
+import gc
+import pathlib
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from melonutils.core.object import (  # noqa: E402
+    AuthorObject,
+    Field,
+    FooterObject,
+    ImageObject,
+    ProviderObject,
+    VideoObject,
+)
+
+SAMPLES = (
+    (AuthorObject, {"name": "author", "url": "https://example.com", "icon_url": None, "proxy_icon_url": None}),
+    (FooterObject, {"text": "footer", "icon_url": None, "proxy_icon_url": None}),
+    (ImageObject, {"url": "https://example.com/a.png", "proxy_url": None, "height": 10, "width": 10}),
+    (VideoObject, {"url": "https://example.com/a.mp4", "height": 10, "width": 10}),
+    (ProviderObject, {"name": "provider", "url": "https://example.com"}),
+    (Field, {"name": "name", "value": "value", "inline": False}),
+)
+
+
+class _Plain:
+    """
+    The layout before ``__slots__``, attributes in the instance dict.
+    """
+
+
+def _measure(build, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objects = [build() for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / count
+
+
+def _plain(data):
+    obj = _Plain()
+    obj.__dict__.update(data)
+    obj._encoded = None
+    return obj
+
+
+def main(count: int = 100_000) -> None:
+    print("{:<16}{:>10}{:>10}".format("object", "dict", "slots"))
+    for cls, data in SAMPLES:
+        before = _measure(lambda: _plain(data), count)
+        after = _measure(lambda: cls.fromTrusted(data), count)
+        print("{:<16}{:>10.0f}{:>10.0f}".format(cls.__name__, before, after))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -1,5 +1,199 @@
-from .classes import *
-from .embed import *
-from .exceptions import *
-from .helpers import *
-from .object import *
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+# Submodules, and the heavy dependencies behind them (discord, redbot),
+# are only imported when one of their names is first accessed.
+_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    ".ansi": (
+        "ANSI_COLORS",
+        "ANSI_FORMATS",
+        "ansi_style",
+        "AnsiBuilder",
+    ),
+    ".dates": (
+        "DATE_FORMAT",
+        "TIMESTAMP_STYLES",
+        "DateCacheInfo",
+        "DateFormatter",
+        "default_date_formatter",
+        "format_dates",
+        "discord_timestamp",
+        "discord_timestamps",
+    ),
+    ".embed": (
+        "ANY_USER",
+        "Embed",
+        "embeds_to_json",
+    ),
+    ".exceptions": (
+        "RedBotException",
+        "RedBotCommandError",
+        "HierarchyException",
+        "ActionNotExecutable",
+        "EmbedGenException",
+        "UnexpectedKwargsError",
+        "InvalidColorError",
+        "InvalidFieldError",
+        "count_error",
+        "error_counts",
+        "reset_error_counts",
+    ),
+    ".guard": (
+        "EditGuardStats",
+        "EditGuard",
+        "embed_fingerprint",
+    ),
+    ".helpers": (
+        "ascii_color",
+        "markdown_remove",
+        "codeblock_wrapper",
+        "codeblock_chunks",
+        "safe_reason",
+        "format_date",
+        "add_logging",
+        "can_execute_action",
+        "can_execute_action_many",
+    ),
+    ".hierarchy": (
+        "ActionResult",
+        "RoleIndex",
+        "default_role_index",
+    ),
+    ".interning": (
+        "InternStats",
+        "ObjectInterner",
+        "default_interner",
+    ),
+    ".lazy": (
+        "LazyEmbed",
+    ),
+    ".members": (
+        "MemberCacheStats",
+        "MemberCache",
+        "default_member_cache",
+    ),
+    ".metrics": (
+        "render_metrics",
+        "MetricsServer",
+    ),
+    ".moderation": (
+        "ModerationAction",
+        "ModerationResult",
+        "ModerationExecutor",
+    ),
+    ".object": (
+        "EmbedType",
+        "EmbedObject",
+        "EmptyObject",
+        "AuthorObject",
+        "FooterObject",
+        "ImageObject",
+        "ThumbnailObject",
+        "VideoObject",
+        "ProviderObject",
+        "Field",
+        "Fields",
+        "check_title",
+        "process_title",
+        "check_desc",
+        "process_desc",
+    ),
+    ".paginator": (
+        "EmbedPaginator",
+    ),
+    ".render": (
+        "RenderCacheStats",
+        "RenderCache",
+    ),
+    ".sanitizer": (
+        "sanitize",
+        "sanitize_many",
+        "sanitize_cache_info",
+        "clear_sanitize_cache",
+    ),
+    ".schema": (
+        "SchemaViolation",
+        "SchemaError",
+        "Rule",
+        "String",
+        "Url",
+        "Integer",
+        "Boolean",
+        "OneOf",
+        "Timestamp",
+        "Object",
+        "Array",
+        "CompiledSchema",
+        "compile_schema",
+        "AUTHOR_SCHEMA",
+        "FOOTER_SCHEMA",
+        "IMAGE_SCHEMA",
+        "VIDEO_SCHEMA",
+        "PROVIDER_SCHEMA",
+        "FIELD_SCHEMA",
+        "EMBED_SCHEMA",
+        "validate_embed",
+    ),
+    ".store": (
+        "EmbedStoreStats",
+        "EmbedStore",
+    ),
+    ".template": (
+        "EmbedTemplate",
+    ),
+    ".timing": (
+        "TimingStats",
+        "TimingHistogram",
+        "get_histogram",
+        "get_timings",
+        "reset_timings",
+    ),
+    ".validators": (
+        "URLValidationResult",
+        "validate_url",
+        "validate_urls",
+        "url_cache_info",
+        "clear_url_cache",
+    ),
+}
+
+_LOOKUP: Dict[str, str] = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__: Tuple[str, ...] = tuple(_LOOKUP)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LOOKUP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .ansi import *
+    from .dates import *
+    from .embed import *
+    from .exceptions import *
+    from .guard import *
+    from .helpers import *
+    from .hierarchy import *
+    from .interning import *
+    from .lazy import *
+    from .members import *
+    from .metrics import *
+    from .moderation import *
+    from .object import *
+    from .paginator import *
+    from .render import *
+    from .sanitizer import *
+    from .schema import *
+    from .store import *
+    from .template import *
+    from .timing import *
+    from .validators import *
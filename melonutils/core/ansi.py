@@ -0,0 +1,304 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+__all__: Tuple[str, ...] = (
+    "ANSI_COLORS",
+    "ANSI_FORMATS",
+    "ansi_style",
+    "AnsiBuilder",
+)
+
+# The subset of SGR codes Discord renders in ```ansi code-blocks:
+# gray, red, green, yellow, blue, pink, cyan, white, and normal, bold, underline.
+ANSI_COLORS: Tuple[int, ...] = tuple(range(8))
+ANSI_FORMATS: Tuple[int, ...] = (0, 1, 4)
+
+_Style = Tuple[int, Optional[int], Optional[int]]
+_DEFAULT: _Style = (0, None, None)
+_RESET: str = "\u001b[0m"
+
+
+def _ascii_color(color: Optional[int], fmt: int, bg: bool) -> str:
+    # the original `ascii_color` string assembly, used to fill the table
+    base = "\u001b["
+    if fmt != 0:
+        base += "{fmt};"
+    if color is None:
+        base += "{color}m"
+        color = 0
+    elif bg:
+        base += "4{color}m"
+    else:
+        base += "3{color}m"
+    return base.format(fmt=fmt, color=color)
+
+
+_ASCII_TABLE: Dict[Tuple[Optional[int], int, bool], str] = {
+    (color, fmt, bg): _ascii_color(color, fmt, bg)
+    for color in (None, *ANSI_COLORS)
+    for fmt in ANSI_FORMATS
+    for bg in (False, True)
+}
+
+
+def _sgr(style: _Style, reset: bool) -> str:
+    fmt, fg, bg = style
+    codes = ["0"] if reset or not fmt else []
+    if fmt:
+        codes.append(str(fmt))
+    if fg is not None:
+        codes.append(str(30 + fg))
+    if bg is not None:
+        codes.append(str(40 + bg))
+    return "\u001b[" + ";".join(codes) + "m"
+
+
+# (from the default style, from any other style) for every style
+_STYLE_TABLE: Dict[_Style, Tuple[str, str]] = {
+    (fmt, fg, bg): (_sgr((fmt, fg, bg), False), _sgr((fmt, fg, bg), True))
+    for fmt in ANSI_FORMATS
+    for fg in (None, *ANSI_COLORS)
+    for bg in (None, *ANSI_COLORS)
+}
+
+
+def _transition(previous: _Style, style: _Style) -> str:
+    if style == previous:
+        return ""
+    if style == _DEFAULT:
+        return _RESET
+    # switching between two styles resets first, so attributes of the
+    # previous style never leak into the next one
+    return _STYLE_TABLE[style][previous != _DEFAULT]
+
+
+def ansi_style(color: Optional[int] = None, *, bg: Optional[int] = None, fmt: int = 0) -> str:
+    """
+    Returns the escape string selecting a complete style, from a
+    precomputed table.
+
+    Parameters
+    ----------
+    color: Optional[int]
+        The text color number, from 0 to 7.
+    bg: Optional[int]
+        The background color number, from 0 to 7.
+    fmt: int
+        The format number, 0, 1 (bold) or 4 (underline).
+    """
+    try:
+        return _STYLE_TABLE[fmt, color, bg][0]
+    except KeyError:
+        raise ValueError("Invalid ANSI style {!r}.".format((color, bg, fmt))) from None
+
+
+class AnsiBuilder:
+    """
+    Builds colored text for Discord ``ansi`` code-blocks.
+
+    Segments are appended to a single buffer; consecutive segments with
+    the same style are merged, so escape codes are only written where
+    the style actually changes.
+
+    .. code-block:: python3
+
+        >>> builder = AnsiBuilder()
+        >>> builder.write("- removed\\n", color=1).write("+ added\\n", color=2)
+        >>> await ctx.send(builder.codeblock())
+
+    Backticks are escaped with a zero width character the same way
+    :func:`codeblock_wrapper` does.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "_segments",
+        "_length",
+    )
+
+    def __init__(self) -> None:
+        self._segments: List[List] = []
+        self._length: int = 0
+
+    def write(
+        self,
+        text: str,
+        /,
+        *,
+        color: Optional[int] = None,
+        bg: Optional[int] = None,
+        fmt: int = 0
+    ) -> "AnsiBuilder":
+        """
+        Appends a styled segment.
+
+        Parameters
+        ----------
+        text: str
+            The text to append.
+        color: Optional[int]
+            The text color number, from 0 to 7.
+        bg: Optional[int]
+            The background color number, from 0 to 7.
+        fmt: int
+            The format number, 0, 1 (bold) or 4 (underline).
+
+        Returns
+        -------
+        AnsiBuilder
+            The builder itself, for chaining.
+        """
+        style = (fmt, color, bg)
+        if style not in _STYLE_TABLE:
+            raise ValueError("Invalid ANSI style {!r}.".format((color, bg, fmt)))
+        if not text:
+            return self
+        text = text.replace("`", "\u200b`")
+        self._length += len(text)
+        if self._segments and self._segments[-1][0] == style:
+            self._segments[-1][1].append(text)
+        else:
+            self._segments.append([style, [text]])
+        return self
+
+    def writeline(
+        self,
+        text: str = "",
+        /,
+        *,
+        color: Optional[int] = None,
+        bg: Optional[int] = None,
+        fmt: int = 0
+    ) -> "AnsiBuilder":
+        """
+        Same as :meth:`write`, followed by a line break.
+        """
+        return self.write(text + "\n", color=color, bg=bg, fmt=fmt)
+
+    def getvalue(self) -> str:
+        """
+        Returns the text with its escape codes, ending in the default style.
+        """
+        parts: List[str] = []
+        previous = _DEFAULT
+        for style, texts in self._segments:
+            parts.append(_transition(previous, style))
+            parts.extend(texts)
+            previous = style
+        parts.append(_transition(previous, _DEFAULT))
+        return "".join(parts)
+
+    def codeblock(self) -> str:
+        """
+        Returns the text wrapped in an ``ansi`` code-block.
+        """
+        return "```ansi\n" + self.getvalue() + "\n```"
+
+    def codeblocks(self, *, limit: int = 2000) -> Iterator[str]:
+        """
+        Splits the text into as many ``ansi`` code-blocks as needed to
+        stay under a length limit, breaking between lines where possible.
+
+        Each block starts from the default style and ends with a reset,
+        the style active at the split is written again at the top of the
+        next block.
+
+        Parameters
+        ----------
+        limit: int
+            The maximum length of each code-block, fences included.
+
+        Yields
+        ------
+        str
+            The wrapped chunks.
+        """
+        opening, closing = "```ansi\n", "\n```"
+        budget = limit - len(opening) - len(closing)
+        # a cut segment needs room for its escape code, one character
+        # and the reset closing the block
+        if budget < len(_STYLE_TABLE[4, 7, 7][1]) + 2 + len(_RESET):
+            raise ValueError("limit is too small to fit a code-block.")
+
+        for lines in self._chunks(budget):
+            yield opening + lines + closing
+
+    def _lines(self) -> Iterator[List[Tuple[_Style, str]]]:
+        line: List[Tuple[_Style, str]] = []
+        for style, texts in self._segments:
+            pieces = "".join(texts).split("\n")
+            for piece in pieces[:-1]:
+                if piece:
+                    line.append((style, piece))
+                yield line
+                line = []
+            if pieces[-1]:
+                line.append((style, pieces[-1]))
+        if line:
+            yield line
+
+    def _chunks(self, budget: int) -> Iterator[str]:
+        chunk: List[str] = []
+        size = 0
+        previous = _DEFAULT
+        # every chunk may need a reset at its end
+        budget -= len(_RESET)
+
+        for line in self._lines():
+            rendered: List[str] = []
+            length = 0
+            style = previous
+            for segment_style, text in line:
+                code = _transition(style, segment_style)
+                rendered.append(code + text)
+                length += len(code) + len(text)
+                style = segment_style
+
+            needed = length + (1 if chunk else 0)
+            if size + needed <= budget:
+                if chunk:
+                    chunk.append("\n")
+                chunk.extend(rendered)
+                size += needed
+                previous = style
+                continue
+
+            if chunk:
+                yield "".join(chunk) + _transition(previous, _DEFAULT)
+                chunk, size, previous = [], 0, _DEFAULT
+
+            # the line is rendered again from the default style, cutting
+            # it wherever the budget runs out
+            for segment_style, text in line:
+                start = 0
+                while start < len(text):
+                    code = _transition(previous, segment_style)
+                    room = budget - size - len(code)
+                    if room <= 0:
+                        yield "".join(chunk) + _transition(previous, _DEFAULT)
+                        chunk, size, previous = [], 0, _DEFAULT
+                        continue
+                    end = min(len(text), start + room)
+                    if end < len(text) and text[end - 1] == "\u200b" and end - 1 > start:
+                        end -= 1
+                    chunk.append(code + text[start:end])
+                    size += len(code) + end - start
+                    previous = segment_style
+                    start = end
+
+        if chunk:
+            yield "".join(chunk) + _transition(previous, _DEFAULT)
+
+    def clear(self) -> None:
+        self._segments.clear()
+        self._length = 0
+
+    def __len__(self) -> int:
+        """
+        The length of the text, without escape codes.
+        """
+        return self._length
+
+    def __str__(self) -> str:
+        return self.getvalue()
+
+    def __repr__(self) -> str:
+        return "AnsiBuilder(segments={},length={})".format(len(self._segments), self._length)
@@ -0,0 +1,207 @@
+import re
+from collections import OrderedDict
+from datetime import datetime
+from typing import FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+__all__: Tuple[str, ...] = (
+    "DATE_FORMAT",
+    "TIMESTAMP_STYLES",
+    "DateCacheInfo",
+    "DateFormatter",
+    "default_date_formatter",
+    "format_dates",
+    "discord_timestamp",
+    "discord_timestamps",
+)
+
+DATE_FORMAT: str = "%b %d, %Y %H:%M %Z"
+DATE_CACHE_SIZE: int = 4096
+
+# t: 16:20, T: 16:20:30, d: 20/04/2021, D: 20 April 2021,
+# f: 20 April 2021 16:20, F: Tuesday, 20 April 2021 16:20, R: 2 months ago
+TIMESTAMP_STYLES: FrozenSet[str] = frozenset("tTdDfFR")
+
+# directives whose output changes within a minute, or that read the whole timestamp
+_SUB_MINUTE = re.compile(r"%[-#_^0-9EO]*[SfscrTX]")
+
+_Key = Tuple[int, int, int, Optional[object], int]
+
+
+class DateCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class DateFormatter:
+    """
+    A ``strftime`` format with its output cached per minute.
+
+    Dates falling in the same minute, time zone and DST fold share one
+    cached string, so formatting a page of log entries only calls
+    ``strftime`` once per distinct minute.
+
+    Parameters
+    ----------
+    fmt: str
+        The ``strftime`` format, it must not print anything finer than
+        minutes.
+    maxsize: int
+        The maximum number of cached minutes, the oldest are dropped
+        first. Dates spread over more minutes than that gain nothing
+        and cost a little more than ``strftime`` each.
+
+    Raises
+    ------
+    ValueError
+        The format prints seconds or sub-second values, or ``maxsize``
+        is not positive.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "fmt",
+        "maxsize",
+        "_entries",
+        "_hits",
+        "_misses",
+    )
+
+    def __init__(self, fmt: str = DATE_FORMAT, *, maxsize: int = DATE_CACHE_SIZE) -> None:
+        if _SUB_MINUTE.search(fmt.replace("%%", "")):
+            raise ValueError("The format must not contain directives finer than minutes.")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        self.fmt: str = fmt
+        self.maxsize: int = maxsize
+        self._entries: "OrderedDict[_Key, str]" = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def _render(self, key: _Key, date: datetime) -> str:
+        # the format prints nothing finer than the key, so the date
+        # itself renders the same string as the start of its minute
+        entries = self._entries
+        text = entries[key] = date.strftime(self.fmt)
+        self._misses += 1
+        if len(entries) > self.maxsize:
+            # the oldest minute, dates mostly come in time order
+            entries.popitem(last=False)
+        return text
+
+    def format(self, date: datetime) -> str:
+        """
+        Returns ``date.strftime(fmt)``, from the cache when possible.
+        """
+        key = (date.toordinal(), date.hour, date.minute, date.tzinfo, date.fold)
+        text = self._entries.get(key)
+        if text is None:
+            return self._render(key, date)
+        self._hits += 1
+        return text
+
+    __call__ = format
+
+    def format_many(self, dates: Iterable[datetime]) -> List[str]:
+        """
+        Formats many dates at once, see :meth:`format`.
+
+        Runs of dates in the same minute, as in sorted logs, skip the
+        cache lookup entirely.
+        """
+        entries = self._entries
+        render = self._render
+        hits = 0
+        result: List[str] = []
+        append = result.append
+        last_key: Optional[_Key] = None
+        text = ""
+        for date in dates:
+            key = (date.toordinal(), date.hour, date.minute, date.tzinfo, date.fold)
+            if key != last_key:
+                text = entries.get(key)
+                if text is None:
+                    text = render(key, date)
+                else:
+                    hits += 1
+                last_key = key
+            append(text)
+        self._hits += hits
+        return result
+
+    def cache_info(self) -> DateCacheInfo:
+        """
+        Returns the hit/miss statistics of the cache, like
+        ``functools.lru_cache`` does.
+        """
+        return DateCacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """
+        Empties the cache and resets its statistics.
+        """
+        self._entries.clear()
+        self._hits = self._misses = 0
+
+    def __repr__(self) -> str:
+        return "DateFormatter(fmt={!r})".format(self.fmt)
+
+
+default_date_formatter: DateFormatter = DateFormatter()
+
+
+def format_dates(dates: Iterable[datetime], *, fmt: Optional[str] = None) -> List[str]:
+    """
+    Formats many dates the same way :func:`format_date` does.
+
+    Parameters
+    ----------
+    dates: Iterable[datetime.datetime]
+        The dates to format.
+    fmt: Optional[str]
+        A different ``strftime`` format to use, uncached.
+
+    Returns
+    -------
+    List[str]
+        The formatted dates, in the same order.
+    """
+    if fmt is not None and fmt != DATE_FORMAT:
+        return [date.strftime(fmt) for date in dates]
+    return default_date_formatter.format_many(dates)
+
+
+def discord_timestamp(date: datetime, style: Optional[str] = None) -> str:
+    """
+    Returns the ``<t:epoch:style>`` markup Discord renders in the
+    reader's own time zone and locale, no ``strftime`` needed.
+
+    Naive dates are treated as local time, like ``datetime.timestamp``.
+
+    Parameters
+    ----------
+    date: datetime.datetime
+        The date to show.
+    style: Optional[str]
+        One of :data:`TIMESTAMP_STYLES`, Discord defaults to ``f``.
+
+    Returns
+    -------
+    str
+        The timestamp markup.
+    """
+    if style is None:
+        return "<t:%d>" % date.timestamp()
+    if style not in TIMESTAMP_STYLES:
+        raise ValueError("Invalid timestamp style {!r}.".format(style))
+    return "<t:%d:%s>" % (date.timestamp(), style)
+
+
+def discord_timestamps(dates: Iterable[datetime], style: Optional[str] = None) -> List[str]:
+    """
+    Formats many dates at once, see :func:`discord_timestamp`.
+    """
+    if style is not None and style not in TIMESTAMP_STYLES:
+        raise ValueError("Invalid timestamp style {!r}.".format(style))
+    suffix = ">" if style is None else ":" + style + ">"
+    return ["<t:%d%s" % (date.timestamp(), suffix) for date in dates]
@@ -1,20 +1,49 @@
-from concurrent.futures import process
-from re import L
-from tkinter import Image
-from typing import List, Dict, Union, Optional
+import json
+from hashlib import blake2b
+from datetime import datetime
+from typing import List, Dict, Union, Optional, Iterable, Tuple, Any, NoReturn
 
 from discord import Embed as DPYEMBED
 from discord import Member, User, ClientUser, Color
 
 from .object import *
-from .exceptions import *
+from .schema import _HEAD, MAX_TOTAL_LENGTH, validate_embed
+from .validators import validate_url
+
+__all__: Tuple[str, ...] = (
+    "ANY_USER",
+    "Embed",
+    "embeds_to_json",
+)
 
 ANY_USER = Union[User, Member, ClientUser]
 
+
+def _named_color(name: str) -> Color:
+    # one of the `Color` classmethods taking no arguments, e.g. "blurple"
+    factory = getattr(Color, name, None) if not name.startswith("_") else None
+    try:
+        color = factory()
+    except TypeError:
+        color = None
+    if not isinstance(color, Color):
+        raise ValueError("Invalid color key is passed.")
+    return color
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_PART_KEYS: Tuple[bytes, ...] = (
+    b'"author":',
+    b'"footer":',
+    b'"thumbnail":',
+    b'"image":',
+    b'"provider":',
+    b'"fields":',
+)
+
 class Embed(DPYEMBED):
     def __init__(
         self,
-        embed_type: Optional[EmbedType] = EmbedType.Rich,
+        embed_type: Optional[EmbedType] = EmbedType.RICH,
         title: Optional[str] = None,
         url: Optional[str] = None,
         description: Optional[str] = "",
@@ -27,28 +56,317 @@ class Embed(DPYEMBED):
         provider: Optional[Union[ProviderObject, Dict[str, Any]]] = None,
         fields: Optional[Union[Fields, List[Field]]] = None
     ):
-        self._type: EmbedType = embed_type if embed_type in EmbedType else EmbedType.from_valye(embed_type)
-        self._title: str = process_title(title)
+        self._encoded: Optional[Tuple[Tuple[bytes, ...], bytes]] = None
+        self._fingerprint: Optional[Tuple[bytes, int]] = None
+        self._type: EmbedType = EmbedType.from_value(embed_type)
+        _HEAD.check({"title": title, "description": description})
+        self._title: str = title
         self._url: str = url if validate_url(url) else None
-        self._description: str = process_desc(description)
+        self._description: str = description if description is not None else ""
         
         if isinstance(color, Color):
             self._color = color
         elif isinstance(color, str):
-            color = getattr(Color, color, None)
-            if isinstance(color, classmethod):
-                self._color = color()
-            else:
-                self._color = Color.blurple()
-                raise ValueError("Invalid color key is passed.")
+            self._color = _named_color(color)
+        else:
+            self._color = None
             
         self._timestamp: datetime = timestamp if type(timestamp) == datetime else None
-        self._author: AuthorObject = author if isinstance(author, AuthorObject) else AuthorObject.fromDict(author)
-        self._footer: FooterObject = footer if isinstance(footer, FooterObject) else FooterObject.fromDict(footer)
-        self._thumbnail: ImageObject = thumbnail if isinstance(thumbnail, ImageObject) else ImageObject.fromDict(thumbnail)
-        self._image: ImageObject = image if isinstance(image, ImageObject) else ImageObject.fromDict(image)
-        self._provider: ProviderObject = provider if isinstance(provider, ProviderObject) else ProviderObject.fromDict(provider)
-        self._fields: Fields = Fields.fromDict(fields)
+        self._author: AuthorObject = author if author is None or isinstance(author, AuthorObject) else AuthorObject.fromDict(author)
+        self._footer: FooterObject = footer if footer is None or isinstance(footer, FooterObject) else FooterObject.fromDict(footer)
+        self._thumbnail: ImageObject = thumbnail if thumbnail is None or isinstance(thumbnail, ImageObject) else ImageObject.fromDict(thumbnail)
+        self._image: ImageObject = image if image is None or isinstance(image, ImageObject) else ImageObject.fromDict(image)
+        self._provider: ProviderObject = provider if provider is None or isinstance(provider, ProviderObject) else ProviderObject.fromDict(provider)
+        self._fields: Fields = Fields.fromDict(fields) if fields is not None else None
+        self._text_length: int = len(self._title or "") + len(self._description or "")
+
+    @classmethod
+    def fromDict(cls, data: Dict[str, Any]) -> "Embed":
+        """
+        Builds an embed from its json payload form, e.g. the result of :meth:`toDict`.
+
+        The whole payload is checked by :data:`validate_embed` in one pass,
+        then built the same way as :meth:`fromTrusted`.
+
+        Raises
+        ------
+        SchemaError
+            Every violation found in the payload.
+        """
+        if not isinstance(data, dict):
+            raise TypeError("Expected Dict[str, Any], caught {}".format(data.__class__))
+        color = data.get("color")
+        if isinstance(color, Color):
+            data = {**data, "color": color.value}
+        validate_embed.check(data)
+        return cls.fromTrusted(data)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Embed":
+        return cls.fromDict(data)
+
+    @classmethod
+    def fromTrusted(cls, data: Dict[str, Any]) -> "Embed":
+        """
+        Builds an embed from a payload that is known to be valid, e.g. sent
+        by discord or produced by :meth:`toDict`, without validating it.
+        
+        The title, description and urls are taken as-is and every part is
+        built with ``fromTrusted``, so the result is equal to
+        ``Embed.fromDict(data)`` at a fraction of the cost. Invalid data is
+        not detected; use :meth:`fromDict` for anything user supplied.
+        """
+        embed = cls.__new__(cls)
+        embed._encoded = None
+        embed._fingerprint = None
+        embed._type = EmbedType.from_value(data.get("type") or EmbedType.RICH)
+        embed._title = data.get("title")
+        embed._url = data.get("url") or None
+        embed._description = data.get("description") or ""
+        color = data.get("color")
+        embed._color = Color(color) if isinstance(color, int) else color if isinstance(color, Color) else None
+        timestamp = data.get("timestamp")
+        embed._timestamp = datetime.fromisoformat(timestamp) if isinstance(timestamp, str) else timestamp if type(timestamp) == datetime else None
+        for attr, key, part in (
+            ("_author", "author", AuthorObject),
+            ("_footer", "footer", FooterObject),
+            ("_thumbnail", "thumbnail", ImageObject),
+            ("_image", "image", ImageObject),
+            ("_provider", "provider", ProviderObject),
+            ("_fields", "fields", Fields),
+        ):
+            value = data.get(key)
+            if value is not None and not isinstance(value, EmbedObject):
+                value = part.fromTrusted(value)
+            setattr(embed, attr, value)
+        embed._text_length = len(embed._title or "") + len(embed._description)
+        return embed
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Embed":
+        return cls.fromTrusted(data)
+
+    @property
+    def total_length(self) -> int:
+        """
+        The number of characters counted against discord`s combined embed limit.
+        
+        Title and description lengths are kept as a running total by the setters
+        and :class:`Fields` tracks its own; author name and footer text are read
+        off the current objects, so the property is O(1).
+        """
+        total = self._text_length
+        if self._fields is not None:
+            total += self._fields.text_length
+        if self._author is not None and self._author.name:
+            total += len(self._author.name)
+        if self._footer is not None and self._footer.text:
+            total += len(self._footer.text)
+        return total
+
+    def __len__(self) -> int:
+        return self.total_length
+
+    @property
+    def remaining(self) -> int:
+        """
+        The number of characters left before the combined limit is reached.
+        """
+        return MAX_TOTAL_LENGTH - self.total_length
+
+    @property
+    def payload_size(self) -> int:
+        """
+        The size in bytes of the json payload, reusing the cached encoding.
+        """
+        return len(self.toJSON())
+
+    def validate_length(self) -> None:
+        """
+        Raises if the embed exceeds discord`s combined character limit.
+        
+        Called by :meth:`to_dict`, so an oversized embed fails before it is sent.
+        """
+        total = self.total_length
+        if total > MAX_TOTAL_LENGTH:
+            raise ValueError(
+                "Embed total length must be lower than {}, got {} characters.".format(MAX_TOTAL_LENGTH, total)
+            )
+
+    def add_field(self, *, name: str, value: str, inline: bool = True) -> "Embed":
+        if self._fields is None:
+            self._fields = Fields()
+        self._fields.add(name, value, inline)
+        self._invalidate()
+        return self
+
+    def insert_field_at(self, index: int, *, name: str, value: str, inline: bool = True) -> "Embed":
+        if self._fields is None:
+            self._fields = Fields()
+        self._fields.insert(index, {"name": name, "value": value, "inline": inline})
+        self._invalidate()
+        return self
+
+    def set_field_at(self, index: int, *, name: str, value: str, inline: bool = True) -> "Embed":
+        if self._fields is None:
+            raise IndexError("field index out of range")
+        self._fields[index] = {"name": name, "value": value, "inline": inline}
+        self._invalidate()
+        return self
+
+    def remove_field(self, index: int) -> None:
+        if self._fields is not None:
+            try:
+                del self._fields[index]
+            except IndexError:
+                pass
+        self._invalidate()
+
+    def clear_fields(self) -> None:
+        self._fields = None
+        self._invalidate()
+
+    # discord.Embed`s own helpers store plain dicts and delete attributes,
+    # these build property objects and go through the setters instead
+
+    def set_author(self, *, name: Any, url: Optional[Any] = None, icon_url: Optional[Any] = None) -> "Embed":
+        self.author = AuthorObject(
+            str(name),
+            url=str(url) if url is not None else None,
+            icon_url=str(icon_url) if icon_url is not None else None,
+        )
+        return self
+
+    def remove_author(self) -> "Embed":
+        self.author = None
+        return self
+
+    def set_footer(self, *, text: Optional[Any] = None, icon_url: Optional[Any] = None) -> "Embed":
+        self.footer = FooterObject(
+            str(text) if text is not None else None,
+            icon_url=str(icon_url) if icon_url is not None else None,
+        )
+        return self
+
+    def remove_footer(self) -> "Embed":
+        self.footer = None
+        return self
+
+    def set_image(self, *, url: Optional[Any]) -> "Embed":
+        self.image = ImageObject(str(url)) if url is not None else None
+        return self
+
+    def set_thumbnail(self, *, url: Optional[Any]) -> "Embed":
+        self.thumbnail = ImageObject(str(url)) if url is not None else None
+        return self
+
+    def _invalidate(self) -> None:
+        """
+        Drops the cached json encoding, called by every property setter.
+        """
+        self._encoded = None
+
+    def _head(self) -> Dict[str, Any]:
+        result = {"type": self._type.value}
+        if self._title is not None:
+            result["title"] = self._title
+        if self._description:
+            result["description"] = self._description
+        if self._url is not None:
+            result["url"] = self._url
+        if self._timestamp is not None:
+            result["timestamp"] = self._timestamp.isoformat()
+        if self._color is not None:
+            result["color"] = self._color.value
+        return result
+
+    def _parts(self) -> Tuple[Optional[bytes], ...]:
+        return tuple(
+            value.toJSON() if value else None
+            for value in (self._author, self._footer, self._thumbnail, self._image, self._provider, self._fields)
+        )
+
+    def toJSON(self) -> bytes:
+        """
+        Returns the compact json encoding of the embed as utf-8 bytes.
+        
+        Property objects keep their own encoded form, so re-encoding an embed
+        only re-encodes the parts whose setters ran since the last call.
+        When nothing changed the previous result is returned as-is.
+        """
+        parts = self._parts()
+        if self._encoded is not None and self._encoded[0] == parts:
+            return self._encoded[1]
+        chunks = [_encoder.encode(self._head()).encode("utf-8")[:-1]]
+        for key, part in zip(_PART_KEYS, parts):
+            if part is not None:
+                chunks.append(key + part)
+        encoded = b",".join(chunks) + b"}"
+        self._encoded = (parts, encoded)
+        return encoded
+
+    @property
+    def fingerprint(self) -> int:
+        """
+        A stable 64-bit hash of the embed`s content.
+        
+        It is taken over the canonical json encoding, which :meth:`toJSON`
+        only rebuilds for the parts whose setters ran, and is itself only
+        recomputed when that encoding changed. Equal embeds have equal
+        fingerprints across processes and restarts.
+        """
+        encoded = self.toJSON()
+        cached = self._fingerprint
+        if cached is not None and cached[0] is encoded:
+            return cached[1]
+        value = int.from_bytes(blake2b(encoded, digest_size=8).digest(), "big")
+        self._fingerprint = (encoded, value)
+        return value
+
+    def toDict(self) -> Dict[str, Any]:
+        result = self._head()
+        for key, value in (
+            ("author", self._author),
+            ("footer", self._footer),
+            ("thumbnail", self._thumbnail),
+            ("image", self._image),
+            ("provider", self._provider),
+        ):
+            if value is not None:
+                result[key] = value.toDict()
+        if self._fields:
+            result["fields"] = self._fields.toDict()
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        self.validate_length()
+        return self.toDict()
+
+    # discord.Embed`s own dunders read its private attributes, which hold
+    # property objects here, so they are answered from this class` state
+
+    def __bool__(self) -> bool:
+        return any((
+            self._title,
+            self._url,
+            self._description,
+            self._color,
+            self._fields,
+            self._timestamp,
+            self._author,
+            self._thumbnail,
+            self._footer,
+            self._image,
+            self._provider,
+        ))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Embed):
+            return NotImplemented
+        # the canonical encoding covers every part, and is cached on both sides
+        return self.toJSON() == other.toJSON()
+
+    __hash__ = None # type: ignore
         
     @property
     def title(self) -> str:
@@ -56,7 +374,10 @@ class Embed(DPYEMBED):
     
     @title.setter
     def title(self, value: str) -> NoReturn:
-        self._title = process_title(value)
+        self._invalidate()
+        title = process_title(value)
+        self._text_length += len(title) - len(self._title or "")
+        self._title = title
         
     @property
     def type(self) -> EmbedType:
@@ -64,6 +385,7 @@ class Embed(DPYEMBED):
 
     @type.setter
     def type(self, value: str) -> NoReturn:
+        self._invalidate()
         self._type = EmbedType.from_value(value)
 
     @property
@@ -72,7 +394,9 @@ class Embed(DPYEMBED):
 
     @description.setter
     def description(self, value: str) -> NoReturn:
+        self._invalidate()
         if check_desc(value):
+            self._text_length += len(value) - len(self._description or "")
             self._description = value
 
     @property
@@ -80,27 +404,45 @@ class Embed(DPYEMBED):
         return self._color
 
     @color.setter
-    def color(self, value: Color) -> NoReturn:
-        if isinstance(value, Color):
+    def color(self, value: Optional[Union[Color, int, str]]) -> NoReturn:
+        self._invalidate()
+        if value is None or isinstance(value, Color):
             self._color = value
+        elif isinstance(value, str):
+            self._color = _named_color(value)
         else:
-            self._color = process_color(value) # type: ignore
+            _HEAD.check({"color": value})
+            self._color = Color(value)
+
+    @property
+    def colour(self) -> Color:
+        return self._color
+
+    @colour.setter
+    def colour(self, value: Color) -> NoReturn:
+        self.color = value
+
+    @property
+    def provider(self) -> ProviderObject:
+        return self._provider
 
     @property
     def author(self) -> AuthorObject:
         return self._author
 
     @author.setter
-    def author(self, value: AuthorObject) -> NoReturn:
-        self._author = AuthorObject.fromDict(value)
+    def author(self, value: Optional[Union[AuthorObject, Dict[str, str]]]) -> NoReturn:
+        self._invalidate()
+        self._author = value if value is None or isinstance(value, AuthorObject) else AuthorObject.fromDict(value)
 
     @property
     def footer(self) -> Dict[str, str]:
         return self._footer
 
     @footer.setter
-    def footer(self, value: Dict[str, str]) -> NoReturn:
-        self._footer = FooterObject.fromDict(value)
+    def footer(self, value: Optional[Union[FooterObject, Dict[str, str]]]) -> NoReturn:
+        self._invalidate()
+        self._footer = value if value is None or isinstance(value, FooterObject) else FooterObject.fromDict(value)
 
     @property
     def timestamp(self) -> datetime:
@@ -108,6 +450,7 @@ class Embed(DPYEMBED):
 
     @timestamp.setter
     def timestamp(self, value) -> NoReturn:
+        self._invalidate()
         if isinstance(value, datetime):
             self._timestamp = value
         else:
@@ -119,6 +462,7 @@ class Embed(DPYEMBED):
 
     @url.setter
     def url(self, value) -> NoReturn:
+        self._invalidate()
         if validate_url(value):
             self._url = value
 
@@ -128,6 +472,10 @@ class Embed(DPYEMBED):
 
     @thumbnail.setter
     def thumbnail(self, value: Union[ImageObject, str]) -> NoReturn:
+        self._invalidate()
+        if value is None or isinstance(value, ImageObject):
+            self._thumbnail = value
+            return
         try:
             self._thumbnail = ImageObject.fromDict(value)
         except:
@@ -142,6 +490,10 @@ class Embed(DPYEMBED):
 
     @image.setter
     def image(self, value: Union[ImageObject, str]) -> NoReturn:
+        self._invalidate()
+        if value is None or isinstance(value, ImageObject):
+            self._image = value
+            return
         try:
             self._image = ImageObject.fromDict(value)
         except:
@@ -151,12 +503,23 @@ class Embed(DPYEMBED):
                 raise
 
     @property
-    def fields(self) -> List[Field]:
+    def fields(self) -> Fields:
         return self._fields
 
     @fields.setter
-    def fields(self, value: List[Field]) -> NoReturn:
-        self._fields = Fields.fromDict(value)
+    def fields(self, value: Union[Fields, List[Field]]) -> NoReturn:
+        self._invalidate()
+        self._fields = Fields.fromDict(value) if value is not None else None
 
-        if check_fields(value):  # type: ignore
-            self._fields.extend(value)
\ No newline at end of file
+
+def embeds_to_json(embeds: Iterable[Embed]) -> bytes:
+    """
+    Encodes embeds into a single json array as utf-8 bytes.
+    
+    Each embed reuses its cached encoding, so sending the same embeds
+    repeatedly only pays for joining the already encoded parts.
+    
+    :param embeds: The embeds to encode.
+    :return: The json array, e.g. the ``embeds`` value of a message payload.
+    """
+    return b"[" + b",".join(embed.toJSON() for embed in embeds) + b"]"
@@ -1,17 +1,99 @@
 import json
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, ClassVar, Type, TypeVar
 
 import discord
 from redbot.core import commands # type: ignore
 
+__all__: Tuple[str, ...] = (
+    "RedBotException",
+    "RedBotCommandError",
+    "HierarchyException",
+    "ActionNotExecutable",
+    "EmbedGenException",
+    "UnexpectedKwargsError",
+    "InvalidColorError",
+    "InvalidFieldError",
+    "count_error",
+    "error_counts",
+    "reset_error_counts",
+)
+
+_E = TypeVar("_E", bound=BaseException)
+
+_error_counts: Dict[Type[BaseException], int] = {}
+
+def count_error(error: _E) -> _E:
+    """
+    Counts an exception for :func:`error_counts` and returns it.
+    
+    melonutils counts the exceptions it raises, or reports in results,
+    itself. Call this where your own code raises or handles one, e.g.
+    ``raise count_error(InvalidFieldError(field))`` or in a cog's error
+    handler.
+    """
+    cls = error.__class__
+    _error_counts[cls] = _error_counts.get(cls, 0) + 1
+    return error
+
+def error_counts(*, by_code: bool = False) -> Dict[str, int]:
+    """
+    Returns how many times each melonutils exception was raised.
+    
+    Exceptions are counted where they are raised or handled, see
+    :func:`count_error`, so ones built and thrown away are not.
+    
+    Parameters
+    ----------
+    by_code: bool
+        Whether to key the counts by error code instead of class name.
+    
+    Returns
+    -------
+    Dict[str, int]
+        The counts, by class name or error code.
+    """
+    counts: Dict[str, int] = {}
+    for cls, count in list(_error_counts.items()):
+        key = getattr(cls, "code", cls.__name__) if by_code else cls.__name__
+        counts[key] = counts.get(key, 0) + count
+    return counts
+
+def reset_error_counts() -> None:
+    """
+    Resets every exception counter.
+    """
+    _error_counts.clear()
+
+_ARGS = BaseException.args
+
+def _clean_mentions(message: str) -> str:
+    # what `commands.CommandError.__init__` does eagerly
+    return message.replace('@everyone', '@\u200beveryone').replace('@here', '@\u200bhere')
+
 class RedBotException(discord.ClientException):
     """
     The base exception for the bot. 
     
     All other exceptions should inherit from this.
+    
+    Subclasses keep the raw values they are given in ``args`` and only
+    build their message in :meth:`_render`, when the exception is turned
+    into a string. Each class has a stable ``code`` for matching and
+    counting errors without parsing messages.
     """
     
     __slots__: Tuple[str, ...] = ()
+    
+    code: ClassVar[str] = "redbot"
+    
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+    
+    def _render(self) -> str:
+        return super().__str__()
+    
+    def __str__(self) -> str:
+        return self._render()
 
 class RedBotCommandError(commands.CommandError, RedBotException):
     """
@@ -20,6 +102,34 @@ class RedBotCommandError(commands.CommandError, RedBotException):
     
     __slots__: Tuple[str, ...] = ()
     
+    code: ClassVar[str] = "redbot.command"
+    
+    def __init__(self, *args: Any) -> None:
+        # `commands.CommandError` cleans mentions out of the message up front,
+        # this is deferred to `__str__` and `args` together with the message itself
+        RedBotException.__init__(self, *args)
+    
+    def __str__(self) -> str:
+        return _clean_mentions(self._render())
+    
+    @property
+    def args(self) -> Tuple[Any, ...]:
+        # what `commands.CommandError` keeps, the cleaned message first;
+        # the raw values stay in the exception itself, e.g. for pickling
+        args = _ARGS.__get__(self)
+        if type(self)._render is RedBotException._render:
+            if args and isinstance(args[0], str):
+                return (_clean_mentions(args[0]),) + args[1:]
+            return args
+        return (str(self),)
+    
+    @args.setter
+    def args(self, value: Tuple[Any, ...]) -> None:
+        _ARGS.__set__(self, value)
+    
+    def __repr__(self) -> str:
+        return "{}({})".format(self.__class__.__name__, ", ".join(map(repr, self.args)))
+    
 class HierarchyException(RedBotCommandError):
     """
     Raised when the bot is requested to perform an operation on a member
@@ -31,6 +141,8 @@ class HierarchyException(RedBotCommandError):
         "author_error"
     )
     
+    code: ClassVar[str] = "redbot.command.hierarchy"
+    
     def __init__(
         self,
         member: discord.Member,
@@ -39,28 +151,39 @@ class HierarchyException(RedBotCommandError):
     ) -> None:
         self.member: discord.Member = member
         self.author_error: bool = author_error
+        super().__init__(member)
+    
+    def _render(self) -> str:
+        if self.author_error is False:
+            return f"**{self.member}**\'s top role is higher than mine. I can\'t do that!"
         
-        if author_error is False:
-            super().__init__(
-                f"**{member}**\'s top role is higher than mine. I can\'t do that!"
-            )
-        
-        else:
-            super().__init__(
-                f"**{member}**\'s top role is higher than your top role. You can\'t do that!"
-            )
+        return f"**{self.member}**\'s top role is higher than your top role. You can\'t do that!"
     
 class ActionNotExecutable(RedBotCommandError):
     """
     The exception for when an action is not executable.
     """
     
+    __slots__: Tuple[str, ...] = (
+        "message",
+    )
+    
+    code: ClassVar[str] = "redbot.command.not_executable"
+    
     def __init__(self, message):
-        super().__init__("{}".format(message))
+        self.message = message
+        super().__init__(message)
+    
+    def _render(self) -> str:
+        return "{}".format(self.message)
         
 class EmbedGenException(Exception):
+    code: ClassVar[str] = "embedgen"
+    
     @property
     def msg(self) -> str:
+        if self._msg is None:
+            self._msg = self._render()
         return self._msg
     
     def __init__(
@@ -71,6 +194,9 @@ class EmbedGenException(Exception):
     ):
         self._msg = msg
         super().__init__(*args)
+    
+    def _render(self) -> str:
+        return "An exception was occured during EmbedGen operations."
         
     def __str__(self) -> str:
         return self.msg
@@ -79,6 +205,8 @@ class EmbedGenException(Exception):
         return self.__str__()
     
 class UnexpectedKwargsError(EmbedGenException):
+    code: ClassVar[str] = "embedgen.unexpected_kwargs"
+    
     def __init__(
         self,
         unexpected_kwargs: Dict[str, Any],
@@ -90,13 +218,18 @@ class UnexpectedKwargsError(EmbedGenException):
         
         self.kwargs = unexpected_kwargs
         
-        msg = (
+        # the json dump is only built once the message is read
+        super().__init__(*args, msg=None, **kwargs)
+    
+    def _render(self) -> str:
+        return (
             "`EmbedGen.__init__()` caught unexpected keyword arguments! : "
             f"{json.dumps(obj=self.kwargs, indent=4, ensure_ascii=False)}"
         )
-        super().__init__(*args, msg=msg, **kwargs)
         
 class InvalidColorError(EmbedGenException):
+    code: ClassVar[str] = "embedgen.invalid_color"
+    
     def __init__(
         self,
         invalid_color,
@@ -115,6 +248,8 @@ class InvalidColorError(EmbedGenException):
         )
         
 class InvalidFieldError(EmbedGenException):
+    code: ClassVar[str] = "embedgen.invalid_field"
+    
     def __init__(
         self,
         invalid_field,
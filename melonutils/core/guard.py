@@ -0,0 +1,182 @@
+import json
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Hashable, NamedTuple, Optional, Sequence, Tuple
+
+import discord
+from discord.utils import MISSING
+
+from .embed import Embed
+
+__all__: Tuple[str, ...] = (
+    "EditGuardStats",
+    "EditGuard",
+    "embed_fingerprint",
+)
+
+
+def embed_fingerprint(embed: discord.Embed) -> int:
+    """
+    Returns a stable 64-bit hash of an embed`s content.
+
+    Uses :attr:`Embed.fingerprint` for melonutils embeds, plain
+    ``discord.Embed`` objects are hashed over their sorted json form.
+    """
+    if isinstance(embed, Embed):
+        return embed.fingerprint
+    encoded = json.dumps(embed.to_dict(), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return int.from_bytes(blake2b(encoded.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class EditGuardStats(NamedTuple):
+    edits: int
+    suppressed: int
+    size: int
+    maxsize: int
+
+    @property
+    def suppressed_rate(self) -> float:
+        total = self.edits + self.suppressed
+        return self.suppressed / total if total else 0.0
+
+
+class EditGuard:
+    """
+    Skips message edits that would not change anything.
+
+    The guard remembers the fingerprint of the content and embeds last
+    sent to each message id, and :meth:`edit` only calls the API when
+    the new fingerprint differs. Meant for status and leaderboard
+    messages that are refreshed on a timer.
+
+    .. code-block:: python3
+
+        >>> guard = EditGuard()
+        >>> @tasks.loop(seconds=30)
+        >>> async def refresh():
+        >>>     await guard.edit(status_message, embed=build_status())
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of messages remembered, the least recently
+        edited ones are forgotten first.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "maxsize",
+        "_sent",
+        "_edits",
+        "_suppressed",
+    )
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize: int = maxsize
+        self._sent: "OrderedDict[int, Hashable]" = OrderedDict()
+        self._edits: int = 0
+        self._suppressed: int = 0
+
+    @staticmethod
+    def fingerprint(
+        content: Optional[str] = MISSING,
+        embed: Optional[discord.Embed] = MISSING,
+        embeds: Sequence[discord.Embed] = MISSING
+    ) -> Hashable:
+        """
+        Returns the value compared between edits, unset arguments are
+        told apart from ``None``.
+        """
+        if embed is not MISSING:
+            embeds = [] if embed is None else [embed]
+        return (
+            content is MISSING,
+            content,
+            None if embeds is MISSING else tuple([embed_fingerprint(item) for item in embeds]),
+        )
+
+    def is_changed(self, message_id: int, fingerprint: Hashable) -> bool:
+        """
+        Whether ``fingerprint`` differs from the last one sent to the message.
+        """
+        return self._sent.get(message_id) != fingerprint
+
+    def record(self, message_id: int, fingerprint: Hashable) -> None:
+        """
+        Remembers a fingerprint as sent, e.g. after a message was created.
+        """
+        self._sent[message_id] = fingerprint
+        self._sent.move_to_end(message_id)
+        if len(self._sent) > self.maxsize:
+            self._sent.popitem(last=False)
+
+    async def edit(
+        self,
+        message: discord.Message,
+        *,
+        content: Optional[str] = MISSING,
+        embed: Optional[discord.Embed] = MISSING,
+        embeds: Sequence[discord.Embed] = MISSING,
+        **kwargs: Any
+    ) -> bool:
+        """
+        |coro|
+
+        Edits the message unless its content and embeds are unchanged.
+
+        Other keyword arguments (views, attachments, ...) are passed to
+        :meth:`discord.Message.edit` but not compared, an edit that
+        sets any of them is never skipped.
+
+        Returns
+        -------
+        bool
+            Whether the message was edited.
+        """
+        fingerprint = self.fingerprint(content, embed, embeds)
+        if not kwargs and not self.is_changed(message.id, fingerprint):
+            self._suppressed += 1
+            self._sent.move_to_end(message.id)
+            return False
+
+        if embed is not MISSING:
+            kwargs["embed"] = embed
+        if embeds is not MISSING:
+            kwargs["embeds"] = embeds
+        if content is not MISSING:
+            kwargs["content"] = content
+
+        try:
+            await message.edit(**kwargs)
+        except BaseException:
+            # the message may or may not have changed, don't skip the retry
+            self.forget(message.id)
+            raise
+        self._edits += 1
+        self.record(message.id, fingerprint)
+        return True
+
+    def forget(self, message_id: int) -> None:
+        """
+        Drops what was sent to a message, e.g. once it was deleted.
+        """
+        self._sent.pop(message_id, None)
+
+    def stats(self) -> EditGuardStats:
+        return EditGuardStats(self._edits, self._suppressed, len(self._sent), self.maxsize)
+
+    def clear(self) -> None:
+        """
+        Forgets every message and resets the statistics.
+        """
+        self._sent.clear()
+        self._edits = self._suppressed = 0
+
+    def __len__(self) -> int:
+        return len(self._sent)
+
+    def __repr__(self) -> str:
+        return "EditGuard(size={},maxsize={},suppressed={})".format(
+            len(self._sent), self.maxsize, self._suppressed
+        )
@@ -0,0 +1,149 @@
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple, Union
+
+import discord
+
+__all__: Tuple[str, ...] = (
+    "ActionResult",
+    "RoleIndex",
+    "default_role_index",
+)
+
+# Sort key matching `discord.Role.__lt__`: by position, then the lower id
+# is considered the higher role.
+_RoleKey = Tuple[int, int]
+
+
+def _top_key(positions: Dict[int, _RoleKey], default: _RoleKey, member: Any) -> _RoleKey:
+    # `Member.top_role` without building the role objects
+    return max([positions.get(role_id, default) for role_id in member._roles], default=default)
+
+
+class ActionResult(NamedTuple):
+    """
+    The outcome of a hierarchy check on a single target.
+
+    ``target`` is upgraded to a :class:`discord.Member` when possible and
+    ``error`` holds the exception :func:`can_execute_action` would have
+    raised, or ``None`` if the action is allowed.
+    """
+
+    target: Union[discord.Member, discord.User]
+    error: Optional[Exception]
+
+    @property
+    def allowed(self) -> bool:
+        return self.error is None
+
+    def __bool__(self) -> bool:
+        return self.error is None
+
+
+class RoleIndex:
+    """
+    Role sort keys per guild, so comparing top roles does not resolve
+    and sort role objects for every member.
+
+    While the index is registered on a bot with :meth:`listen`, role
+    create, update and delete events patch the affected guild in place.
+    Without the listeners the index cannot know about role changes, so
+    it is rebuilt on every lookup instead.
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of guilds kept.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "maxsize",
+        "_guilds",
+        "_bots",
+    )
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize: int = maxsize
+        self._guilds: Dict[int, Dict[int, _RoleKey]] = {}
+        self._bots: Set[int] = set()
+
+    @staticmethod
+    def _build(guild: discord.Guild) -> Dict[int, _RoleKey]:
+        return {role.id: (role.position, -role.id) for role in guild.roles}
+
+    def positions(self, guild: discord.Guild) -> Dict[int, _RoleKey]:
+        """
+        Returns the mapping of role ids to sort keys for a guild.
+        """
+        if not self._bots:
+            return self._build(guild)
+        positions = self._guilds.get(guild.id)
+        if positions is None:
+            if len(self._guilds) >= self.maxsize:
+                del self._guilds[next(iter(self._guilds))]
+            positions = self._guilds[guild.id] = self._build(guild)
+        return positions
+
+    def top_role_key(self, guild: discord.Guild, member: discord.Member) -> _RoleKey:
+        """
+        Returns the sort key of a member's top role, equal to
+        comparing ``member.top_role``.
+        """
+        return _top_key(self.positions(guild), (0, -guild.id), member)
+
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        positions = self._guilds.get(role.guild.id)
+        if positions is not None:
+            positions[role.id] = (role.position, -role.id)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        await self.on_guild_role_create(after)
+
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        positions = self._guilds.get(role.guild.id)
+        if positions is not None:
+            positions.pop(role.id, None)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self._guilds.pop(guild.id, None)
+
+    _LISTENERS: Tuple[str, ...] = (
+        "on_guild_role_create",
+        "on_guild_role_update",
+        "on_guild_role_delete",
+        "on_guild_remove",
+    )
+
+    def listen(self, bot: discord.Client) -> None:
+        """
+        Registers the role listeners on a bot, see the class documentation.
+        """
+        if id(bot) in self._bots:
+            return
+        for name in self._LISTENERS:
+            bot.add_listener(getattr(self, name), name)
+        self._bots.add(id(bot))
+
+    def unlisten(self, bot: discord.Client) -> None:
+        """
+        Removes the listeners registered with :meth:`listen`.
+        """
+        if id(bot) not in self._bots:
+            return
+        for name in self._LISTENERS:
+            bot.remove_listener(getattr(self, name), name)
+        self._bots.discard(id(bot))
+        if not self._bots:
+            self._guilds.clear()
+
+    def clear(self) -> None:
+        self._guilds.clear()
+
+    def __len__(self) -> int:
+        return len(self._guilds)
+
+    def __repr__(self) -> str:
+        return "RoleIndex(guilds={},listening={})".format(len(self._guilds), bool(self._bots))
+
+
+default_role_index: RoleIndex = RoleIndex()
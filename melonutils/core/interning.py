@@ -0,0 +1,149 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Tuple, Type, TypeVar
+
+__all__: Tuple[str, ...] = (
+    "InternStats",
+    "ObjectInterner",
+    "default_interner",
+)
+
+T = TypeVar("T")
+
+
+class InternStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ObjectInterner:
+    """
+    A bounded flyweight cache for embed property objects.
+
+    Equal objects are shared instead of being allocated and validated again.
+    Entries are evicted in least-recently-used order once ``maxsize`` is
+    reached, so the cache cannot grow without bounds.
+
+    Shared objects should be treated as read-only. If one is mutated anyway,
+    the next lookup notices that it no longer matches its key and replaces it.
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of objects kept alive by the cache.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "maxsize",
+        "_objects",
+        "_hits",
+        "_misses",
+        "_evictions",
+    )
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize: int = maxsize
+        self._objects: "OrderedDict[Hashable, Tuple[Any, Tuple[Any, ...]]]" = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._objects.get(key)
+        if entry is None:
+            return None
+        obj, values = entry
+        if obj._values() != values:
+            del self._objects[key]
+            return None
+        self._objects.move_to_end(key)
+        return obj
+
+    def _store(self, key: Hashable, obj: T) -> None:
+        self._objects[key] = (obj, obj._values())
+        if len(self._objects) > self.maxsize:
+            self._objects.popitem(last=False)
+            self._evictions += 1
+
+    def get(self, cls: Type[T], data: Dict[str, Any]) -> T:
+        """
+        Returns the shared object for ``data``, building it with
+        ``cls.fromDict`` on a miss.
+
+        Parameters
+        ----------
+        cls: Type[EmbedObject]
+            The property object class to build.
+        data: Dict[str, Any]
+            The raw property data.
+
+        Returns
+        -------
+        EmbedObject
+            An instance of ``cls`` equal to ``cls.fromDict(data)``.
+        """
+        if isinstance(data, cls):
+            return self.intern(data)
+        if not isinstance(data, dict):
+            return cls.fromDict(data)
+        try:
+            key = (cls, tuple([data.get(name) for name in cls.__slots__]))
+            obj = self._lookup(key)
+        except TypeError:
+            # unhashable values can't be shared
+            return cls.fromDict(data)
+        if obj is not None:
+            self._hits += 1
+            return obj
+        obj = self.intern(cls.fromDict(data))
+        if key not in self._objects:
+            # the constructor normalised some values, remember the raw form too
+            self._store(key, obj)
+        return obj
+
+    def intern(self, obj: T) -> T:
+        """
+        Returns the shared object equal to ``obj``, registering ``obj``
+        itself if there is none yet.
+        """
+        try:
+            key = (type(obj), obj._values())
+            shared = self._lookup(key)
+        except TypeError:
+            return obj
+        if shared is not None:
+            self._hits += 1
+            return shared
+        self._misses += 1
+        self._store(key, obj)
+        return obj
+
+    def stats(self) -> InternStats:
+        return InternStats(self._hits, self._misses, self._evictions, len(self._objects), self.maxsize)
+
+    def clear(self) -> None:
+        """
+        Drops every shared object and resets the statistics.
+        """
+        self._objects.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __repr__(self) -> str:
+        return "ObjectInterner(size={},maxsize={},hit_rate={:.2%})".format(
+            len(self._objects), self.maxsize, self.stats().hit_rate
+        )
+
+
+default_interner: ObjectInterner = ObjectInterner()
@@ -0,0 +1,154 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, Tuple
+
+from discord import Color
+
+from .embed import Embed
+from .object import *
+from .schema import validate_embed
+
+__all__: Tuple[str, ...] = (
+    "LazyEmbed",
+)
+
+
+def _snapshot(obj: Any) -> Tuple[Any, ...]:
+    # `Fields` keeps its columns in mutable containers, copy them
+    return tuple(
+        list(value) if isinstance(value, list) else bytes(value) if isinstance(value, bytearray) else value
+        for value in obj._values()
+    )
+
+
+def _part(cls: Any, key: str) -> Callable[["LazyEmbed"], Any]:
+    def build(embed: "LazyEmbed") -> Any:
+        data = embed._raw.get(key)
+        if data is None:
+            return None
+        obj = cls.fromTrusted(data)
+        embed._built.append((obj, _snapshot(obj)))
+        return obj
+
+    return build
+
+
+def _color(embed: "LazyEmbed") -> Any:
+    color = embed._raw.get("color")
+    return Color(color) if isinstance(color, int) else color if isinstance(color, Color) else None
+
+
+def _timestamp(embed: "LazyEmbed") -> Any:
+    timestamp = embed._raw.get("timestamp")
+    return datetime.fromisoformat(timestamp) if isinstance(timestamp, str) else timestamp if type(timestamp) == datetime else None
+
+
+# how each attribute `Embed.fromTrusted` sets is built from the payload,
+# untrusted payloads are validated as a whole up front
+_BUILDERS: Dict[str, Callable[["LazyEmbed"], Any]] = {
+    "_type": lambda embed: EmbedType.from_value(embed._raw.get("type") or EmbedType.RICH),
+    "_title": lambda embed: embed._raw.get("title"),
+    "_url": lambda embed: embed._raw.get("url") or None,
+    "_description": lambda embed: embed._raw.get("description") or "",
+    "_color": _color,
+    "_timestamp": _timestamp,
+    "_author": _part(AuthorObject, "author"),
+    "_footer": _part(FooterObject, "footer"),
+    "_thumbnail": _part(ImageObject, "thumbnail"),
+    "_image": _part(ImageObject, "image"),
+    "_provider": _part(ProviderObject, "provider"),
+    "_fields": _part(Fields, "fields"),
+    "_text_length": lambda embed: len(embed._title or "") + len(embed._description or ""),
+}
+
+
+class LazyEmbed(Embed):
+    """
+    An :class:`Embed` over a raw payload dict, e.g. from the gateway or
+    the REST api, which builds each part only when it is first read.
+
+    Scanning history for a title or one field does not pay for building
+    the author, footer, images and every field.
+
+    The payload is checked by :data:`validate_embed` in one pass when
+    the embed is created, raising the same :class:`SchemaError` as
+    :meth:`Embed.fromDict`. Payloads known to be valid, such as those
+    sent by discord, can skip this with ``trusted=True``, see
+    :meth:`Embed.fromTrusted`.
+
+    As long as no setter ran and no built part was changed in place,
+    :meth:`toDict` and :meth:`to_dict` return the original dict itself,
+    which should be treated as read-only.
+
+    .. code-block:: python3
+
+        >>> embeds = [LazyEmbed(data) for data in message_payload["embeds"]]
+        >>> starred = [embed for embed in embeds if embed.title == "Starboard"]
+
+    Parameters
+    ----------
+    data: Dict[str, Any]
+        The embed payload.
+    trusted: bool
+        Whether to skip validating the payload.
+
+    Raises
+    ------
+    SchemaError
+        Every violation found in an untrusted payload.
+    """
+
+    def __init__(self, data: Dict[str, Any], *, trusted: bool = False) -> None:
+        if not isinstance(data, dict):
+            raise TypeError("Expected Dict[str, Any], caught {}".format(data.__class__))
+        if not trusted:
+            color = data.get("color")
+            validate_embed.check({**data, "color": color.value} if isinstance(color, Color) else data)
+        self._raw: Dict[str, Any] = data
+        self._trusted: bool = trusted
+        self._modified: bool = False
+        self._built: list = []
+        self._encoded = None
+        self._fingerprint = None
+
+    def __getattr__(self, name: str) -> Any:
+        # only reached while an attribute is not built yet
+        builder = _BUILDERS.get(name)
+        if builder is None:
+            raise AttributeError("{!r} object has no attribute {!r}".format(self.__class__.__name__, name))
+        value = builder(self)
+        object.__setattr__(self, name, value)
+        return value
+
+    @classmethod
+    def fromDict(cls, data: Dict[str, Any]) -> "LazyEmbed":
+        return cls(data)
+
+    @property
+    def is_modified(self) -> bool:
+        """
+        Whether the embed no longer matches its original payload.
+        """
+        if not self._modified:
+            for obj, snapshot in self._built:
+                if _snapshot(obj) != snapshot:
+                    self._modified = True
+                    break
+        return self._modified
+
+    def _invalidate(self) -> None:
+        self._encoded = None
+        self._modified = True
+
+    def toDict(self) -> Dict[str, Any]:
+        if not self.is_modified:
+            return self._raw
+        return super().toDict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        # the payload came from discord, it is only validated once it was changed
+        if not self.is_modified:
+            return self._raw
+        return super().to_dict()
+
+    def __repr__(self) -> str:
+        return "LazyEmbed(keys={},modified={})".format(sorted(self._raw), self.is_modified)
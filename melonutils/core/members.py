@@ -0,0 +1,250 @@
+import asyncio
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import discord
+
+__all__: Tuple[str, ...] = (
+    "MemberCacheStats",
+    "MemberCache",
+    "default_member_cache",
+)
+
+_Key = Tuple[int, int]
+
+
+class MemberCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    coalesced: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses + self.coalesced
+        return (self.hits + self.coalesced) / total if total else 0.0
+
+
+class MemberCache:
+    """
+    A TTL/LRU cache of member lookups that miss the gateway cache.
+
+    Members the guild already holds are returned straight from
+    :meth:`discord.Guild.get_member`; everything else is fetched over
+    REST once and remembered for ``ttl`` seconds, including users who
+    turned out not to be members. Concurrent lookups for the same
+    (guild, user) pair share a single in-flight fetch.
+
+    Register the event listeners with :meth:`listen` so that joins,
+    updates and leaves replace or drop the cached entries, otherwise
+    entries are only refreshed when their ``ttl`` runs out.
+
+    .. code-block:: python3
+
+        >>> cache = MemberCache(ttl=30)
+        >>> cache.listen(bot)
+        >>> member = await cache.get_member(guild, user_id)
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of cached lookups.
+    ttl: float
+        The number of seconds a lookup is kept.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "maxsize",
+        "ttl",
+        "_entries",
+        "_pending",
+        "_hits",
+        "_misses",
+        "_coalesced",
+    )
+
+    def __init__(self, maxsize: int = 4096, *, ttl: float = 60.0) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        if ttl <= 0:
+            raise ValueError("ttl must be a positive number.")
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self._entries: "OrderedDict[_Key, Tuple[float, Optional[discord.Member]]]" = OrderedDict()
+        self._pending: Dict[_Key, "asyncio.Task[Optional[discord.Member]]"] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+        self._coalesced: int = 0
+
+    async def get_member(self, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        """
+        |coro|
+
+        Returns the member with the given id, fetching it if needed.
+
+        Parameters
+        ----------
+        guild: :class:`discord.Guild`
+            The guild to look the member up in.
+        user_id: int
+            The id of the user.
+
+        Returns
+        -------
+        Optional[:class:`discord.Member`]
+            The member, or ``None`` if the user is not in the guild.
+
+        Raises
+        ------
+        discord.HTTPException
+            Fetching the member failed, failures are not cached.
+        """
+        member = guild.get_member(user_id)
+        if member is not None:
+            return member
+
+        key = (guild.id, user_id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > monotonic():
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            del self._entries[key]
+
+        task = self._pending.get(key)
+        if task is None:
+            self._misses += 1
+            task = self._pending[key] = asyncio.ensure_future(self._fetch(key, guild, user_id))
+            task.add_done_callback(lambda done: self._done(key, done))
+        else:
+            self._coalesced += 1
+
+        # a cancelled caller must not cancel the fetch the others wait on
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: _Key, guild: discord.Guild, user_id: int) -> Optional[discord.Member]:
+        try:
+            member: Optional[discord.Member] = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            member = None
+        # an event invalidated the key while the request was in flight
+        if self._pending.get(key) is asyncio.current_task():
+            self._store(key, member)
+        return member
+
+    def _done(self, key: _Key, task: "asyncio.Task[Any]") -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if not task.cancelled():
+            # retrieved here so an unawaited failure is not reported twice
+            task.exception()
+
+    def _store(self, key: _Key, member: Optional[discord.Member]) -> None:
+        self._entries[key] = (monotonic() + self.ttl, member)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def update(self, member: discord.Member) -> None:
+        """
+        Replaces the cached entry of a member with a newer version.
+        """
+        key = (member.guild.id, member.id)
+        self._pending.pop(key, None)
+        self._store(key, member)
+
+    def refresh(self, member: discord.Member) -> None:
+        """
+        Like :meth:`update`, but only for a member that is cached or
+        being fetched, without changing its place in the LRU order.
+
+        Gateway events use this, so members that were never looked up
+        don't push out the ones that were.
+        """
+        key = (member.guild.id, member.id)
+        if key in self._entries:
+            # assigning to an existing key keeps its position
+            self._entries[key] = (monotonic() + self.ttl, member)
+        elif self._pending.pop(key, None) is not None:
+            self._store(key, member)
+
+    def invalidate(self, guild_id: int, user_id: Optional[int] = None) -> None:
+        """
+        Drops the cached entry of a user, or of every user of a guild.
+
+        Parameters
+        ----------
+        guild_id: int
+            The id of the guild.
+        user_id: Optional[int]
+            The id of the user, drops the whole guild if not given.
+        """
+        if user_id is not None:
+            self._entries.pop((guild_id, user_id), None)
+            self._pending.pop((guild_id, user_id), None)
+            return
+        for mapping in (self._entries, self._pending):
+            for key in [key for key in mapping if key[0] == guild_id]:
+                del mapping[key]
+
+    async def on_member_join(self, member: discord.Member) -> None:
+        self.refresh(member)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        self.refresh(after)
+
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent) -> None:
+        self.invalidate(payload.guild_id, payload.user.id)
+
+    async def on_member_ban(self, guild: discord.Guild, user: Any) -> None:
+        self.invalidate(guild.id, user.id)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self.invalidate(guild.id)
+
+    _LISTENERS: Tuple[str, ...] = (
+        "on_member_join",
+        "on_member_update",
+        "on_raw_member_remove",
+        "on_member_ban",
+        "on_guild_remove",
+    )
+
+    def listen(self, bot: discord.Client) -> None:
+        """
+        Registers the invalidation listeners on a bot.
+        """
+        for name in self._LISTENERS:
+            bot.add_listener(getattr(self, name), name)
+
+    def unlisten(self, bot: discord.Client) -> None:
+        """
+        Removes the listeners registered with :meth:`listen`.
+        """
+        for name in self._LISTENERS:
+            bot.remove_listener(getattr(self, name), name)
+
+    def stats(self) -> MemberCacheStats:
+        return MemberCacheStats(self._hits, self._misses, self._coalesced, len(self._entries), self.maxsize)
+
+    def clear(self) -> None:
+        """
+        Drops every cached entry and resets the statistics.
+        """
+        self._entries.clear()
+        self._pending.clear()
+        self._hits = self._misses = self._coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return "MemberCache(size={},maxsize={},ttl={},hit_rate={:.2%})".format(
+            len(self._entries), self.maxsize, self.ttl, self.stats().hit_rate
+        )
+
+
+default_member_cache: MemberCache = MemberCache()
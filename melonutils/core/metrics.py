@@ -0,0 +1,172 @@
+import asyncio
+from typing import List, Optional, Set, Tuple
+
+from .exceptions import error_counts
+from .timing import _histograms
+
+__all__: Tuple[str, ...] = (
+    "render_metrics",
+    "MetricsServer",
+)
+
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram buckets sit on powers of two, from ~1 microsecond to ~34 seconds.
+# They line up with the sub-bucket boundaries of `TimingHistogram`, so the
+# cumulative counts are exact.
+_LE_SHIFTS: Tuple[int, ...] = tuple(range(10, 36))
+_SUB_BUCKETS: int = 4
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _bucket_end(shift: int) -> int:
+    # index of the first `TimingHistogram` bucket at or above 2 ** shift
+    return (shift - 1) * _SUB_BUCKETS
+
+
+def render_metrics() -> str:
+    """
+    Renders the ``add_logging`` timings and the exception counters
+    in the Prometheus text exposition format.
+
+    Returns
+    -------
+    str
+        The metrics page.
+    """
+    lines: List[str] = [
+        "# HELP melonutils_function_duration_seconds Run time of functions decorated with add_logging.",
+        "# TYPE melonutils_function_duration_seconds histogram",
+    ]
+    for name, histogram in list(_histograms.items()):
+        label = _escape(name)
+        buckets = list(histogram.buckets)
+        count = histogram.calls
+        # a sampled histogram is scaled up to every call
+        timed = sum(buckets)
+        scale = count / timed if timed else 0.0
+        seen, start = 0, 0
+        for shift in _LE_SHIFTS:
+            end = _bucket_end(shift)
+            seen += sum(buckets[start:end])
+            start = end
+            lines.append(
+                f'melonutils_function_duration_seconds_bucket{{function="{label}",le="{(1 << shift) / 1e9!r}"}} {round(seen * scale)}'
+            )
+        lines.append(f'melonutils_function_duration_seconds_bucket{{function="{label}",le="+Inf"}} {count}')
+        lines.append(f'melonutils_function_duration_seconds_sum{{function="{label}"}} {histogram.total_ns * scale / 1e9!r}')
+        lines.append(f'melonutils_function_duration_seconds_count{{function="{label}"}} {count}')
+
+    lines.append("# HELP melonutils_errors_total Number of melonutils exceptions raised.")
+    lines.append("# TYPE melonutils_errors_total counter")
+    for name, count in sorted(error_counts().items()):
+        lines.append(f'melonutils_errors_total{{error="{_escape(name)}"}} {count}')
+    lines.append("")
+    return "\n".join(lines)
+
+
+class MetricsServer:
+    """
+    A minimal HTTP endpoint serving :func:`render_metrics` from the
+    running event loop, without any extra dependencies.
+
+    .. code-block:: python3
+
+        >>> server = MetricsServer(port=9100)
+        >>> await server.start()
+        >>> ...
+        >>> await server.close()
+
+    Parameters
+    ----------
+    host: str
+        The address to bind to.
+    port: int
+        The port to bind to, ``0`` picks a free one.
+    path: str
+        The path the metrics are served on.
+    timeout: float
+        Seconds a client gets to send its request before it is dropped.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 9100,
+        *,
+        path: str = "/metrics",
+        timeout: float = 5.0
+    ) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.path: str = path
+        self.timeout: float = timeout
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._clients: Set[asyncio.Task] = set()
+
+    @property
+    def is_serving(self) -> bool:
+        return self._server is not None and self._server.is_serving()
+
+    async def start(self) -> None:
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        # handlers are not awaited by the server, let idle clients finish
+        # instead of leaving their tasks to be cancelled with the loop
+        for task in self._clients:
+            task.cancel()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> "MetricsServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._clients.add(task)
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.timeout)
+            method, target, _ = head.split(b"\r\n", 1)[0].decode("latin-1").split(" ", 2)
+            if method not in ("GET", "HEAD"):
+                status, body = "405 Method Not Allowed", b""
+            elif target.split("?", 1)[0] != self.path:
+                status, body = "404 Not Found", b""
+            else:
+                status, body = "200 OK", render_metrics().encode("utf-8")
+            writer.write(
+                (
+                    f"HTTP/1.1 {status}\r\n"
+                    f"Content-Type: {CONTENT_TYPE}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode("latin-1")
+                + (body if method != "HEAD" else b"")
+            )
+            await writer.drain()
+        except (
+            asyncio.CancelledError,
+            asyncio.TimeoutError,
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            ValueError,
+            ConnectionError,
+        ):
+            pass
+        finally:
+            self._clients.discard(task)
+            writer.close()
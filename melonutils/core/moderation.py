@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+from time import monotonic
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import discord
+
+from .helpers import can_execute_action_many, safe_reason
+
+if TYPE_CHECKING:
+    from redbot.core import commands # type: ignore
+
+__all__: Tuple[str, ...] = (
+    "ModerationAction",
+    "ModerationResult",
+    "ModerationExecutor",
+)
+
+_Target = Union[discord.Member, discord.User]
+
+
+class ModerationAction:
+    """
+    A moderation action the :class:`ModerationExecutor` can run.
+
+    Use the classmethods for the built-in actions, or pass a coroutine
+    function taking ``(guild, target, reason)`` for anything else.
+
+    Parameters
+    ----------
+    bucket: str
+        The rate-limit bucket of the action. Discord buckets moderation
+        routes per guild, so actions sharing a route should share a name.
+    func: Callable[[discord.Guild, Union[discord.Member, discord.User], Optional[str]], Awaitable[Any]]
+        The coroutine function running the action.
+    requires_member: bool
+        Whether the target must be a member of the guild.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "bucket",
+        "func",
+        "requires_member",
+    )
+
+    def __init__(
+        self,
+        bucket: str,
+        func: Callable[[discord.Guild, _Target, Optional[str]], Awaitable[Any]],
+        *,
+        requires_member: bool = True
+    ) -> None:
+        self.bucket: str = bucket
+        self.func: Callable[[discord.Guild, _Target, Optional[str]], Awaitable[Any]] = func
+        self.requires_member: bool = requires_member
+
+    @classmethod
+    def ban(cls, *, delete_message_seconds: int = 0) -> "ModerationAction":
+        async def _ban(guild: discord.Guild, target: _Target, reason: Optional[str]) -> None:
+            await guild.ban(target, delete_message_seconds=delete_message_seconds, reason=reason)
+
+        return cls("ban", _ban, requires_member=False)
+
+    @classmethod
+    def kick(cls) -> "ModerationAction":
+        async def _kick(guild: discord.Guild, target: _Target, reason: Optional[str]) -> None:
+            await guild.kick(target, reason=reason)
+
+        return cls("kick", _kick)
+
+    @classmethod
+    def timeout(cls, until: Optional[Union[datetime.timedelta, datetime.datetime]]) -> "ModerationAction":
+        async def _timeout(guild: discord.Guild, target: Any, reason: Optional[str]) -> None:
+            await target.timeout(until, reason=reason)
+
+        # timeouts and role edits share the member edit route
+        return cls("member_edit", _timeout)
+
+    @classmethod
+    def add_roles(cls, *roles: discord.abc.Snowflake) -> "ModerationAction":
+        async def _add_roles(guild: discord.Guild, target: Any, reason: Optional[str]) -> None:
+            await target.add_roles(*roles, reason=reason)
+
+        return cls("member_edit", _add_roles)
+
+    @classmethod
+    def remove_roles(cls, *roles: discord.abc.Snowflake) -> "ModerationAction":
+        async def _remove_roles(guild: discord.Guild, target: Any, reason: Optional[str]) -> None:
+            await target.remove_roles(*roles, reason=reason)
+
+        return cls("member_edit", _remove_roles)
+
+    def __repr__(self) -> str:
+        return "ModerationAction(bucket={!r},requires_member={})".format(self.bucket, self.requires_member)
+
+
+class ModerationResult(NamedTuple):
+    """
+    The outcome of an action on one target.
+
+    ``index`` is the position of the target in the input, results are
+    reported in completion order. ``attempts`` is ``0`` for targets
+    denied by the hierarchy check.
+    """
+
+    index: int
+    target: _Target
+    error: Optional[Exception]
+    attempts: int
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __bool__(self) -> bool:
+        return self.error is None
+
+
+class _Bucket:
+    __slots__: Tuple[str, ...] = (
+        "interval",
+        "next_slot",
+        "blocked_until",
+        "users",
+    )
+
+    def __init__(self, interval: float) -> None:
+        self.interval: float = interval
+        self.next_slot: float = 0.0
+        self.blocked_until: float = 0.0
+        # the number of running `ModerationExecutor.run` calls
+        self.users: int = 0
+
+    def is_idle(self, now: float) -> bool:
+        # a fresh bucket would behave the same
+        return not self.users and max(self.next_slot, self.blocked_until) <= now
+
+    async def acquire(self) -> None:
+        while True:
+            now = monotonic()
+            wait = max(self.next_slot, self.blocked_until) - now
+            if wait <= 0:
+                self.next_slot = now + self.interval
+                return
+            await asyncio.sleep(wait)
+
+    def block(self, delay: float) -> None:
+        self.blocked_until = max(self.blocked_until, monotonic() + delay)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        return float(retry_after)
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers:
+        try:
+            return float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+class ModerationExecutor:
+    """
+    Runs a moderation action against many targets with bounded
+    concurrency, pacing each Discord rate-limit bucket and retrying
+    rate-limited and failed requests with backoff.
+
+    Targets are first checked with :func:`can_execute_action_many`, the
+    audit log reason is built with :func:`safe_reason`. Results are
+    reported as they complete.
+
+    .. code-block:: python3
+
+        >>> executor = ModerationExecutor(concurrency=4)
+        >>> async for result in executor.run(ctx, users, ModerationAction.ban(), reason="raid"):
+        >>>     if not result:
+        >>>         await ctx.send(f"Could not ban {result.target}: {result.error}")
+
+    Parameters
+    ----------
+    concurrency: int
+        The maximum number of requests in flight.
+    rate: float
+        The number of requests per second allowed in each bucket.
+    max_retries: int
+        How many times a rate-limited or server-failed request is retried.
+    backoff: float
+        The initial retry delay in seconds when Discord sends no
+        ``Retry-After``, doubled on every retry.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "concurrency",
+        "rate",
+        "max_retries",
+        "backoff",
+        "_buckets",
+    )
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 4,
+        rate: float = 5.0,
+        max_retries: int = 3,
+        backoff: float = 1.0
+    ) -> None:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be a positive integer.")
+        if rate <= 0:
+            raise ValueError("rate must be a positive number.")
+        self.concurrency: int = concurrency
+        self.rate: float = rate
+        self.max_retries: int = max_retries
+        self.backoff: float = backoff
+        self._buckets: Dict[Tuple[str, int], _Bucket] = {}
+
+    def _bucket(self, name: str, guild_id: int) -> _Bucket:
+        bucket = self._buckets.get((name, guild_id))
+        if bucket is None:
+            self._prune()
+            bucket = self._buckets[(name, guild_id)] = _Bucket(1 / self.rate)
+        return bucket
+
+    def _prune(self) -> None:
+        # buckets of past runs would otherwise pile up, one per guild and route
+        now = monotonic()
+        for key in [key for key, bucket in self._buckets.items() if bucket.is_idle(now)]:
+            del self._buckets[key]
+
+    async def run(
+        self,
+        ctx: commands.Context,
+        targets: Iterable[_Target],
+        action: ModerationAction,
+        *,
+        reason: Optional[str] = None,
+        check: bool = True
+    ) -> AsyncIterator[ModerationResult]:
+        """
+        Runs ``action`` against every target.
+
+        Parameters
+        ----------
+        ctx: :class:`commands.Context`
+            The context of the command.
+        targets: Iterable[Union[:class:`discord.Member`, :class:`discord.User`]]
+            The targets of the action.
+        action: :class:`ModerationAction`
+            The action to run.
+        reason: Optional[str]
+            The reason, prefixed with the author for the audit log.
+        check: bool
+            Whether to check the targets with :func:`can_execute_action_many`.
+
+        Yields
+        ------
+        :class:`ModerationResult`
+            One result per target, as soon as it is known. Errors other
+            than rate limits and server errors are not retried, the
+            exception is reported as the ``error`` of the result.
+        """
+        guild = ctx.guild
+        targets = list(targets)
+        if reason is not None:
+            reason = safe_reason(ctx.author, reason)
+
+        if check:
+            checked = await can_execute_action_many(ctx, targets, fail_if_not_upgrade=action.requires_member)
+            allowed: List[Tuple[int, _Target]] = []
+            for index, result in enumerate(checked):
+                if result.error is None:
+                    allowed.append((index, result.target))
+                else:
+                    yield ModerationResult(index, result.target, result.error, 0)
+        else:
+            allowed = list(enumerate(targets))
+
+        bucket = self._bucket(action.bucket, guild.id)
+        bucket.users += 1
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [
+            asyncio.ensure_future(self._execute(semaphore, bucket, action, guild, index, target, reason))
+            for index, target in allowed
+        ]
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            # the caller stopped iterating early
+            for task in tasks:
+                task.cancel()
+            bucket.users -= 1
+
+    async def _execute(
+        self,
+        semaphore: asyncio.Semaphore,
+        bucket: _Bucket,
+        action: ModerationAction,
+        guild: discord.Guild,
+        index: int,
+        target: _Target,
+        reason: Optional[str]
+    ) -> ModerationResult:
+        async with semaphore:
+            attempts = 0
+            while True:
+                attempts += 1
+                await bucket.acquire()
+                try:
+                    await action.func(guild, target, reason)
+                except (discord.HTTPException, discord.RateLimited) as error:
+                    status = getattr(error, "status", 429)
+                    if (status != 429 and status < 500) or attempts > self.max_retries:
+                        return ModerationResult(index, target, error, attempts)
+                    delay = _retry_after(error)
+                    if delay is None:
+                        delay = self.backoff * 2 ** (attempts - 1)
+                    # hold back the whole bucket, not only this request
+                    bucket.block(delay)
+                except Exception as error:
+                    # e.g. a custom action failing, or `timeout` on a user
+                    return ModerationResult(index, target, error, attempts)
+                else:
+                    return ModerationResult(index, target, None, attempts)
+
+    def __repr__(self) -> str:
+        return "ModerationExecutor(concurrency={},rate={},max_retries={})".format(
+            self.concurrency, self.rate, self.max_retries
+        )
@@ -1,15 +1,49 @@
-import re
+from __future__ import annotations
+
+import json
 from enum import Enum
-from datetime import datetime
 from abc import abstractmethod
-from typing import Dict, Optional, List, Union, NoReturn, Any
-
-from discord import Color
-
-def validate_url(value) -> bool:
-    return isinstance(value, str) and re.match("^https?", value)
+from typing import Dict, Optional, List, Union, NoReturn, Any, Tuple, Iterable, Iterator
+
+from .interning import ObjectInterner, default_interner
+from .schema import (
+    _AUTHOR,
+    _FIELD,
+    _FIELDS,
+    _FOOTER,
+    _IMAGE,
+    _PROVIDER,
+    _VIDEO,
+    DESCRIPTION_LIMIT,
+    FIELD_NAME_LIMIT,
+    FIELD_VALUE_LIMIT,
+    MAX_FIELDS,
+    TITLE_LIMIT,
+    SchemaError,
+    SchemaViolation,
+)
+from .validators import validate_url
+
+__all__: Tuple[str, ...] = (
+    "EmbedType",
+    "EmbedObject",
+    "EmptyObject",
+    "AuthorObject",
+    "FooterObject",
+    "ImageObject",
+    "ThumbnailObject",
+    "VideoObject",
+    "ProviderObject",
+    "Field",
+    "Fields",
+    "check_title",
+    "process_title",
+    "check_desc",
+    "process_desc",
+)
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
-@DeprecationWarning
 class EmbedType(Enum):
     RICH = "rich"
     IMAGE = "image"
@@ -46,11 +80,89 @@ class EmbedType(Enum):
 class EmbedObject(object):
     """
     Represents property object used in discord`s embed structure.
+
+    Property objects are slot-based: subclasses declare their attributes in
+    ``__slots__`` and equality compares those attributes in declaration order.
+
+    The encoded json form of an object is cached after the first call to
+    :meth:`toJSON` and dropped whenever one of its attributes is assigned.
     """
 
+    __slots__: Tuple[str, ...] = ("_encoded",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_encoded":
+            object.__setattr__(self, "_encoded", None)
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name, None) for name in self.__slots__)
+
+    def toJSON(self) -> bytes:
+        """
+        Returns the compact json encoding of :meth:`toDict` as utf-8 bytes.
+        
+        :return: The cached encoding if the object has not changed since the last call.
+        """
+        encoded = getattr(self, "_encoded", None)
+        if encoded is None:
+            encoded = _encoder.encode(self.toDict()).encode("utf-8")
+            object.__setattr__(self, "_encoded", encoded)
+        return encoded
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    # mutable and compared by value, like `Embed`; `ObjectInterner` keys
+    # on the `_values()` tuple instead
+    __hash__ = None # type: ignore
+
     def __repr__(self) -> str:
         return f"Embed.Object"
 
+    @classmethod
+    def interned(
+        cls,
+        data: Union["EmbedObject", Dict[str, Any]],
+        *,
+        interner: Optional[ObjectInterner] = None
+    ):
+        """
+        Opt-in alternative to :meth:`fromDict` that shares equal objects.
+        
+        Repeated footers, authors and thumbnails are built and validated once,
+        later calls return the same instance, which must not be mutated.
+        
+        :param data: The property data or an existing object.
+        :param interner: The cache to use, defaults to ``default_interner``.
+        :return: The shared object.
+        """
+        return (interner or default_interner).get(cls, data)
+
+    # attributes taken from trusted data as-is, the others read empty values as None
+    _REQUIRED: Tuple[str, ...] = ()
+
+    @classmethod
+    def fromTrusted(cls, data: Dict[str, Any]):
+        """
+        Builds an object from data that is known to be valid, e.g. sent by
+        discord or produced by :meth:`toDict`, skipping every check.
+        
+        The result is equal to ``cls.fromDict(data)``; invalid data is not
+        detected and leads to an invalid payload.
+        
+        :param data: The property data.
+        :return: The property object.
+        """
+        obj = object.__new__(cls)
+        for name in cls.__slots__:
+            value = data.get(name)
+            object.__setattr__(obj, name, value if name in cls._REQUIRED else value or None)
+        object.__setattr__(obj, "_encoded", None)
+        return obj
+
     @classmethod
     @abstractmethod
     def fromDict(cls, data: Dict[str, Any]):
@@ -69,6 +181,11 @@ class EmptyObject(EmbedObject):
     Represents `empty` value in embed property.
     """
 
+    __slots__: Tuple[str, ...] = (
+        "property_name",
+        "optional",
+    )
+
     def __init__(self, property_name: str, optional: bool = False) -> None:
         self.property_name = property_name
         self.optional = optional
@@ -116,6 +233,15 @@ class AuthorObject(EmbedObject):
     Represents author objects on discord Embed.
     """
 
+    __slots__: Tuple[str, ...] = (
+        "name",
+        "url",
+        "icon_url",
+        "proxy_icon_url",
+    )
+
+    _REQUIRED: Tuple[str, ...] = ("name",)
+
     def __init__(
         self, 
         name: str, 
@@ -123,24 +249,11 @@ class AuthorObject(EmbedObject):
         icon_url: Optional[str] = None,
         proxy_icon_url: Optional[str] = None
     ):
-        if type(name) != str or len(name) > 256:
-            raise ValueError("Author Object cannot have name longer than 256.")
+        _AUTHOR.check({"name": name, "url": url, "icon_url": icon_url, "proxy_icon_url": proxy_icon_url})
         self.name = name
-
-        if url is not None and validate_url(url):
-            self.url = url
-        else:
-            raise ValueError("Invalid url!")
-
-        if icon_url is not None and validate_url(icon_url):
-            self.icon_url = icon_url
-        else:
-            raise ValueError("Invalid icon url!")
-
-        if proxy_icon_url is not None and validate_url(proxy_icon_url):
-            self.proxy_icon_url = proxy_icon_url
-        else:
-            raise ValueError("Invalid proxy icon url!")
+        self.url = url
+        self.icon_url = icon_url
+        self.proxy_icon_url = proxy_icon_url
 
     @classmethod
     def fromDict(cls, data: Union["AuthorObject", Dict[str, Any]]) -> AuthorObject: # type: ignore
@@ -181,6 +294,14 @@ class FooterObject(EmbedObject):
     """
     Represents footer objects on discord Embed.
     """
+
+    __slots__: Tuple[str, ...] = (
+        "text",
+        "icon_url",
+        "proxy_icon_url",
+    )
+
+    _REQUIRED: Tuple[str, ...] = ("text",)
     
     def __init__(
         self, 
@@ -188,12 +309,13 @@ class FooterObject(EmbedObject):
         icon_url: Optional[str] = None,
         proxy_icon_url: Optional[str] = None
     ):
+        # invalid icon urls are dropped rather than raised
+        icon_url = icon_url if validate_url(icon_url) else None
+        proxy_icon_url = proxy_icon_url if validate_url(proxy_icon_url) else None
+        _FOOTER.check({"text": text, "icon_url": icon_url, "proxy_icon_url": proxy_icon_url})
         self.text = text
-        self.icon_url = icon_url if validate_url(icon_url) else None
-        self.proxy_icon_url = proxy_icon_url if validate_url(proxy_icon_url) else None
-
-        if proxy_icon_url is not None and validate_url(proxy_icon_url):
-            self.proxy_icon_url = proxy_icon_url
+        self.icon_url = icon_url
+        self.proxy_icon_url = proxy_icon_url
 
     @classmethod
     def fromDict(
@@ -235,6 +357,15 @@ class ImageObject(EmbedObject):
     Can be used at 'image', 'thumbnail' property (They share same options)
     """
 
+    __slots__: Tuple[str, ...] = (
+        "url",
+        "proxy_url",
+        "height",
+        "width",
+    )
+
+    _REQUIRED: Tuple[str, ...] = ("url",)
+
     def __init__(
             self,
             url: str,
@@ -242,10 +373,8 @@ class ImageObject(EmbedObject):
             height: Optional[int] = None,
             width: Optional[int] = None
     ) -> None:
-        if validate_url(url):
-            self.url = url
-        else:
-            raise ValueError("Invalid url!")
+        _IMAGE.check({"url": url, "height": height, "width": width})
+        self.url = url
 
         if validate_url(proxy_url):
             self.proxy_url: Optional[str] = proxy_url
@@ -296,17 +425,22 @@ class VideoObject(EmbedObject):
     Represents video objects on discord Embed.
     """
 
+    __slots__: Tuple[str, ...] = (
+        "url",
+        "height",
+        "width",
+    )
+
+    _REQUIRED: Tuple[str, ...] = ("url",)
+
     def __init__(
         self, 
         url: str, 
         height: Optional[int] = None, 
         width: Optional[int] = None
     ):
-        if validate_url(url):
-            self.url = url
-        else:
-            raise ValueError("Invalid url!")
-
+        _VIDEO.check({"url": url, "height": height, "width": width})
+        self.url = url
         self.height = height
         self.width = width
 
@@ -350,11 +484,19 @@ class ProviderObject(EmbedObject):
     Represents provider objects on discord Embed.
     """
 
+    __slots__: Tuple[str, ...] = (
+        "name",
+        "url",
+    )
+
+    _REQUIRED: Tuple[str, ...] = ("name", "url")
+
     def __init__(
         self, 
         name: str, 
         url: str
     ) -> None:
+        _PROVIDER.check({"name": name, "url": url})
         self.name = name
         self.url = url
 
@@ -367,17 +509,10 @@ class ProviderObject(EmbedObject):
         if not isinstance(data, dict):
             raise TypeError("Expected Dict[str, Any], caught {}".format(data.__class__))
 
-        # Attribute Check
-        try:
-            name = data.get("name")
-            url = data.get("url")
-            return cls(
-                name=name,
-                url=url
-            )
-
-        except KeyError as e:
-            raise ValueError(f"Invalid data is passed in VideoObject. : {data}. KeyError : {e}")
+        return cls(
+            name=data.get("name"),
+            url=data.get("url")
+        )
 
     def toDict(self) -> Dict[str, str]:
         result = {
@@ -397,30 +532,51 @@ class Field(EmbedObject):
     Represents field objects on discord Embed.
     """
 
+    __slots__: Tuple[str, ...] = (
+        "name",
+        "value",
+        "inline",
+    )
+
     def __init__(
         self, 
         name: str, 
         value: str,
         inline: Optional[bool] = False
     ):
-
-        if not Field.check_name(name):
-            raise ValueError("")
+        _FIELD.check({"name": name, "value": value})
         self.name = name
-        if not Field.check_value(value):
-            raise ValueError("")
         self.value = value
         if type(inline) != bool:
             inline = False
         self.inline = inline
 
+    @classmethod
+    def _trusted(cls, name: str, value: str, inline: bool) -> Field: # type: ignore
+        # the columns of `Fields` are validated already
+        field = object.__new__(cls)
+        object.__setattr__(field, "name", name)
+        object.__setattr__(field, "value", value)
+        object.__setattr__(field, "inline", inline)
+        object.__setattr__(field, "_encoded", None)
+        return field
+
+    @classmethod
+    def fromTrusted(cls, data: Dict[str, Any]) -> Field: # type: ignore
+        field = object.__new__(cls)
+        object.__setattr__(field, "name", data.get("name"))
+        object.__setattr__(field, "value", data.get("value"))
+        object.__setattr__(field, "inline", data.get("inline") or False)
+        object.__setattr__(field, "_encoded", None)
+        return field
+
     @classmethod
     def check_name(cls, name: str) -> bool:
-        return type(name) is str and len(name) <= 256
+        return type(name) is str and len(name) <= FIELD_NAME_LIMIT
 
     @classmethod
     def check_value(cls, value: str) -> bool:
-        return type(value) is str and len(value) <= 1024
+        return type(value) is str and len(value) <= FIELD_VALUE_LIMIT
 
     @classmethod
     def fromDict(
@@ -431,19 +587,8 @@ class Field(EmbedObject):
             return data
         if data is None or not isinstance(data, dict):
             raise TypeError("Expected Dict[str, Union[str, bool]], caught {}".format(data.__class__))
-        try:
-            name = data.get("name")
-            if not cls.check_name(name):
-                raise ValueError("")
-            value = data.get("value")
-            if not cls.check_value(value):
-                raise ValueError("")
-            inline = data.get("inline") or False
-            if type(inline) != bool:
-                raise TypeError("")
-        # Does not except ValueError&TypeError, because it is intentionally raised to indicate error on given data.
-        except KeyError as e:
-            raise ValueError(f"Invalid data is passed in VideoObject. : {data}. KeyError : {e}")
+        _FIELD.check(data)
+        return cls._trusted(data["name"], data["value"], data.get("inline") or False)
 
     def toDict(self) -> Dict[str, str]:
         result = {
@@ -484,48 +629,234 @@ class Field(EmbedObject):
             yield "inline", self.inline
         return itemIter()
 
-@NotImplemented
-class Fields(EmbedObject, list):
+def _reindex(error: SchemaViolation, positions: List[int]) -> SchemaViolation:
+    # `fields[i]...` of the checked dicts to the position among all fields
+    head, _, rest = error.path.partition("]")
+    index = positions[int(head[len("fields["):])]
+    return SchemaViolation("fields[{}]{}".format(index, rest), error.message)
+
+
+class Fields(EmbedObject):
+    """
+    Represents the fields array of discord Embed.
+    
+    Fields are stored column-wise (names, values and inline flags in
+    parallel arrays) instead of one object per field. Indexing and
+    iterating hand out :class:`Field` copies; use item assignment,
+    :meth:`insert` or :meth:`pop` to change the stored fields.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "_names",
+        "_texts",
+        "_inline",
+        "_length",
+    )
+
+    def __init__(self, fields: Iterable[Union[Field, Dict[str, Any]]] = ()) -> None:
+        self._names: List[str] = []
+        self._texts: List[str] = []
+        self._inline: bytearray = bytearray()
+        self._length: int = 0
+        self.extend(fields)
+
+    @staticmethod
+    def _columns(field: Union[Field, Dict[str, Any]]) -> Tuple[str, str, bool]:
+        if isinstance(field, Field):
+            return field.name, field.value, field.inline
+        if not isinstance(field, dict):
+            raise TypeError("Expected Field or Dict[str, Union[str, bool]], caught {}".format(field.__class__))
+        _FIELD.check(field)
+        return field["name"], field["value"], field.get("inline") or False
+
+    def _check_room(self, count: int) -> None:
+        if len(self._names) + count > MAX_FIELDS:
+            raise ValueError("Embed cannot have more than {} fields.".format(MAX_FIELDS))
+
+    def _dirty(self) -> None:
+        object.__setattr__(self, "_encoded", None)
+
+    @property
+    def text_length(self) -> int:
+        """
+        The combined length of every field name and value.
+        """
+        return self._length
+
+    def add(self, name: str, value: str, inline: bool = False) -> None:
+        self.append({"name": name, "value": value, "inline": inline})
+
+    def append(self, field: Union[Field, Dict[str, Any]]) -> None:
+        name, value, inline = self._columns(field)
+        self._check_room(1)
+        self._names.append(name)
+        self._texts.append(value)
+        self._inline.append(inline)
+        self._length += len(name) + len(value)
+        self._dirty()
 
-    def __init__(self, fields: List[Field]):
-        super().__init__()
-        self.fields = []
+    def extend(self, fields: Iterable[Union[Field, Dict[str, Any]]]) -> None:
+        """
+        Appends many fields, validating all of them before any is stored.
+        """
+        columns = []
+        # `Field` objects are valid already, only the dicts are checked
+        raw, positions = [], []
         for field in fields:
-            if not isinstance(field, Field):
-                raise TypeError("field must be instance of Field object")
-            self.fields.append(field)
+            if isinstance(field, Field):
+                columns.append((field.name, field.value, field.inline))
+                continue
+            if not isinstance(field, dict):
+                raise TypeError("Expected Field or Dict[str, Union[str, bool]], caught {}".format(field.__class__))
+            positions.append(len(columns))
+            raw.append(field)
+            columns.append((field.get("name"), field.get("value"), field.get("inline") or False))
+        if not columns:
+            return
+        if raw:
+            # one pass over every dict, reporting all of their violations
+            errors = _FIELDS({"fields": raw})
+            if errors:
+                raise SchemaError([_reindex(error, positions) for error in errors])
+        self._check_room(len(columns))
+        names, texts, inline = zip(*columns)
+        self._names.extend(names)
+        self._texts.extend(texts)
+        self._inline.extend(inline)
+        self._length += sum(map(len, names)) + sum(map(len, texts))
+        self._dirty()
+
+    def insert(self, index: int, field: Union[Field, Dict[str, Any]]) -> None:
+        name, value, inline = self._columns(field)
+        self._check_room(1)
+        self._names.insert(index, name)
+        self._texts.insert(index, value)
+        self._inline.insert(index, inline)
+        self._length += len(name) + len(value)
+        self._dirty()
+
+    def pop(self, index: int = -1) -> Field:
+        field = self[index]
+        del self[index]
+        return field
+
+    def copy(self) -> Fields:
+        """
+        Returns an independent copy that keeps the cached json encoding.
+        """
+        fields = Fields()
+        fields._names = self._names.copy()
+        fields._texts = self._texts.copy()
+        fields._inline = self._inline.copy()
+        fields._length = self._length
+        object.__setattr__(fields, "_encoded", getattr(self, "_encoded", None))
+        return fields
+
+    def clear(self) -> None:
+        self._names.clear()
+        self._texts.clear()
+        self._inline.clear()
+        self._length = 0
+        self._dirty()
 
     @classmethod
-    def fromDict(cls, data: Dict[str, Any]) -> Fields: # type: ignore
+    def fromDict(cls, data: Union[Fields, List[Union[Field, Dict[str, Any]]]]) -> Fields: # type: ignore
         if isinstance(data, cls):
             return data
-        if isinstance(data, list):
+        if not isinstance(data, (list, tuple)):
+            raise TypeError("Expected List[Dict[str, Union[str, bool]]], caught {}".format(data.__class__))
+        return cls(data)
+
+    @classmethod
+    def fromTrusted(cls, data: Union[Fields, List[Dict[str, Any]]]) -> Fields: # type: ignore
+        """
+        Builds the fields straight into their columns from data that is
+        known to be valid, see :meth:`EmbedObject.fromTrusted`.
+        """
+        if isinstance(data, cls):
+            return data
+        if not all(type(field) is dict for field in data):
             return cls(data)
+        fields = object.__new__(cls)
+        names = [field["name"] for field in data]
+        texts = [field["value"] for field in data]
+        object.__setattr__(fields, "_names", names)
+        object.__setattr__(fields, "_texts", texts)
+        object.__setattr__(fields, "_inline", bytearray([bool(field.get("inline")) for field in data]))
+        object.__setattr__(fields, "_length", sum(map(len, names)) + sum(map(len, texts)))
+        object.__setattr__(fields, "_encoded", None)
+        return fields
+
+    def toDict(self) -> List[Dict[str, Union[str, bool]]]:
+        return [
+            {"name": name, "value": value, "inline": bool(inline)}
+            for name, value, inline in zip(self._names, self._texts, self._inline)
+        ]
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(self._names), tuple(self._texts), bytes(self._inline)
 
-    def toDict(self) -> dict:
-        return {
-            "fields": str(self.fields)
-        }
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __iter__(self) -> Iterator[Field]:
+        for name, value, inline in zip(self._names, self._texts, self._inline):
+            yield Field._trusted(name, value, bool(inline))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Field, Fields]:
+        if isinstance(index, slice):
+            fields = object.__new__(Fields)
+            names, texts = self._names[index], self._texts[index]
+            object.__setattr__(fields, "_names", names)
+            object.__setattr__(fields, "_texts", texts)
+            object.__setattr__(fields, "_inline", self._inline[index])
+            object.__setattr__(fields, "_length", sum(map(len, names)) + sum(map(len, texts)))
+            object.__setattr__(fields, "_encoded", None)
+            return fields
+        return Field._trusted(self._names[index], self._texts[index], bool(self._inline[index]))
+
+    def __setitem__(self, index: int, field: Union[Field, Dict[str, Any]]) -> None:
+        if isinstance(index, slice):
+            raise TypeError("Fields do not support slice assignment, use insert or del instead.")
+        name, value, inline = self._columns(field)
+        self._length += len(name) + len(value) - len(self._names[index]) - len(self._texts[index])
+        self._names[index] = name
+        self._texts[index] = value
+        self._inline[index] = inline
+        self._dirty()
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            self._length -= sum(map(len, self._names[index])) + sum(map(len, self._texts[index]))
+        else:
+            self._length -= len(self._names[index]) + len(self._texts[index])
+        del self._names[index]
+        del self._texts[index]
+        del self._inline[index]
+        self._dirty()
 
-    def __getitem__(self, index: int) -> Field:
-        return self.fields[index]
+    def __str__(self) -> str:
+        return str(self.toDict())
+
+    def __repr__(self) -> str:
+        return "Embed.Fields({})".format(", ".join(map(repr, self)))
 
 def check_title(value) -> bool:
-    return type(value) == str and len(value) <= 256
+    return type(value) == str and len(value) <= TITLE_LIMIT
 
 
 def process_title(value: str) -> Union[str, NoReturn]:
     if check_title(value):
         return value
 
-    raise ValueError("Embed title must be string object and its length must be lower than 256.")
+    raise ValueError("Embed title must be string object and its length must be lower than {}.".format(TITLE_LIMIT))
 
 
 def check_desc(value) -> bool:
-    return type(value) == str and len(value) <= 2048
+    return type(value) == str and len(value) <= DESCRIPTION_LIMIT
 
 
 def process_desc(value: str) -> str:
     if check_desc(value):
         return value
-    raise ValueError("Embed description must be string object and its length must be lower than 2048.")
+    raise ValueError("Embed description must be string object and its length must be lower than {}.".format(DESCRIPTION_LIMIT))
@@ -0,0 +1,164 @@
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Tuple, Union
+
+from .embed import Embed
+from .object import Field
+from .schema import DESCRIPTION_LIMIT, MAX_FIELDS, MAX_TOTAL_LENGTH
+
+__all__: Tuple[str, ...] = (
+    "EmbedPaginator",
+)
+
+PageItem = Union[str, Field, Dict[str, Any]]
+
+
+class _PageBuilder:
+    __slots__: Tuple[str, ...] = (
+        "paginator",
+        "lines",
+        "description_length",
+        "fields",
+        "fields_length",
+    )
+
+    def __init__(self, paginator: "EmbedPaginator") -> None:
+        self.paginator = paginator
+        self.lines: List[str] = []
+        self.description_length: int = 0
+        self.fields: List[Field] = []
+        self.fields_length: int = 0
+
+    @property
+    def empty(self) -> bool:
+        return not self.lines and not self.fields
+
+    def _fits(self, description_length: int, fields_length: int) -> bool:
+        return (
+            self.paginator.base_length + description_length + fields_length
+            <= self.paginator.max_length
+        )
+
+    def _add_line(self, line: str) -> Iterator[Embed]:
+        length = self.description_length + len(line) + (1 if self.lines else 0)
+        if self.lines and (
+            length > self.paginator.max_description
+            or not self._fits(length, self.fields_length)
+        ):
+            yield from self.flush()
+            length = len(line)
+        if not self._fits(length, self.fields_length):
+            raise ValueError("A single line does not fit into an empty page.")
+        self.lines.append(line)
+        self.description_length = length
+
+    def _add_field(self, field: Field) -> Iterator[Embed]:
+        length = self.fields_length + len(field.name) + len(field.value)
+        if self.fields and (
+            len(self.fields) >= self.paginator.max_fields
+            or not self._fits(self.description_length, length)
+        ):
+            yield from self.flush()
+            length = len(field.name) + len(field.value)
+        if not self._fits(self.description_length, length):
+            raise ValueError("A single field does not fit into an empty page.")
+        self.fields.append(field)
+        self.fields_length = length
+
+    def feed(self, item: PageItem) -> Iterator[Embed]:
+        if isinstance(item, str):
+            limit = self.paginator.max_description
+            for start in range(0, max(len(item), 1), limit):
+                yield from self._add_line(item[start:start + limit])
+        else:
+            field = item if isinstance(item, Field) else Field.fromDict(item)
+            yield from self._add_field(field)
+
+    def flush(self) -> Iterator[Embed]:
+        if self.empty:
+            return
+        page = self.paginator.make_page("\n".join(self.lines), self.fields)
+        self.lines, self.description_length = [], 0
+        self.fields, self.fields_length = [], 0
+        yield page
+
+
+class EmbedPaginator:
+    """
+    Lazily splits a stream of lines and fields into embeds.
+
+    Strings are joined into the page description, :class:`Field` objects
+    (or field dicts) are added as fields. A page is finished as soon as the
+    next item would break the description, field count or combined length
+    limit, so the source is only read as fast as pages are consumed.
+
+    .. code-block:: python3
+
+        >>> paginator = EmbedPaginator(cursor, title="Bans")
+        >>> async for page in paginator:
+        >>>     await menu.add_page(page)
+
+    Parameters
+    ----------
+    source: Union[Iterable, AsyncIterable]
+        The lines and fields to paginate. Iterators can only be paginated once.
+    max_description: int
+        The description limit of a page.
+    max_fields: int
+        The maximum number of fields on a page.
+    max_length: int
+        The combined character limit of a page.
+    **kwargs
+        Passed to :class:`Embed` for every page, e.g. ``title``, ``color``,
+        ``author`` or ``footer``. They are validated once up front.
+    """
+
+    def __init__(
+        self,
+        source: Union[Iterable[PageItem], AsyncIterable[PageItem]],
+        *,
+        max_description: int = DESCRIPTION_LIMIT,
+        max_fields: int = MAX_FIELDS,
+        max_length: int = MAX_TOTAL_LENGTH,
+        **kwargs: Any
+    ) -> None:
+        if "description" in kwargs or "fields" in kwargs:
+            raise TypeError("EmbedPaginator builds the description and fields of each page itself.")
+        prototype = Embed(**kwargs)
+        self.source = source
+        self.max_description: int = max_description
+        self.max_fields: int = max_fields
+        self.max_length: int = max_length
+        self.base_length: int = prototype.total_length
+        self._page_kwargs: Dict[str, Any] = {
+            "embed_type": prototype.type,
+            "title": prototype.title,
+            "url": prototype.url,
+            "color": prototype.color,
+            "timestamp": prototype.timestamp,
+            "author": prototype.author,
+            "footer": prototype.footer,
+            "thumbnail": prototype.thumbnail,
+            "image": prototype.image,
+            "provider": prototype._provider,
+        }
+
+    def make_page(self, description: str, fields: List[Field]) -> Embed:
+        return Embed(description=description, fields=fields or None, **self._page_kwargs)
+
+    def __iter__(self) -> Iterator[Embed]:
+        builder = _PageBuilder(self)
+        for item in self.source:
+            yield from builder.feed(item)
+        yield from builder.flush()
+
+    async def __aiter__(self) -> AsyncIterator[Embed]:
+        builder = _PageBuilder(self)
+        if hasattr(self.source, "__aiter__"):
+            async for item in self.source:
+                for page in builder.feed(item):
+                    yield page
+        else:
+            for item in self.source:
+                for page in builder.feed(item):
+                    yield page
+        for page in builder.flush():
+            yield page
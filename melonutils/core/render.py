@@ -0,0 +1,349 @@
+import json
+from collections import OrderedDict
+from functools import wraps
+from inspect import iscoroutinefunction
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Iterable, NamedTuple, Optional, Set, Tuple, Union
+
+from .embed import Embed
+
+__all__: Tuple[str, ...] = (
+    "RenderCacheStats",
+    "RenderCache",
+)
+
+# the bookkeeping of one entry, its key and tags aside
+_ENTRY_OVERHEAD: int = 256
+# a built embed holds its text, its property objects and its cached
+# json encoding, about three times the size of the encoding itself
+_EMBED_FACTOR: int = 3
+
+
+class RenderCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    nbytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Entry:
+    __slots__: Tuple[str, ...] = (
+        "value",
+        "encoded",
+        "nbytes",
+        "expires",
+        "tags",
+    )
+
+    def __init__(
+        self,
+        value: Union[Embed, bytes],
+        encoded: bytes,
+        nbytes: int,
+        expires: Optional[float],
+        tags: Tuple[Hashable, ...]
+    ) -> None:
+        self.value: Union[Embed, bytes] = value
+        self.encoded: bytes = encoded
+        self.nbytes: int = nbytes
+        self.expires: Optional[float] = expires
+        self.tags: Tuple[Hashable, ...] = tags
+
+
+class RenderCache:
+    """
+    A cache of finished embeds, keyed by the function that built them
+    and its arguments, for help pages, server info and profile cards
+    whose inputs rarely change.
+
+    The cache is bounded by an approximate memory budget rather than an
+    entry count, so a few large help pages cannot push out hundreds of
+    small cards without it being accounted for. The least recently used
+    entries are evicted first.
+
+    Entries expire after ``ttl`` seconds and can be dropped early by tag,
+    e.g. every embed rendered for one guild once its settings change.
+
+    .. code-block:: python3
+
+        >>> cache = RenderCache(ttl=600)
+        >>> @cache.cached(tags=lambda guild: [guild.id])
+        >>> def server_info(guild):
+        >>>     ...
+        >>> await ctx.send(embed=server_info(ctx.guild))
+        >>> cache.invalidate_tag(ctx.guild.id)
+
+    Cached :class:`Embed` objects are shared between callers and should
+    be treated as read-only. If one is changed anyway, the next lookup
+    notices that its encoding no longer matches and rebuilds it. With
+    ``serialized=True`` only the json encoding is kept and every hit
+    returns a new embed.
+
+    Parameters
+    ----------
+    max_bytes: int
+        The approximate memory budget of the cached embeds.
+    ttl: Optional[float]
+        The default lifetime of entries in seconds, ``None`` to keep
+        them until they are evicted or invalidated.
+    serialized: bool
+        Whether to keep the json encoding instead of the embed object.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "max_bytes",
+        "ttl",
+        "serialized",
+        "_entries",
+        "_tags",
+        "_nbytes",
+        "_hits",
+        "_misses",
+        "_evictions",
+        "_expirations",
+    )
+
+    def __init__(self, max_bytes: int = 4 << 20, *, ttl: Optional[float] = 300.0, serialized: bool = False) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number.")
+        self.max_bytes: int = max_bytes
+        self.ttl: Optional[float] = ttl
+        self.serialized: bool = serialized
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._tags: Dict[Hashable, Set[Hashable]] = {}
+        self._nbytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._expirations: int = 0
+
+    @staticmethod
+    def key(builder: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+        """
+        Returns the key of a builder call, keyword argument order aside.
+        """
+        return (builder, args, tuple(sorted(kwargs.items()))) if kwargs else (builder, args)
+
+    def get(self, key: Hashable) -> Optional[Embed]:
+        """
+        Returns the embed cached under ``key``, or ``None``.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires is not None and entry.expires <= monotonic():
+                self._remove(key)
+                self._expirations += 1
+            elif self.serialized:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return Embed.fromTrusted(json.loads(entry.value))
+            elif entry.value.toJSON() == entry.encoded:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.value
+            else:
+                # changed in place by a caller, don't hand it out again
+                self._remove(key)
+        self._misses += 1
+        return None
+
+    def set(
+        self,
+        key: Hashable,
+        embed: Embed,
+        *,
+        tags: Iterable[Hashable] = (),
+        ttl: Optional[float] = None
+    ) -> None:
+        """
+        Caches an embed under ``key``.
+
+        Parameters
+        ----------
+        key: Hashable
+            The key, see :meth:`key`.
+        embed: Embed
+            The finished embed.
+        tags: Iterable[Hashable]
+            The tags :meth:`invalidate_tag` can drop the entry by.
+        ttl: Optional[float]
+            The lifetime of the entry, defaults to the cache`s ``ttl``.
+        """
+        encoded = embed.toJSON()
+        if self.serialized:
+            value, nbytes = encoded, len(encoded) + _ENTRY_OVERHEAD
+        else:
+            value, nbytes = embed, len(encoded) * _EMBED_FACTOR + _ENTRY_OVERHEAD
+        if key in self._entries:
+            self._remove(key)
+        if nbytes > self.max_bytes:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        entry = _Entry(value, encoded, nbytes, None if ttl is None else monotonic() + ttl, tuple(tags))
+        self._entries[key] = entry
+        self._nbytes += nbytes
+        for tag in entry.tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while self._nbytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._nbytes -= entry.nbytes
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def render(self, builder: Callable[..., Embed], /, *args: Any, **kwargs: Any) -> Embed:
+        """
+        Returns the cached result of ``builder(*args, **kwargs)``, calling
+        it on a miss. Calls with unhashable arguments are not cached.
+        """
+        key = self.key(builder, args, kwargs)
+        try:
+            embed = self.get(key)
+        except TypeError:
+            return builder(*args, **kwargs)
+        if embed is None:
+            embed = builder(*args, **kwargs)
+            self.set(key, embed)
+        return embed
+
+    def cached(
+        self,
+        *,
+        tags: Optional[Callable[..., Iterable[Hashable]]] = None,
+        ttl: Optional[float] = None
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        A decorator caching the embeds a builder function returns, sync
+        or async.
+
+        Parameters
+        ----------
+        tags: Optional[Callable[..., Iterable[Hashable]]]
+            Called with the builder`s arguments, returns the tags of the
+            rendered embed.
+        ttl: Optional[float]
+            The lifetime of the entries, defaults to the cache`s ``ttl``.
+        """
+
+        def decorator(builder: Callable[..., Any]) -> Callable[..., Any]:
+            if iscoroutinefunction(builder):
+
+                @wraps(builder)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Embed:
+                    key = self.key(builder, args, kwargs)
+                    try:
+                        embed = self.get(key)
+                    except TypeError:
+                        return await builder(*args, **kwargs)
+                    if embed is None:
+                        embed = await builder(*args, **kwargs)
+                        self.set(key, embed, tags=tags(*args, **kwargs) if tags else (), ttl=ttl)
+                    return embed
+
+                return async_wrapper
+
+            @wraps(builder)
+            def wrapper(*args: Any, **kwargs: Any) -> Embed:
+                key = self.key(builder, args, kwargs)
+                try:
+                    embed = self.get(key)
+                except TypeError:
+                    return builder(*args, **kwargs)
+                if embed is None:
+                    embed = builder(*args, **kwargs)
+                    self.set(key, embed, tags=tags(*args, **kwargs) if tags else (), ttl=ttl)
+                return embed
+
+            return wrapper
+
+        return decorator
+
+    def invalidate(self, key: Hashable) -> bool:
+        """
+        Drops the entry cached under ``key``.
+
+        Returns
+        -------
+        bool
+            Whether there was one.
+        """
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def invalidate_tag(self, tag: Hashable) -> int:
+        """
+        Drops every entry with ``tag``.
+
+        Returns
+        -------
+        int
+            The number of entries dropped.
+        """
+        keys = self._tags.pop(tag, ())
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def expire(self) -> int:
+        """
+        Drops the expired entries now instead of on their next lookup.
+
+        Returns
+        -------
+        int
+            The number of entries dropped.
+        """
+        now = monotonic()
+        expired = [key for key, entry in self._entries.items() if entry.expires is not None and entry.expires <= now]
+        for key in expired:
+            self._remove(key)
+        self._expirations += len(expired)
+        return len(expired)
+
+    def stats(self) -> RenderCacheStats:
+        return RenderCacheStats(
+            self._hits,
+            self._misses,
+            self._evictions,
+            self._expirations,
+            len(self._entries),
+            self._nbytes,
+            self.max_bytes,
+        )
+
+    def clear(self) -> None:
+        """
+        Drops every entry and resets the statistics.
+        """
+        self._entries.clear()
+        self._tags.clear()
+        self._nbytes = 0
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return "RenderCache(size={},nbytes={},max_bytes={})".format(len(self._entries), self._nbytes, self.max_bytes)
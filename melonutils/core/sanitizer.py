@@ -0,0 +1,99 @@
+import re
+from functools import lru_cache
+from typing import Any, Iterable, List, Match, Tuple
+
+__all__: Tuple[str, ...] = (
+    "sanitize",
+    "sanitize_many",
+    "sanitize_cache_info",
+    "clear_sanitize_cache",
+)
+
+SANITIZE_CACHE_SIZE: int = 4096
+
+# These mirror `discord.utils.escape_mentions` and `discord.utils.remove_markdown`,
+# merged into one alternation so the text is scanned a single time.
+_MENTION = r"@(everyone|here|[!&]?[0-9]{17,20})"
+_URL = r"(?P<url><[^: >]+:\/[^ >]+>|(?:https?|steam):\/\/[^\s<]+[^<.,:;\"\'\]\s])"
+_MARKDOWN = r"(?P<markdown>[_\\~|\*`]|^>(?:>>)?\s|\[.+\]\(.+\)|^#{1,3}|^\s*-)"
+
+_MENTION_REGEX = re.compile(_MENTION)
+_SANITIZE_REGEX = re.compile(rf"{_URL}|(?P<mention>@(?P<target>everyone|here|[!&]?[0-9]{{17,20}}))|{_MARKDOWN}", re.MULTILINE)
+
+
+def _replace(match: Match[str]) -> str:
+    url = match["url"]
+    if url is not None:
+        # mentions inside links are escaped, but the link itself is kept
+        return _MENTION_REGEX.sub("@\u200b\\1", url) if "@" in url else url
+    target = match["target"]
+    if target is not None:
+        return "@\u200b" + target
+    return ""
+
+
+def _sanitize(text: str) -> str:
+    return _SANITIZE_REGEX.sub(_replace, text)
+
+
+_sanitize_cached = lru_cache(maxsize=SANITIZE_CACHE_SIZE)(_sanitize)
+
+
+def sanitize(entity: Any, *, cached: bool = False) -> str:
+    """
+    Returns the string of an object with discord markdown removed
+    and mentions escaped.
+
+    Gives the same result as
+    ``remove_markdown(escape_mentions(str(entity)))`` from ``discord.utils``,
+    but scans the text once.
+
+    Parameters
+    ----------
+    entity: Any
+        The object to sanitize.
+    cached: bool
+        Whether to keep the result in a bounded LRU cache, useful for
+        inputs that repeat a lot such as usernames.
+
+    Returns
+    -------
+    str
+        The sanitized string.
+    """
+    text = str(entity)
+    return _sanitize_cached(text) if cached else _sanitize(text)
+
+
+def sanitize_many(entities: Iterable[Any], *, cached: bool = False) -> List[str]:
+    """
+    Sanitizes many objects at once, see :func:`sanitize`.
+
+    Parameters
+    ----------
+    entities: Iterable[Any]
+        The objects to sanitize.
+    cached: bool
+        Whether to use the bounded LRU cache.
+
+    Returns
+    -------
+    List[str]
+        One sanitized string per object, in the same order.
+    """
+    func = _sanitize_cached if cached else _sanitize
+    return [func(str(entity)) for entity in entities]
+
+
+def sanitize_cache_info():
+    """
+    Returns the hit/miss statistics of the sanitize cache.
+    """
+    return _sanitize_cached.cache_info()
+
+
+def clear_sanitize_cache() -> None:
+    """
+    Empties the sanitize cache.
+    """
+    _sanitize_cached.cache_clear()
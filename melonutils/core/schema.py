@@ -0,0 +1,446 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .validators import validate_url
+
+__all__: Tuple[str, ...] = (
+    "SchemaViolation",
+    "SchemaError",
+    "Rule",
+    "String",
+    "Url",
+    "Integer",
+    "Boolean",
+    "OneOf",
+    "Timestamp",
+    "Object",
+    "Array",
+    "CompiledSchema",
+    "compile_schema",
+    "AUTHOR_SCHEMA",
+    "FOOTER_SCHEMA",
+    "IMAGE_SCHEMA",
+    "VIDEO_SCHEMA",
+    "PROVIDER_SCHEMA",
+    "FIELD_SCHEMA",
+    "EMBED_SCHEMA",
+    "validate_embed",
+)
+
+# discord`s embed limits, the only place they are defined
+TITLE_LIMIT: int = 256
+DESCRIPTION_LIMIT: int = 2048
+AUTHOR_NAME_LIMIT: int = 256
+FOOTER_TEXT_LIMIT: int = 2048
+FIELD_NAME_LIMIT: int = 256
+FIELD_VALUE_LIMIT: int = 1024
+MAX_FIELDS: int = 25
+MAX_TOTAL_LENGTH: int = 6000
+
+
+class SchemaViolation(NamedTuple):
+    """
+    A single problem found in a payload, ``path`` is e.g. ``fields[3].value``.
+    """
+
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return "{}: {}".format(self.path, self.message) if self.path else self.message
+
+
+class SchemaError(ValueError):
+    """
+    Raised with every violation found in a payload.
+    """
+
+    def __init__(self, violations: List[SchemaViolation]) -> None:
+        self.violations: List[SchemaViolation] = violations
+        super().__init__("; ".join(map(str, violations)))
+
+
+class _Codegen:
+    __slots__: Tuple[str, ...] = (
+        "lines",
+        "constants",
+        "_counter",
+    )
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self._counter: int = 0
+
+    def var(self, prefix: str = "v") -> str:
+        self._counter += 1
+        return "{}{}".format(prefix, self._counter)
+
+    def const(self, value: Any) -> str:
+        name = "_c{}".format(len(self.constants))
+        self.constants[name] = value
+        return name
+
+    def line(self, level: int, text: str) -> None:
+        self.lines.append("    " * level + text)
+
+    def error(self, level: int, path: str, message: str) -> None:
+        # paths and messages are f-strings, only formatted when a check fails
+        self.line(level, "errors.append(_Violation(f{!r}, f{!r}))".format(path, message))
+
+
+class Rule:
+    """
+    The base of the schema rules, a rule checks one value of a payload.
+
+    Parameters
+    ----------
+    required: bool
+        Whether the value must be present and not ``None``.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "required",
+    )
+
+    def __init__(self, *, required: bool = False) -> None:
+        self.required: bool = required
+
+    def _emit(self, gen: _Codegen, value: str, path: str, level: int) -> None:
+        raise NotImplementedError("Subclasses should implement the method!")
+
+
+class String(Rule):
+    """
+    A string of at most ``max_length`` characters. Strings with
+    ``counted`` set add up towards the total length limit of the schema.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "max_length",
+        "counted",
+    )
+
+    def __init__(self, max_length: Optional[int] = None, *, required: bool = False, counted: bool = False) -> None:
+        super().__init__(required=required)
+        self.max_length: Optional[int] = max_length
+        self.counted: bool = counted
+
+    def _emit(self, gen: _Codegen, value: str, path: str, level: int) -> None:
+        gen.line(level, "if type({}) is not str:".format(value))
+        gen.error(level + 1, path, "must be a string, got {type(%s).__name__}" % value)
+        if self.max_length is None and not self.counted:
+            return
+        gen.line(level, "else:")
+        if self.max_length is not None:
+            gen.line(level + 1, "if len({}) > {}:".format(value, self.max_length))
+            gen.error(level + 2, path, "must be at most %d characters, got {len(%s)}" % (self.max_length, value))
+        if self.counted:
+            gen.line(level + 1, "total += len({})".format(value))
+        else:
+            gen.line(level + 1, "pass")
+
+
+class Url(Rule):
+    """
+    A url accepted by :func:`validate_url`.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def _emit(self, gen: _Codegen, value: str, path: str, level: int) -> None:
+        gen.line(level, "if not _validate_url({}):".format(value))
+        gen.error(level + 1, path, "is not a valid url")
+
+
+class Integer(Rule):
+    """
+    An integer between ``minimum`` and ``maximum``, booleans are rejected.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "minimum",
+        "maximum",
+    )
+
+    def __init__(self, minimum: Optional[int] = None, maximum: Optional[int] = None, *, required: bool = False) -> None:
+        super().__init__(required=required)
+        self.minimum: Optional[int] = minimum
+        self.maximum: Optional[int] = maximum
+
+    def _emit(self, gen: _Codegen, value: str, path: str, level: int) -> None:
+        gen.line(level, "if type({}) is not int:".format(value))
+        gen.error(level + 1, path, "must be an integer, got {type(%s).__name__}" % value)
+        if self.minimum is not None:
+            gen.line(level, "elif {} < {}:".format(value, self.minimum))
+            gen.error(level + 1, path, "must be at least %d, got {%s}" % (self.minimum, value))
+        if self.maximum is not None:
+            gen.line(level, "elif {} > {}:".format(value, self.maximum))
+            gen.error(level + 1, path, "must be at most %d, got {%s}" % (self.maximum, value))
+
+
+class Boolean(Rule):
+    __slots__: Tuple[str, ...] = ()
+
+    def _emit(self, gen: _Codegen, value: str, path: str, level: int) -> None:
+        gen.line(level, "if type({}) is not bool:".format(value))
+        gen.error(level + 1, path, "must be a boolean, got {type(%s).__name__}" % value)
+
+
+class OneOf(Rule):
+    """
+    One of a fixed set of strings.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "values",
+    )
+
+    def __init__(self, *values: str, required: bool = False) -> None:
+        super().__init__(required=required)
+        self.values: Tuple[str, ...] = values
+
+    def _emit(self, gen: _Codegen, value: str, path: str, level: int) -> None:
+        choices = gen.const(frozenset(self.values))
+        gen.line(level, "if type({0}) is not str or {0} not in {1}:".format(value, choices))
+        gen.error(level + 1, path, "must be one of %s, got {%s!r}" % (", ".join(self.values), value))
+
+
+class Timestamp(Rule):
+    """
+    A datetime, or its ISO 8601 string form.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def _emit(self, gen: _Codegen, value: str, path: str, level: int) -> None:
+        gen.line(level, "if type({}) is str:".format(value))
+        gen.line(level + 1, "try:")
+        gen.line(level + 2, "_fromisoformat({})".format(value))
+        gen.line(level + 1, "except ValueError:")
+        gen.error(level + 2, path, "is not an ISO 8601 timestamp")
+        gen.line(level, "elif not isinstance({}, _datetime):".format(value))
+        gen.error(level + 1, path, "must be a timestamp, got {type(%s).__name__}" % value)
+
+
+class Object(Rule):
+    """
+    A dict with known keys, unknown keys are ignored.
+
+    Parameters
+    ----------
+    properties: Dict[str, Rule]
+        The rule of each key.
+    max_total_length: Optional[int]
+        The limit on the combined length of the ``counted`` strings.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "properties",
+        "max_total_length",
+    )
+
+    def __init__(
+        self,
+        properties: Dict[str, Rule],
+        *,
+        required: bool = False,
+        max_total_length: Optional[int] = None
+    ) -> None:
+        super().__init__(required=required)
+        self.properties: Dict[str, Rule] = properties
+        self.max_total_length: Optional[int] = max_total_length
+
+    def _emit(self, gen: _Codegen, value: str, path: str, level: int) -> None:
+        gen.line(level, "if type({}) is not dict:".format(value))
+        gen.error(level + 1, path, "must be an object, got {type(%s).__name__}" % value)
+        gen.line(level, "else:")
+        for key, rule in self.properties.items():
+            item = gen.var()
+            child = "{}.{}".format(path, key) if path else key
+            gen.line(level + 1, "{} = {}.get({!r})".format(item, value, key))
+            gen.line(level + 1, "if {} is not None:".format(item))
+            rule._emit(gen, item, child, level + 2)
+            if rule.required:
+                gen.line(level + 1, "else:")
+                gen.error(level + 2, child, "is required")
+        if self.max_total_length is not None:
+            gen.line(level + 1, "if total > {}:".format(self.max_total_length))
+            gen.error(
+                level + 2,
+                path,
+                "total length must be at most %d characters, got {total}" % self.max_total_length
+            )
+
+
+class Array(Rule):
+    """
+    A list whose items all follow ``items``.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "items",
+        "max_items",
+    )
+
+    def __init__(self, items: Rule, *, max_items: Optional[int] = None, required: bool = False) -> None:
+        super().__init__(required=required)
+        self.items: Rule = items
+        self.max_items: Optional[int] = max_items
+
+    def _emit(self, gen: _Codegen, value: str, path: str, level: int) -> None:
+        index, item = gen.var("i"), gen.var()
+        gen.line(level, "if not isinstance({}, (list, tuple)):".format(value))
+        gen.error(level + 1, path, "must be a list, got {type(%s).__name__}" % value)
+        gen.line(level, "else:")
+        if self.max_items is not None:
+            gen.line(level + 1, "if len({}) > {}:".format(value, self.max_items))
+            gen.error(level + 2, path, "must have at most %d items, got {len(%s)}" % (self.max_items, value))
+        gen.line(level + 1, "for {}, {} in enumerate({}):".format(index, item, value))
+        gen.line(level + 2, "if {} is None:".format(item))
+        gen.error(level + 3, "%s[{%s}]" % (path, index), "must not be null")
+        gen.line(level + 2, "else:")
+        self.items._emit(gen, item, "%s[{%s}]" % (path, index), level + 3)
+
+
+class CompiledSchema:
+    """
+    A schema turned into a single generated function, which checks a
+    whole payload in one traversal and collects every violation.
+
+    Calling it returns the list of violations, empty for a valid payload.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "rule",
+        "source",
+        "_func",
+    )
+
+    def __init__(self, rule: Rule, source: str, func: Callable[[Any], List[SchemaViolation]]) -> None:
+        self.rule: Rule = rule
+        self.source: str = source
+        self._func: Callable[[Any], List[SchemaViolation]] = func
+
+    def __call__(self, data: Any) -> List[SchemaViolation]:
+        return self._func(data)
+
+    def check(self, data: Any) -> None:
+        """
+        Raises :class:`SchemaError` listing every violation in ``data``.
+        """
+        errors = self._func(data)
+        if errors:
+            raise SchemaError(errors)
+
+    def __repr__(self) -> str:
+        return "CompiledSchema(rule={})".format(self.rule.__class__.__name__)
+
+
+def compile_schema(rule: Rule) -> CompiledSchema:
+    """
+    Compiles a schema into a validator.
+
+    Parameters
+    ----------
+    rule: Rule
+        The rule of the whole payload, usually an :class:`Object`.
+
+    Returns
+    -------
+    CompiledSchema
+        The validator.
+    """
+    gen = _Codegen()
+    gen.line(0, "def validate(data):")
+    gen.line(1, "errors = []")
+    gen.line(1, "total = 0")
+    gen.line(1, "if data is None:")
+    if rule.required:
+        gen.error(2, "", "is required")
+    else:
+        gen.line(2, "return errors")
+    rule._emit(gen, "data", "", 1)
+    gen.line(1, "return errors")
+    source = "\n".join(gen.lines) + "\n"
+
+    namespace: Dict[str, Any] = {
+        "_Violation": SchemaViolation,
+        "_validate_url": validate_url,
+        "_fromisoformat": datetime.fromisoformat,
+        "_datetime": datetime,
+        **gen.constants,
+    }
+    exec(compile(source, "<schema>", "exec"), namespace)
+    return CompiledSchema(rule, source, namespace["validate"])
+
+
+AUTHOR_SCHEMA: Object = Object({
+    "name": String(AUTHOR_NAME_LIMIT, required=True, counted=True),
+    "url": Url(),
+    "icon_url": Url(),
+    "proxy_icon_url": Url(),
+})
+
+FOOTER_SCHEMA: Object = Object({
+    "text": String(FOOTER_TEXT_LIMIT, counted=True),
+    "icon_url": Url(),
+    "proxy_icon_url": Url(),
+})
+
+IMAGE_SCHEMA: Object = Object({
+    "url": Url(required=True),
+    "proxy_url": Url(),
+    "height": Integer(0),
+    "width": Integer(0),
+})
+
+VIDEO_SCHEMA: Object = Object({
+    "url": Url(required=True),
+    "height": Integer(0),
+    "width": Integer(0),
+})
+
+PROVIDER_SCHEMA: Object = Object({
+    "name": String(),
+    "url": Url(),
+})
+
+FIELD_SCHEMA: Object = Object({
+    "name": String(FIELD_NAME_LIMIT, required=True, counted=True),
+    "value": String(FIELD_VALUE_LIMIT, required=True, counted=True),
+    "inline": Boolean(),
+})
+
+EMBED_SCHEMA: Object = Object({
+    # the values of `EmbedType`
+    "type": OneOf("rich", "image", "video", "gifv", "article", "link"),
+    "title": String(TITLE_LIMIT, counted=True),
+    "description": String(DESCRIPTION_LIMIT, counted=True),
+    "url": Url(),
+    "timestamp": Timestamp(),
+    "color": Integer(0, 0xFFFFFF),
+    "author": AUTHOR_SCHEMA,
+    "footer": FOOTER_SCHEMA,
+    "thumbnail": IMAGE_SCHEMA,
+    "image": IMAGE_SCHEMA,
+    "video": VIDEO_SCHEMA,
+    "provider": PROVIDER_SCHEMA,
+    "fields": Array(FIELD_SCHEMA, max_items=MAX_FIELDS),
+}, max_total_length=MAX_TOTAL_LENGTH)
+
+validate_embed: CompiledSchema = compile_schema(EMBED_SCHEMA)
+
+# used by the embed and property object constructors
+_HEAD: CompiledSchema = compile_schema(Object({
+    "title": EMBED_SCHEMA.properties["title"],
+    "description": EMBED_SCHEMA.properties["description"],
+    "color": EMBED_SCHEMA.properties["color"],
+}))
+_AUTHOR: CompiledSchema = compile_schema(AUTHOR_SCHEMA)
+_FOOTER: CompiledSchema = compile_schema(FOOTER_SCHEMA)
+_IMAGE: CompiledSchema = compile_schema(IMAGE_SCHEMA)
+_VIDEO: CompiledSchema = compile_schema(VIDEO_SCHEMA)
+_PROVIDER: CompiledSchema = compile_schema(PROVIDER_SCHEMA)
+_FIELD: CompiledSchema = compile_schema(FIELD_SCHEMA)
+_FIELDS: CompiledSchema = compile_schema(Object({"fields": Array(FIELD_SCHEMA)}))
@@ -0,0 +1,312 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+
+from .embed import Embed
+from .lazy import LazyEmbed
+from .schema import validate_embed
+
+__all__: Tuple[str, ...] = (
+    "EmbedStoreStats",
+    "EmbedStore",
+)
+
+_MAGIC: bytes = b"MLES\x01"
+# flags, name length, payload length
+_HEADER = struct.Struct("<BHI")
+
+_COMPRESSED: int = 0x01
+_DELETED: int = 0x02
+
+# payload offset, payload length, flags, record size
+_Entry = Tuple[int, int, int, int]
+
+
+class EmbedStoreStats(NamedTuple):
+    entries: int
+    compressed: int
+    file_size: int
+    garbage: int
+
+    @property
+    def garbage_ratio(self) -> float:
+        return self.garbage / self.file_size if self.file_size else 0.0
+
+
+class EmbedStore:
+    """
+    A file of saved embeds, e.g. for tag and custom command cogs, that
+    only decodes an embed when it is fetched.
+
+    Records are appended to a single file as compact json, compressed
+    with zlib past ``compress_threshold`` bytes. Opening the store only
+    reads the record headers to build a name to offset index, the file
+    itself is memory-mapped and left to the page cache.
+
+    Overwritten and deleted records stay in the file until it is
+    compacted, which happens on its own once they take up more than
+    ``compact_ratio`` of it, or by calling :meth:`compact`.
+
+    .. code-block:: python3
+
+        >>> store = EmbedStore(cog_data_path(self) / "tags.embeds")
+        >>> store.put("rules", embed)
+        >>> await ctx.send(embed=store.get("rules"))
+
+    The store is meant for a single process on a local filesystem, and
+    its methods block on disk I/O.
+
+    Parameters
+    ----------
+    path: Union[str, os.PathLike]
+        The file to use, it is created when missing.
+    compress_threshold: Optional[int]
+        The encoded size from which entries are compressed, ``None`` to
+        never compress.
+    compact_ratio: float
+        The share of dead records that triggers a compaction.
+    compact_min_size: int
+        The file size under which no automatic compaction happens.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "path",
+        "compress_threshold",
+        "compact_ratio",
+        "compact_min_size",
+        "_file",
+        "_map",
+        "_index",
+        "_size",
+        "_garbage",
+    )
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        compress_threshold: Optional[int] = 1024,
+        compact_ratio: float = 0.5,
+        compact_min_size: int = 1 << 20
+    ) -> None:
+        if not 0 < compact_ratio <= 1:
+            raise ValueError("compact_ratio must be between 0 and 1.")
+        self.path: str = os.fspath(path)
+        self.compress_threshold: Optional[int] = compress_threshold
+        self.compact_ratio: float = compact_ratio
+        self.compact_min_size: int = compact_min_size
+        self._file: Any = None
+        self._map: Optional[mmap.mmap] = None
+        self._index: Dict[str, _Entry] = {}
+        self._size: int = 0
+        self._garbage: int = 0
+        self._open()
+
+    def _open(self) -> None:
+        mode = "r+b" if os.path.exists(self.path) else "w+b"
+        self._file = open(self.path, mode)
+        self._size = os.fstat(self._file.fileno()).st_size
+        if self._size == 0:
+            self._file.write(_MAGIC)
+            self._file.flush()
+            self._size = len(_MAGIC)
+        if self._view()[:len(_MAGIC)] != _MAGIC:
+            self.close()
+            raise ValueError("{} is not an embed store.".format(self.path))
+        self._scan()
+
+    def _view(self, end: Optional[int] = None) -> mmap.mmap:
+        # appends grow the file past the mapping, it is only remapped once
+        # a read reaches past its end
+        if self._map is None or len(self._map) < (self._size if end is None else end):
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _scan(self) -> None:
+        view = self._view()
+        index = self._index
+        index.clear()
+        garbage = 0
+        offset = len(_MAGIC)
+        end = self._size
+        while offset + _HEADER.size <= end:
+            flags, name_length, length = _HEADER.unpack_from(view, offset)
+            start = offset + _HEADER.size + name_length
+            if start + length > end:
+                break
+            name = view[offset + _HEADER.size:start].decode("utf-8")
+            record = start + length - offset
+            previous = index.pop(name, None)
+            if previous is not None:
+                garbage += previous[3]
+            if flags & _DELETED:
+                garbage += record
+            else:
+                index[name] = (start, length, flags, record)
+            offset += record
+        if offset != end:
+            # an interrupted write, the torn record is dropped
+            self._map.close()
+            self._map = None
+            self._file.truncate(offset)
+            self._size = offset
+        self._garbage = garbage
+
+    def _append(self, name: str, flags: int, payload: bytes) -> _Entry:
+        encoded_name = name.encode("utf-8")
+        if len(encoded_name) > 0xFFFF:
+            raise ValueError("Entry names must be shorter than 65536 bytes.")
+        self._file.seek(self._size)
+        self._file.write(_HEADER.pack(flags, len(encoded_name), len(payload)) + encoded_name + payload)
+        self._file.flush()
+        start = self._size + _HEADER.size + len(encoded_name)
+        record = _HEADER.size + len(encoded_name) + len(payload)
+        self._size += record
+        return start, len(payload), flags, record
+
+    @staticmethod
+    def _encode(embed: Union[Embed, Dict[str, Any]]) -> bytes:
+        if isinstance(embed, dict):
+            validate_embed.check(embed)
+            embed = Embed.fromTrusted(embed)
+        elif not isinstance(embed, Embed):
+            raise TypeError("Expected Embed or Dict[str, Any], caught {}".format(embed.__class__))
+        else:
+            embed.validate_length()
+        return embed.toJSON()
+
+    def put(self, name: str, embed: Union[Embed, Dict[str, Any]]) -> None:
+        """
+        Saves an embed under ``name``, replacing the previous one.
+
+        Raises
+        ------
+        SchemaError
+            A payload dict is not a valid embed.
+        """
+        payload = self._encode(embed)
+        flags = 0
+        if self.compress_threshold is not None and len(payload) >= self.compress_threshold:
+            compressed = zlib.compress(payload)
+            if len(compressed) < len(payload):
+                payload, flags = compressed, _COMPRESSED
+        entry = self._append(name, flags, payload)
+        previous = self._index.pop(name, None)
+        if previous is not None:
+            self._garbage += previous[3]
+        self._index[name] = entry
+        self._maybe_compact()
+
+    def _payload(self, name: str) -> Optional[bytes]:
+        entry = self._index.get(name)
+        if entry is None:
+            return None
+        start, length, flags, _ = entry
+        payload = self._view(start + length)[start:start + length]
+        if flags & _COMPRESSED:
+            payload = zlib.decompress(payload)
+        return payload
+
+    def get_raw(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the payload dict saved under ``name``, or ``None``.
+        """
+        payload = self._payload(name)
+        return None if payload is None else json.loads(payload)
+
+    def get(self, name: str, *, lazy: bool = False) -> Optional[Embed]:
+        """
+        Returns the embed saved under ``name``, or ``None``.
+
+        Stored embeds were validated when they were saved, so they are
+        rebuilt with :meth:`Embed.fromTrusted`, or as a trusted
+        :class:`LazyEmbed` with ``lazy=True``.
+        """
+        data = self.get_raw(name)
+        if data is None:
+            return None
+        return LazyEmbed(data, trusted=True) if lazy else Embed.fromTrusted(data)
+
+    def delete(self, name: str) -> bool:
+        """
+        Removes the embed saved under ``name``.
+
+        Returns
+        -------
+        bool
+            Whether there was one.
+        """
+        previous = self._index.pop(name, None)
+        if previous is None:
+            return False
+        record = self._append(name, _DELETED, b"")[3]
+        self._garbage += previous[3] + record
+        self._maybe_compact()
+        return True
+
+    def _maybe_compact(self) -> None:
+        if self._size >= self.compact_min_size and self._garbage > self._size * self.compact_ratio:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Rewrites the file with only the live records, replacing it atomically.
+        """
+        temp = self.path + ".tmp"
+        index: Dict[str, _Entry] = {}
+        offset = len(_MAGIC)
+        view = self._view()
+        with open(temp, "wb") as file:
+            file.write(_MAGIC)
+            for name, (start, length, flags, _) in self._index.items():
+                encoded_name = name.encode("utf-8")
+                file.write(_HEADER.pack(flags, len(encoded_name), length) + encoded_name)
+                file.write(view[start:start + length])
+                record = _HEADER.size + len(encoded_name) + length
+                index[name] = (offset + record - length, length, flags, record)
+                offset += record
+            file.flush()
+            os.fsync(file.fileno())
+        self._map.close()
+        self._map = None
+        self._file.close()
+        os.replace(temp, self.path)
+        self._file = open(self.path, "r+b")
+        self._size = offset
+        self._index = index
+        self._garbage = 0
+
+    def stats(self) -> EmbedStoreStats:
+        compressed = sum(1 for entry in self._index.values() if entry[2] & _COMPRESSED)
+        return EmbedStoreStats(len(self._index), compressed, self._size, self._garbage)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "EmbedStore":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._index))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return "EmbedStore(path={!r},entries={},size={})".format(self.path, len(self._index), self._size)
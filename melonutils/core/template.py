@@ -0,0 +1,229 @@
+from string import Formatter
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+from .embed import Embed
+from .object import Fields, _reindex
+from .schema import (
+    _FIELD,
+    EMBED_SCHEMA,
+    MAX_FIELDS,
+    MAX_TOTAL_LENGTH,
+    CompiledSchema,
+    Object,
+    SchemaError,
+    SchemaViolation,
+    compile_schema,
+)
+
+__all__: Tuple[str, ...] = (
+    "EmbedTemplate",
+)
+
+# keys which may contain placeholders, they map 1:1 onto `Embed` arguments
+_DYNAMIC_KEYS: FrozenSet[str] = frozenset((
+    "title",
+    "url",
+    "description",
+    "author",
+    "footer",
+    "thumbnail",
+    "image",
+    "provider",
+    "fields",
+))
+
+# the counted text of the templated property dicts
+_COUNTED_KEYS: Dict[str, str] = {
+    "author": "name",
+    "footer": "text",
+}
+
+_formatter = Formatter()
+
+
+def _collect(value: Any, names: Set[str]) -> bool:
+    if isinstance(value, str):
+        found = False
+        for _, field_name, _, _ in _formatter.parse(value):
+            if field_name is not None:
+                names.add(field_name.split(".", 1)[0].split("[", 1)[0])
+                found = True
+        return found
+    if isinstance(value, dict):
+        return any([_collect(item, names) for item in value.values()])
+    if isinstance(value, (list, tuple)):
+        return any([_collect(item, names) for item in value])
+    return False
+
+
+class _Slot:
+    """
+    A templated string, or a property dict with templated strings,
+    split up front so rendering is a flat loop over ``str.format_map``.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "text",
+        "items",
+    )
+
+    def __init__(self, value: Union[str, Dict[str, Any]]) -> None:
+        self.text: Optional[str] = value if isinstance(value, str) else None
+        self.items: Tuple[Tuple[str, Any, bool], ...] = () if self.text is not None else tuple(
+            (key, item, _collect(item, set())) for key, item in value.items()
+        )
+
+    def fill(self, values: Dict[str, Any]) -> Union[str, Dict[str, Any]]:
+        if self.text is not None:
+            return self.text.format_map(values)
+        return {key: item.format_map(values) if templated else item for key, item, templated in self.items}
+
+
+class EmbedTemplate:
+    """
+    An embed compiled once with ``str.format`` placeholders in its text.
+
+    Every part without placeholders is validated and json-encoded a single
+    time and shared by all rendered embeds; :meth:`render` only fills in
+    and validates the parts that do contain placeholders.
+
+    .. code-block:: python3
+
+        >>> welcome = EmbedTemplate({
+        >>>     "title": "Welcome {member}!",
+        >>>     "description": "You are member #{count} of {guild}.",
+        >>>     "footer": {"text": "MelonBot"},
+        >>> })
+        >>> embed = welcome.render(member=member, count=guild.member_count, guild=guild)
+
+    Rendered embeds share the static property objects, so replace them
+    through the embed`s setters instead of mutating them in place.
+
+    Parameters
+    ----------
+    source: Union[Embed, Dict[str, Any]]
+        The embed, or its json payload form, containing placeholders.
+
+    Raises
+    ------
+    ValueError
+        A placeholder was used in a part that cannot be templated
+        (``type``, ``color`` or ``timestamp``).
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "placeholders",
+        "_static",
+        "_dynamic",
+        "_fields",
+        "_slots",
+        "_length",
+        "_check",
+    )
+
+    def __init__(self, source: Union[Embed, Dict[str, Any]]) -> None:
+        data = source.toDict() if isinstance(source, Embed) else dict(source)
+        placeholders: Set[str] = set()
+        dynamic: Dict[str, Any] = {}
+        for key, value in data.items():
+            if _collect(value, placeholders):
+                if key not in _DYNAMIC_KEYS:
+                    raise ValueError("Embed property '{}' cannot contain placeholders.".format(key))
+                dynamic[key] = value
+
+        prototype = Embed.fromDict({key: value for key, value in data.items() if key not in dynamic})
+        prototype.toJSON()
+
+        self.placeholders: FrozenSet[str] = frozenset(placeholders)
+        # fed to `Embed.fromTrusted`, which keeps property objects as they are
+        self._static: Dict[str, Any] = {
+            "type": prototype.type,
+            "title": prototype.title,
+            "url": prototype.url,
+            "description": prototype.description,
+            "color": prototype.color,
+            "timestamp": prototype.timestamp,
+            "author": prototype.author,
+            "footer": prototype.footer,
+            "thumbnail": prototype.thumbnail,
+            "image": prototype.image,
+            "provider": prototype._provider,
+            "fields": prototype.fields,
+        }
+        # static fields are validated here once, rendering only checks the filled ones
+        self._fields: List[Union[Dict[str, Any], _Slot]] = []
+        if "fields" in dynamic:
+            for field in dynamic.pop("fields"):
+                if _collect(field, set()):
+                    self._fields.append(_Slot(field))
+                else:
+                    _FIELD.check(field)
+                    self._fields.append({"name": field["name"], "value": field["value"], "inline": field.get("inline") or False})
+        if len(self._fields) > MAX_FIELDS:
+            raise ValueError("Embed cannot have more than {} fields.".format(MAX_FIELDS))
+        # the positions of the templated fields among all fields, for error paths
+        self._slots: List[int] = [index for index, field in enumerate(self._fields) if isinstance(field, _Slot)]
+        # what the static parts count towards the combined length limit
+        self._length: int = prototype.total_length + sum(
+            len(field["name"]) + len(field["value"]) for field in self._fields if not isinstance(field, _Slot)
+        )
+        self._dynamic: Tuple[Tuple[str, _Slot], ...] = tuple((key, _Slot(value)) for key, value in dynamic.items())
+        rules = {key: EMBED_SCHEMA.properties[key] for key, _ in self._dynamic}
+        if self._fields:
+            rules["fields"] = EMBED_SCHEMA.properties["fields"]
+        self._check: CompiledSchema = compile_schema(Object(rules))
+
+    def render(self, **values: Any) -> Embed:
+        """
+        Returns a new embed with the placeholders filled in.
+
+        Only the filled in parts are validated, the static ones were
+        checked when the template was compiled.
+
+        Raises
+        ------
+        KeyError
+            A placeholder has no value.
+        SchemaError
+            A filled in part breaks its embed limit, or the embed breaks
+            the combined length limit.
+        """
+        filled: Dict[str, Any] = {key: slot.fill(values) for key, slot in self._dynamic}
+        if self._fields:
+            filled["fields"] = [field.fill(values) for field in self._fields if isinstance(field, _Slot)]
+        errors = self._check(filled)
+        if errors:
+            raise SchemaError([
+                _reindex(error, self._slots) if error.path.startswith("fields[") else error for error in errors
+            ])
+        total = self._length
+        for key, value in filled.items():
+            if key == "fields":
+                total += sum(len(field["name"]) + len(field["value"]) for field in value)
+            elif key in _COUNTED_KEYS:
+                total += len(value.get(_COUNTED_KEYS[key]) or "")
+            elif key in ("title", "description"):
+                total += len(value)
+        if total > MAX_TOTAL_LENGTH:
+            raise SchemaError([SchemaViolation(
+                "", "total length must be at most {} characters, got {}".format(MAX_TOTAL_LENGTH, total)
+            )])
+        data = self._static.copy()
+        data.update(filled)
+        if self._fields:
+            rendered = iter(filled["fields"])
+            data["fields"] = Fields.fromTrusted([
+                next(rendered) if isinstance(field, _Slot) else field for field in self._fields
+            ])
+        elif data["fields"] is not None:
+            data["fields"] = data["fields"].copy()
+        return Embed.fromTrusted(data)
+
+    def render_json(self, **values: Any) -> bytes:
+        """
+        Same as :meth:`render`, but returns the json encoding of the embed.
+        """
+        return self.render(**values).toJSON()
+
+    def __repr__(self) -> str:
+        return "EmbedTemplate(placeholders={})".format(sorted(self.placeholders))
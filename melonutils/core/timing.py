@@ -0,0 +1,179 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+__all__: Tuple[str, ...] = (
+    "TimingStats",
+    "TimingHistogram",
+    "get_histogram",
+    "get_timings",
+    "reset_timings",
+)
+
+# Each power of two is split into 4 sub-buckets, which bounds the error of a
+# reported percentile to 25% of the true value while keeping a fixed 256 slots.
+_SUB_BITS: int = 2
+_SUB_BUCKETS: int = 1 << _SUB_BITS
+_LINEAR: int = 1 << (_SUB_BITS + 1)
+_BUCKETS: int = 64 * _SUB_BUCKETS
+
+
+def _bucket_index(ns: int) -> int:
+    if ns < _LINEAR:
+        return ns if ns > 0 else 0
+    shift = ns.bit_length() - _SUB_BITS - 1
+    return min(shift * _SUB_BUCKETS + (ns >> shift), _BUCKETS - 1)
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    if index < _LINEAR:
+        return index, index + 1
+    shift, top = divmod(index, _SUB_BUCKETS)
+    shift -= 1
+    top += _SUB_BUCKETS
+    return top << shift, (top + 1) << shift
+
+
+class TimingStats(NamedTuple):
+    """
+    A snapshot of a :class:`TimingHistogram`, all durations in nanoseconds.
+
+    ``count`` and ``total_ns`` cover the timed calls only, ``calls`` counts
+    every call including the ones skipped by sampling.
+    """
+
+    name: str
+    count: int
+    total_ns: int
+    mean_ns: float
+    max_ns: int
+    p50_ns: int
+    p95_ns: int
+    p99_ns: int
+    calls: int
+
+
+class TimingHistogram:
+    """
+    A fixed-memory, log-bucketed histogram of call durations.
+
+    Parameters
+    ----------
+    name: str
+        The name the histogram is registered under.
+    sample_rate: float
+        The fraction of calls to time, e.g. ``0.1`` times every 10th call.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "name",
+        "sample_every",
+        "calls",
+        "total_ns",
+        "max_ns",
+        "buckets",
+    )
+
+    def __init__(self, name: str, *, sample_rate: float = 1.0) -> None:
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in the range (0, 1].")
+        self.name: str = name
+        self.sample_every: int = max(1, round(1 / sample_rate))
+        self.calls: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+        self.buckets: List[int] = [0] * _BUCKETS
+
+    def record(self, ns: int) -> None:
+        # `add_logging` inlines this method, keep both in sync
+        self.calls += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.buckets[_bucket_index(ns)] += 1
+
+    @property
+    def count(self) -> int:
+        """
+        The number of recorded durations, derived from the buckets to keep
+        the recording path to a single counter increment.
+        """
+        return sum(self.buckets)
+
+    def percentile(self, q: float) -> int:
+        """
+        Returns the upper bound of the bucket holding the ``q`` quantile,
+        capped at the largest recorded duration.
+
+        Parameters
+        ----------
+        q: float
+            The quantile, between 0 and 1.
+        """
+        count = self.count
+        if not count:
+            return 0
+        rank = q * count
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if hits and seen >= rank:
+                return min(_bucket_bounds(index)[1], self.max_ns)
+        return self.max_ns
+
+    def snapshot(self) -> TimingStats:
+        count = self.count
+        return TimingStats(
+            self.name,
+            count,
+            self.total_ns,
+            self.total_ns / count if count else 0.0,
+            self.max_ns,
+            self.percentile(0.50),
+            self.percentile(0.95),
+            self.percentile(0.99),
+            self.calls,
+        )
+
+    def reset(self) -> None:
+        self.calls = self.total_ns = self.max_ns = 0
+        # cleared in place, wrappers keep a reference to the list
+        self.buckets[:] = [0] * _BUCKETS
+
+    def __repr__(self) -> str:
+        return "TimingHistogram(name={!r},count={})".format(self.name, self.count)
+
+
+_histograms: Dict[str, TimingHistogram] = {}
+
+
+def get_histogram(name: str, *, sample_rate: float = 1.0) -> TimingHistogram:
+    """
+    Returns the histogram registered under ``name``, creating it if needed.
+    """
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = TimingHistogram(name, sample_rate=sample_rate)
+    return histogram
+
+
+def get_timings(name: Optional[str] = None) -> Dict[str, TimingStats]:
+    """
+    Returns snapshots of the registered histograms.
+
+    Parameters
+    ----------
+    name: Optional[str]
+        Only return the histogram with this name.
+    """
+    if name is not None:
+        histogram = _histograms.get(name)
+        return {name: histogram.snapshot()} if histogram is not None else {}
+    return {key: histogram.snapshot() for key, histogram in _histograms.items()}
+
+
+def reset_timings(name: Optional[str] = None) -> None:
+    """
+    Clears the recorded durations of one or every histogram.
+    """
+    for key, histogram in _histograms.items():
+        if name is None or key == name:
+            histogram.reset()
@@ -0,0 +1,129 @@
+import re
+from functools import lru_cache
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+__all__: Tuple[str, ...] = (
+    "URLValidationResult",
+    "validate_url",
+    "validate_urls",
+    "url_cache_info",
+    "clear_url_cache",
+)
+
+MAX_URL_LENGTH: int = 2048
+URL_CACHE_SIZE: int = 4096
+
+_LABEL = r"[^\W_](?:[\w-]{0,61}[^\W_])?"
+
+_HTTP_URL = re.compile(
+    rf"""
+    (?P<scheme>[Hh][Tt][Tt][Pp][Ss]?)://
+    (?P<host>
+        (?:{_LABEL}\.)*{_LABEL}
+        | \d{{1,3}}(?:\.\d{{1,3}}){{3}}
+        | \[[0-9A-Fa-f:.]+\]
+    )
+    (?::(?P<port>\d{{1,5}}))?
+    (?:[/?\#]\S*)?
+    """,
+    re.VERBOSE,
+)
+_ATTACHMENT_URL = re.compile(r"(?P<scheme>attachment)://(?P<host>[^\s/\\]+)")
+_SCHEME = re.compile(r"(?P<scheme>[A-Za-z][A-Za-z0-9+.-]*)://")
+
+
+class URLValidationResult(NamedTuple):
+    """
+    The outcome of validating a single url.
+
+    Instances are truthy only when the url is valid, so the result
+    can be used directly as a predicate.
+    """
+
+    url: Any
+    valid: bool
+    scheme: Optional[str] = None
+    host: Optional[str] = None
+    reason: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _validate(value: str) -> URLValidationResult:
+    if len(value) > MAX_URL_LENGTH:
+        return URLValidationResult(value, False, reason=f"url is longer than {MAX_URL_LENGTH} characters")
+
+    match = _HTTP_URL.fullmatch(value) or _ATTACHMENT_URL.fullmatch(value)
+    if match is not None:
+        scheme, host, port = match["scheme"].lower(), match["host"], match.groupdict().get("port")
+        if port is not None and int(port) > 65535:
+            return URLValidationResult(value, False, scheme, host, reason="port is out of range")
+        return URLValidationResult(value, True, scheme, host)
+
+    scheme = _SCHEME.match(value)
+    if scheme is None:
+        return URLValidationResult(value, False, reason="url has no scheme")
+    if scheme["scheme"].lower() not in ("http", "https", "attachment"):
+        return URLValidationResult(value, False, reason=f"unsupported scheme {scheme['scheme']!r}")
+    return URLValidationResult(value, False, scheme["scheme"].lower(), reason="malformed url")
+
+
+def validate_url(value: Any) -> URLValidationResult:
+    """
+    Validates a url usable in discord embeds.
+
+    Accepts ``http``/``https`` urls with a host name, ipv4 or ipv6 address
+    and ``attachment://`` urls referencing an uploaded file.
+    Results for strings are kept in a bounded LRU cache, since avatar
+    and icon urls repeat constantly.
+
+    Parameters
+    ----------
+    value: Any
+        The value to validate.
+
+    Returns
+    -------
+    URLValidationResult
+        The validation result, truthy if the url is valid.
+    """
+    if type(value) is not str:
+        return URLValidationResult(value, False, reason=f"expected str, caught {value.__class__.__name__}")
+    return _validate(value)
+
+
+def validate_urls(values: Iterable[Any]) -> List[URLValidationResult]:
+    """
+    Validates many urls at once.
+
+    Parameters
+    ----------
+    values: Iterable[Any]
+        The values to validate.
+
+    Returns
+    -------
+    List[URLValidationResult]
+        One result per value, in the same order.
+    """
+    cached = _validate
+    return [
+        cached(value) if type(value) is str else validate_url(value)
+        for value in values
+    ]
+
+
+def url_cache_info():
+    """
+    Returns the hit/miss statistics of the url validation cache.
+    """
+    return _validate.cache_info()
+
+
+def clear_url_cache() -> None:
+    """
+    Empties the url validation cache.
+    """
+    _validate.cache_clear()
@@ -0,0 +1,75 @@
+import random
+import re
+import unittest
+
+from melonutils.core import AnsiBuilder
+
+_SGR = re.compile("\u001b\\[([0-9;]*)m")
+
+
+def styled(text):
+    """
+    The visible characters of ``text`` with the style each one is shown
+    in, starting from the default style, and the style at the end.
+    """
+    fmt, fg, bg = 0, None, None
+    result = []
+    position = 0
+    for match in list(_SGR.finditer(text)) + [None]:
+        end = match.start() if match else len(text)
+        result.extend((char, (fmt, fg, bg)) for char in text[position:end] if char != "\n")
+        if match is None:
+            break
+        for code in map(int, match.group(1).split(";")):
+            if code == 0:
+                fmt, fg, bg = 0, None, None
+            elif code in (1, 4):
+                fmt = code
+            elif 30 <= code <= 37:
+                fg = code - 30
+            elif 40 <= code <= 47:
+                bg = code - 40
+        position = match.end()
+    return result, (fmt, fg, bg)
+
+
+class AnsiBuilderTest(unittest.TestCase):
+    def build(self, seed):
+        rng = random.Random(seed)
+        builder = AnsiBuilder()
+        for _ in range(rng.randrange(1, 60)):
+            text = "".join(rng.choice("ab `\n") for _ in range(rng.randrange(1, 80)))
+            builder.write(
+                text,
+                color=rng.choice([None, 1, 2, 7]),
+                bg=rng.choice([None, None, 0, 4]),
+                fmt=rng.choice([0, 1, 4]),
+            )
+        return builder
+
+    def test_chunks_keep_styles_and_end_reset(self):
+        for seed in range(200):
+            builder = self.build(seed)
+            expected, end = styled(builder.getvalue())
+            self.assertEqual(end, (0, None, None))
+            for limit in (40, 120, 2000):
+                with self.subTest(seed=seed, limit=limit):
+                    chars = []
+                    for block in builder.codeblocks(limit=limit):
+                        self.assertLessEqual(len(block), limit)
+                        self.assertTrue(block.startswith("```ansi\n") and block.endswith("\n```"))
+                        # every block is rendered on its own, from and back to the default style
+                        block_chars, block_end = styled(block[len("```ansi\n"):-len("\n```")])
+                        self.assertEqual(block_end, (0, None, None))
+                        chars.extend(block_chars)
+                    self.assertEqual(chars, expected)
+
+    def test_split_run_is_reset_and_restyled(self):
+        builder = AnsiBuilder().write("x" * 100, color=1, fmt=1)
+        first, second = list(builder.codeblocks(limit=80))
+        self.assertTrue(first.endswith("\u001b[0m\n```"))
+        self.assertTrue(second.startswith("```ansi\n\u001b[1;31m"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from melonutils.core import DATE_FORMAT, DateFormatter, discord_timestamp, discord_timestamps, format_dates
+from melonutils.core.helpers import format_date
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover
+    ZoneInfo = None
+
+
+class DateFormatterTest(unittest.TestCase):
+    def dates(self):
+        start = datetime(2024, 3, 1, 23, 58, 59, 999999)
+        zones = [None, timezone.utc, timezone(timedelta(hours=-5), "EST")]
+        return [(start + timedelta(seconds=17 * i)).replace(tzinfo=zone) for i in range(40) for zone in zones]
+
+    def test_matches_strftime(self):
+        formatter = DateFormatter("%a %d %b %Y %H:%M %Z %%S")
+        dates = self.dates()
+        expected = [date.strftime(formatter.fmt) for date in dates]
+        self.assertEqual([formatter.format(date) for date in dates], expected)
+        self.assertEqual(formatter.format_many(dates), expected)
+        self.assertEqual(format_dates(dates), [date.strftime(DATE_FORMAT) for date in dates])
+        self.assertEqual([format_date(date) for date in dates], [date.strftime(DATE_FORMAT) for date in dates])
+
+    @unittest.skipIf(ZoneInfo is None, "zoneinfo is not available")
+    def test_keeps_folds_apart(self):
+        try:
+            zone = ZoneInfo("America/New_York")
+        except Exception:
+            self.skipTest("no time zone data")
+        first = datetime(2024, 11, 3, 1, 30, tzinfo=zone)
+        second = first.replace(fold=1)
+        formatter = DateFormatter("%H:%M %Z")
+        self.assertEqual(formatter.format_many([first, second]), ["01:30 EDT", "01:30 EST"])
+
+    def test_rejects_sub_minute_formats(self):
+        for fmt in ("%S", "%H:%M:%S", "%f", "%c", "%-S"):
+            with self.assertRaises(ValueError):
+                DateFormatter(fmt)
+        with self.assertRaises(ValueError):
+            DateFormatter(maxsize=0)
+
+    def test_cache_is_bounded(self):
+        formatter = DateFormatter(maxsize=8)
+        dates = [datetime(2024, 1, 1) + timedelta(minutes=i) for i in range(20)]
+        self.assertEqual(formatter.format_many(dates), [date.strftime(DATE_FORMAT) for date in dates])
+        info = formatter.cache_info()
+        self.assertEqual((info.hits, info.misses, info.maxsize, info.currsize), (0, 20, 8, 8))
+        # the newest minutes are kept
+        formatter.format(dates[-1] + timedelta(seconds=30))
+        self.assertEqual(formatter.cache_info().hits, 1)
+        formatter.cache_clear()
+        self.assertEqual(formatter.cache_info(), (0, 0, 8, 0))
+
+
+class DiscordTimestampTest(unittest.TestCase):
+    def test_markup(self):
+        date = datetime(2021, 4, 20, 16, 20, 30, tzinfo=timezone.utc)
+        self.assertEqual(discord_timestamp(date), "<t:1618935630>")
+        self.assertEqual(discord_timestamp(date, "R"), "<t:1618935630:R>")
+        self.assertEqual(discord_timestamps([date, date], "f"), ["<t:1618935630:f>"] * 2)
+        with self.assertRaises(ValueError):
+            discord_timestamp(date, "x")
+        with self.assertRaises(ValueError):
+            discord_timestamps([date], "x")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+
+from discord import Color
+
+from melonutils.core import AuthorObject, Embed, EmbedPaginator, FooterObject, ImageObject, SchemaError
+
+
+class EmbedProtocolTest(unittest.TestCase):
+    def test_bool(self):
+        self.assertTrue(Embed(title="a"))
+        self.assertFalse(Embed(color=None))
+
+    def test_eq(self):
+        self.assertEqual(Embed(title="a"), Embed(title="a"))
+        self.assertNotEqual(Embed(title="a"), Embed(title="b"))
+        embed = Embed(title="a", fields=[{"name": "n", "value": "v"}])
+        self.assertEqual(embed, Embed.fromDict(embed.toDict()))
+
+    def test_colour(self):
+        self.assertEqual(Embed(title="a").colour, Color.blurple())
+        self.assertIsNone(Embed(color=None).colour)
+        embed = Embed()
+        embed.colour = Color.red()
+        self.assertEqual(embed.color, Color.red())
+
+    def test_len(self):
+        self.assertEqual(len(Embed(title="a")), 1)
+        embed = Embed(
+            title="ab",
+            description="cde",
+            author={"name": "fg"},
+            footer={"text": "h"},
+            fields=[{"name": "ij", "value": "k"}],
+        )
+        self.assertEqual(len(embed), 11)
+        self.assertEqual(len(embed), embed.total_length)
+        embed.add_field(name="l", value="m")
+        self.assertEqual(len(embed), 13)
+
+
+class EmbedSetterTest(unittest.TestCase):
+    def test_discord_helpers(self):
+        embed = Embed(title="a")
+        encoded = embed.toJSON()
+        self.assertIs(embed.set_author(name="b", url="https://example.com", icon_url="https://example.com/a.png"), embed)
+        embed.set_footer(text="c", icon_url="https://example.com/f.png")
+        embed.set_image(url="https://example.com/i.png")
+        embed.set_thumbnail(url="https://example.com/t.png")
+        self.assertIsInstance(embed.author, AuthorObject)
+        self.assertIsInstance(embed.footer, FooterObject)
+        self.assertIsInstance(embed.image, ImageObject)
+        self.assertIsInstance(embed.thumbnail, ImageObject)
+        self.assertNotEqual(embed.toJSON(), encoded)
+        self.assertEqual(embed.to_dict()["footer"], {"text": "c", "icon_url": "https://example.com/f.png"})
+        self.assertEqual(embed, Embed.fromDict(embed.toDict()))
+
+        embed.remove_author().remove_footer().set_image(url=None).set_thumbnail(url=None)
+        self.assertEqual(embed.toJSON(), encoded)
+        self.assertEqual(embed.to_dict(), Embed(title="a").to_dict())
+        with self.assertRaises(SchemaError):
+            embed.set_author(name="x" * 257)
+
+    def test_color(self):
+        embed = Embed(title="a")
+        embed.color = 0xFF0000
+        self.assertEqual(embed.color, Color(0xFF0000))
+        self.assertIn(b'"color":16711680', embed.toJSON())
+        embed.color = "red"
+        self.assertEqual(embed.color, Color.red())
+        self.assertEqual(Embed(color="red").color, Color.red())
+        embed.color = None
+        self.assertIsNone(embed.color)
+        self.assertNotIn(b"color", embed.toJSON())
+        for value in (-1, 0x1000000, True, 1.5):
+            with self.assertRaises(SchemaError):
+                embed.color = value
+        for value in ("nope", "from_rgb", "_get_value"):
+            with self.assertRaises(ValueError):
+                embed.color = value
+
+    def test_parts_accept_objects_and_none(self):
+        author, footer, image = AuthorObject("a"), FooterObject("f"), ImageObject("https://example.com/i.png")
+        embed = Embed(title="t")
+        embed.author, embed.footer, embed.image, embed.thumbnail = author, footer, image, image
+        self.assertIs(embed.author, author)
+        self.assertIs(embed.footer, footer)
+        self.assertEqual(embed.toDict()["thumbnail"], {"url": "https://example.com/i.png"})
+        embed.author = embed.footer = embed.image = embed.thumbnail = None
+        self.assertEqual(embed.toDict(), Embed(title="t").toDict())
+        embed.author = {"name": "d"}
+        self.assertEqual(embed.author, AuthorObject("d"))
+
+
+class EmbedSchemaTest(unittest.TestCase):
+    def test_init(self):
+        with self.assertRaises(SchemaError):
+            Embed(title="x" * 257)
+        with self.assertRaises(SchemaError):
+            Embed(description="x" * 2049)
+
+    def test_from_dict_reports_every_violation(self):
+        with self.assertRaises(SchemaError) as caught:
+            Embed.fromDict({
+                "title": "x" * 257,
+                "color": -1,
+                "footer": {"text": 5},
+                "fields": [{"name": "a"}],
+            })
+        self.assertEqual(
+            [error.path for error in caught.exception.violations],
+            ["title", "color", "footer.text", "fields[0].value"],
+        )
+
+    def test_paginator_defaults(self):
+        pages = list(EmbedPaginator(["x" * 100] * 30 + [{"name": "n", "value": "v"}] * 30))
+        self.assertTrue(all(len(page.description) <= 2048 and len(page.fields or ()) <= 25 for page in pages))
+
+
+if __name__ == "__main__":
+    unittest.main()
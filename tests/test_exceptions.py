@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import discord
+
+from melonutils.core import (
+    ActionNotExecutable,
+    HierarchyException,
+    RedBotCommandError,
+    UnexpectedKwargsError,
+    can_execute_action,
+    count_error,
+    error_counts,
+    reset_error_counts,
+)
+
+
+class CommandErrorArgsTest(unittest.TestCase):
+    def test_args_hold_the_cleaned_message(self):
+        error = ActionNotExecutable("Don't ping @everyone or @here")
+        self.assertEqual(error.args, ("Don't ping @​everyone or @​here",))
+        self.assertEqual(error.args[0], str(error))
+        self.assertEqual(error.message, "Don't ping @everyone or @here")
+        self.assertEqual(RedBotCommandError("a @here", 1).args, ("a @​here", 1))
+        self.assertEqual(RedBotCommandError().args, ())
+
+    def test_hierarchy_args(self):
+        member = mock.Mock(__str__=lambda self: "@everyone")
+        error = HierarchyException(member, author_error=True)
+        self.assertEqual(
+            error.args,
+            ("**@​everyone**'s top role is higher than your top role. You can't do that!",),
+        )
+        self.assertIs(error.member, member)
+        self.assertEqual(repr(error), "HierarchyException({!r})".format(error.args[0]))
+
+
+class ErrorCountTest(unittest.TestCase):
+    def setUp(self):
+        reset_error_counts()
+
+    def tearDown(self):
+        reset_error_counts()
+
+    def test_construction_is_not_counted(self):
+        ActionNotExecutable("probe")
+        UnexpectedKwargsError({"a": 1})
+        self.assertEqual(error_counts(), {})
+        error = UnexpectedKwargsError({"a": 1})
+        self.assertIs(count_error(error), error)
+        self.assertEqual(error_counts(), {"UnexpectedKwargsError": 1})
+        self.assertEqual(error_counts(by_code=True), {"embedgen.unexpected_kwargs": 1})
+
+    def test_raised_errors_are_counted(self):
+        author = mock.Mock(spec=discord.Member)
+        ctx = mock.Mock(author=author)
+        with self.assertRaises(ActionNotExecutable):
+            asyncio.run(can_execute_action(ctx, author))
+        self.assertEqual(error_counts(), {"ActionNotExecutable": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
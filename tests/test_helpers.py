@@ -0,0 +1,39 @@
+import itertools
+import unittest
+
+from melonutils.core import ascii_color
+
+
+def old_ascii_color(color=None, /, *, fmt=0, bg=False) -> str:
+    # the implementation before the style table
+    base = "\u001b["
+    if fmt != 0:
+        base += "{fmt};"
+    if color is None:
+        base += "{color}m"
+        color = 0
+    else:
+        if bg is True:
+            base += "4{color}m"
+        else:
+            base += "3{color}m"
+    return base.format(fmt=fmt, color=color)
+
+
+class AsciiColorTest(unittest.TestCase):
+    def test_parity_with_old_implementation(self):
+        colors = (None, *range(-1, 10), True, False, 1.0, 0.0, "1", "x")
+        formats = (0, 1, 2, 4, True, False, 1.0, 4.0, "1")
+        backgrounds = (True, False, 1, 0, None, "")
+        for color, fmt, bg in itertools.product(colors, formats, backgrounds):
+            with self.subTest(color=color, fmt=fmt, bg=bg):
+                self.assertEqual(ascii_color(color, fmt=fmt, bg=bg), old_ascii_color(color, fmt=fmt, bg=bg))
+
+    def test_bool_and_float_arguments(self):
+        self.assertEqual(ascii_color(True), "\u001b[3Truem")
+        self.assertEqual(ascii_color(1, fmt=True), "\u001b[True;31m")
+        self.assertEqual(ascii_color(1, fmt=1.0), "\u001b[1.0;31m")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import pathlib
+import subprocess
+import sys
+import unittest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+HEAVY = ("discord", "redbot", "aiohttp")
+# generous, it only has to catch a heavy dependency creeping back in
+BUDGET_US = 200_000
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_heavy_modules_load_on_first_access(self):
+        result = _run(
+            "import sys\n"
+            "import melonutils.core as core\n"
+            "print(sorted(name for name in {heavy!r} if name in sys.modules))\n"
+            "core.Embed\n"
+            "print('discord' in sys.modules)\n".format(heavy=HEAVY)
+        )
+        self.assertEqual(result.stdout.splitlines(), ["[]", "True"])
+
+    def test_import_time(self):
+        result = _run("import melonutils.core", "-X", "importtime")
+        timings = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                timings[name.strip()] = int(cumulative)
+        self.assertFalse([name for name in timings if name.split(".")[0] in HEAVY])
+        self.assertLess(timings["melonutils.core"], BUDGET_US)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from melonutils.core import MemberCache
+
+
+def _member(guild_id: int, user_id: int) -> mock.Mock:
+    return mock.Mock(id=user_id, guild=mock.Mock(id=guild_id))
+
+
+def _guild(guild_id: int) -> mock.Mock:
+    guild = mock.Mock(id=guild_id)
+    guild.get_member.return_value = None
+
+    async def fetch_member(user_id):
+        return _member(guild_id, user_id)
+
+    guild.fetch_member = fetch_member
+    return guild
+
+
+class MemberCacheTest(unittest.TestCase):
+    def test_events_only_refresh_cached_members(self):
+        async def main():
+            cache = MemberCache(maxsize=2)
+            guild = _guild(1)
+            await cache.get_member(guild, 1)
+            await cache.get_member(guild, 2)
+            # a busy guild sends updates for members nobody looked up
+            for user_id in range(3, 100):
+                await cache.on_member_update(_member(1, user_id), _member(1, user_id))
+                await cache.on_member_join(_member(2, user_id))
+            self.assertEqual(sorted(cache._entries), [(1, 1), (1, 2)])
+
+            updated = _member(1, 1)
+            await cache.on_member_update(_member(1, 1), updated)
+            self.assertIs(await cache.get_member(guild, 1), updated)
+            self.assertEqual(cache.stats().misses, 2)
+            # refreshing does not count as a use, (1, 1) was just read
+            await cache.on_member_update(_member(1, 2), _member(1, 2))
+            await cache.get_member(guild, 3)
+            self.assertEqual(sorted(cache._entries), [(1, 1), (1, 3)])
+
+        asyncio.run(main())
+
+    def test_update_stores_any_member(self):
+        cache = MemberCache()
+        member = _member(1, 5)
+        cache.update(member)
+        self.assertEqual(cache._entries[(1, 5)][1], member)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import discord
+
+from melonutils.core import ModerationAction, ModerationExecutor
+from melonutils.core import moderation
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """
+    An event loop whose clock only moves when every task is waiting,
+    jumping straight to the next timer, so pacing can be asserted exactly.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.now = 0.0
+        select = self._selector.select
+
+        def advance(timeout=None):
+            if timeout:
+                self.now += timeout
+            return select(0)
+
+        self._selector.select = advance
+
+    def time(self) -> float:
+        return self.now
+
+
+def run(coro):
+    loop = VirtualTimeLoop()
+    try:
+        with mock.patch.object(moderation, "monotonic", loop.time):
+            return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class FakeHTTP:
+    """
+    Allows ``limit`` requests per ``window`` seconds in each bucket and
+    answers 429 with a ``Retry-After`` beyond that, like Discord.
+    """
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self.windows = {}
+        self.sent = {}
+        self.rate_limited = 0
+
+    async def request(self, bucket) -> None:
+        now = asyncio.get_running_loop().time()
+        start, count = self.windows.get(bucket, (now, 0))
+        if now - start >= self.window:
+            start, count = now, 0
+        if count >= self.limit:
+            self.rate_limited += 1
+            response = mock.Mock(status=429, reason="Too Many Requests")
+            response.headers = {"Retry-After": str(self.window - (now - start))}
+            raise discord.HTTPException(response, {"message": "You are being rate limited.", "code": 0})
+        self.windows[bucket] = (start, count + 1)
+        self.sent.setdefault(bucket, []).append(now)
+        # the round trip
+        await asyncio.sleep(0.05)
+
+
+def _context(http: FakeHTTP, guild_id: int) -> mock.Mock:
+    guild = mock.Mock(id=guild_id)
+
+    async def ban(target, *, delete_message_seconds=0, reason=None):
+        await http.request(("ban", guild_id))
+
+    guild.ban = ban
+    return mock.Mock(guild=guild)
+
+
+async def _collect(executor, ctx, targets, action=None):
+    action = action or ModerationAction.ban()
+    return [result async for result in executor.run(ctx, targets, action, check=False)]
+
+
+class ModerationExecutorTest(unittest.TestCase):
+    def test_paces_each_bucket(self):
+        http = FakeHTTP(limit=100, window=1.0)
+        executor = ModerationExecutor(concurrency=8, rate=5.0)
+        targets = [mock.Mock(id=index) for index in range(15)]
+
+        async def main():
+            return await asyncio.gather(
+                _collect(executor, _context(http, 1), targets),
+                _collect(executor, _context(http, 2), targets),
+            )
+
+        first, second = run(main())
+        self.assertTrue(all(first) and all(second))
+        self.assertEqual(sorted(result.index for result in first), list(range(15)))
+        for bucket in (("ban", 1), ("ban", 2)):
+            sent = http.sent[bucket]
+            self.assertEqual(len(sent), 15)
+            gaps = [later - earlier for earlier, later in zip(sent, sent[1:])]
+            self.assertGreaterEqual(min(gaps), 0.2 - 1e-9)
+            self.assertAlmostEqual(sent[-1] - sent[0], 14 * 0.2)
+        # the guilds do not share a bucket, so they ran side by side
+        self.assertEqual(http.sent[("ban", 1)], http.sent[("ban", 2)])
+        self.assertEqual(http.rate_limited, 0)
+
+    def test_retries_rate_limited_requests(self):
+        http = FakeHTTP(limit=5, window=2.0)
+        executor = ModerationExecutor(concurrency=8, rate=100.0, max_retries=5)
+        results = run(_collect(executor, _context(http, 1), [mock.Mock(id=index) for index in range(12)]))
+        self.assertTrue(all(results))
+        self.assertGreater(http.rate_limited, 0)
+        sent = http.sent[("ban", 1)]
+        self.assertEqual(len(sent), 12)
+        # nothing got through before the window reset
+        self.assertGreaterEqual(sent[5] - sent[0], 2.0 - 1e-9)
+        self.assertTrue(any(result.attempts > 1 for result in results))
+
+    def test_gives_up_after_max_retries(self):
+        http = FakeHTTP(limit=0, window=1.0)
+        executor = ModerationExecutor(rate=100.0, max_retries=2)
+        (result,) = run(_collect(executor, _context(http, 1), [mock.Mock(id=1)]))
+        self.assertIsInstance(result.error, discord.HTTPException)
+        self.assertEqual(result.attempts, 3)
+
+    def test_other_errors_are_reported(self):
+        http = FakeHTTP(limit=100, window=1.0)
+        executor = ModerationExecutor(rate=100.0)
+
+        async def action(guild, target, reason):
+            if target.id == 1:
+                raise RuntimeError("custom action failed")
+            await http.request(("custom", guild.id))
+
+        targets = [mock.Mock(id=index) for index in range(3)]
+        # users have no `timeout`, members do
+        users = [mock.Mock(spec=["id"], id=index) for index in range(2)]
+        results = run(_collect(executor, _context(http, 1), targets, ModerationAction("custom", action)))
+        timeouts = run(_collect(executor, _context(http, 1), users, ModerationAction.timeout(None)))
+        self.assertEqual(len(results), 3)
+        failed = [result for result in results if not result]
+        self.assertEqual([(result.index, result.attempts) for result in failed], [(1, 1)])
+        self.assertIsInstance(failed[0].error, RuntimeError)
+        self.assertEqual(len(http.sent[("custom", 1)]), 2)
+        self.assertTrue(all(isinstance(result.error, AttributeError) for result in timeouts))
+        self.assertEqual(len(timeouts), 2)
+
+    def test_idle_buckets_are_dropped(self):
+        http = FakeHTTP(limit=100, window=1.0)
+        executor = ModerationExecutor(rate=100.0)
+
+        async def main():
+            for guild_id in range(50):
+                await _collect(executor, _context(http, guild_id), [mock.Mock(id=1)])
+                await asyncio.sleep(0.1)
+
+        run(main())
+        self.assertLessEqual(len(executor._buckets), 1)
+
+    def test_buckets_in_use_are_kept(self):
+        http = FakeHTTP(limit=100, window=1.0)
+        executor = ModerationExecutor(rate=100.0)
+
+        async def main():
+            running = executor.run(
+                _context(http, 1), [mock.Mock(id=1), mock.Mock(id=2)], ModerationAction.ban(), check=False
+            )
+            await running.__anext__()
+            await asyncio.sleep(1.0)
+            await _collect(executor, _context(http, 2), [mock.Mock(id=1)])
+            self.assertIn(("ban", 1), executor._buckets)
+            await running.aclose()
+
+        run(main())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+from unittest import mock
+
+from melonutils.core import (
+    AuthorObject,
+    EmbedTemplate,
+    Field,
+    Fields,
+    FooterObject,
+    ImageObject,
+    ObjectInterner,
+    ProviderObject,
+    SchemaError,
+)
+from melonutils.core import object as embed_object
+
+
+class EmbedObjectTest(unittest.TestCase):
+    def test_equality(self):
+        self.assertEqual(AuthorObject("x"), AuthorObject("x"))
+        self.assertEqual(Fields([Field("a", "b")]), Fields([{"name": "a", "value": "b"}]))
+        # same values, different property
+        self.assertNotEqual(ImageObject("https://example.com"), ProviderObject("x", "https://example.com"))
+
+    def test_mutable_objects_are_unhashable(self):
+        for obj in (AuthorObject("x"), FooterObject("y"), Field("a", "b"), Fields()):
+            with self.assertRaises(TypeError):
+                hash(obj)
+
+    def test_interning_shares_equal_objects(self):
+        interner = ObjectInterner()
+        first = interner.get(AuthorObject, {"name": "x"})
+        self.assertIs(interner.get(AuthorObject, {"name": "x"}), first)
+        self.assertIs(interner.intern(AuthorObject("x")), first)
+        self.assertIsNot(interner.get(AuthorObject, {"name": "y"}), first)
+        # changed in place, so no longer handed out for its old values
+        first.name = "z"
+        self.assertEqual(interner.get(AuthorObject, {"name": "x"}).name, "x")
+
+    def test_slots(self):
+        for obj in (AuthorObject("x"), FooterObject("y"), Field("a", "b"), Fields()):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+
+class FieldsTest(unittest.TestCase):
+    def test_slices(self):
+        fields = Fields([Field("a", "b"), Field("cd", "e", True), Field("f", "gh")])
+        head = fields[0:2]
+        self.assertIsInstance(head, Fields)
+        self.assertEqual(list(head), [Field("a", "b"), Field("cd", "e", True)])
+        self.assertEqual(head.text_length, 5)
+        self.assertEqual(list(fields[::-2]), [Field("f", "gh"), Field("a", "b")])
+        self.assertEqual(len(fields[5:]), 0)
+        # an independent copy
+        head.append(Field("x", "y"))
+        self.assertEqual(len(fields), 3)
+        self.assertEqual(head.toJSON(), Fields(list(head)).toJSON())
+
+        del fields[:2]
+        self.assertEqual(list(fields), [Field("f", "gh")])
+        self.assertEqual(fields.text_length, 3)
+        with self.assertRaises(TypeError):
+            fields[0:1] = [Field("a", "b")]
+
+    def test_field_objects_are_not_checked_again(self):
+        check = mock.Mock(wraps=embed_object._FIELDS)
+        with mock.patch.object(embed_object, "_FIELDS", check):
+            fields = Fields([Field("a", "b"), Field("c", "d", True)])
+            self.assertEqual(len(fields), 2)
+            check.assert_not_called()
+            fields.extend([Field("e", "f"), {"name": "g", "value": "h"}])
+            check.assert_called_once_with({"fields": [{"name": "g", "value": "h"}]})
+
+    def test_template_static_field_is_not_checked_again(self):
+        template = EmbedTemplate({
+            "title": "Hi {name}",
+            "fields": [{"name": "static", "value": "field"}],
+        })
+        check = mock.Mock(wraps=embed_object._FIELDS)
+        with mock.patch.object(embed_object, "_FIELDS", check):
+            for name in ("a", "b"):
+                embed = template.render(name=name)
+                self.assertEqual(embed.fields[0].name, "static")
+        check.assert_not_called()
+
+    def test_violation_paths_count_every_field(self):
+        with self.assertRaises(SchemaError) as caught:
+            Fields([Field("a", "b"), {"name": "c"}, Field("d", "e"), {"name": "x" * 300, "value": "f"}])
+        self.assertEqual(
+            [error.path for error in caught.exception.violations],
+            ["fields[1].value", "fields[3].name"],
+        )
+
+
+class SchemaRoutingTest(unittest.TestCase):
+    def test_footer(self):
+        footer = FooterObject("text", icon_url="not a url")
+        self.assertIsNone(footer.icon_url)
+        with self.assertRaises(SchemaError):
+            FooterObject("x" * 2049)
+        with self.assertRaises(SchemaError):
+            FooterObject(5)
+
+    def test_provider(self):
+        self.assertEqual(ProviderObject("name", "https://example.com").name, "name")
+        with self.assertRaises(SchemaError):
+            ProviderObject("name", "not a url")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from melonutils.core import Embed, EmbedTemplate, SchemaError
+from melonutils.core import embed as embed_module
+from melonutils.core import object as embed_object
+
+
+SOURCE = {
+    "title": "Welcome {member}!",
+    "description": "Static description",
+    "color": 0x00FF00,
+    "timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat(),
+    "author": {"name": "Bot"},
+    "footer": {"text": "Member #{count}"},
+    "fields": [
+        {"name": "Static", "value": "field", "inline": True},
+        {"name": "Count", "value": "{count}"},
+    ],
+}
+
+
+def expected(member, count):
+    data = dict(SOURCE)
+    data["title"] = data["title"].format(member=member)
+    data["footer"] = {"text": "Member #{}".format(count)}
+    data["fields"] = [SOURCE["fields"][0], {"name": "Count", "value": str(count)}]
+    return Embed.fromDict(data)
+
+
+class EmbedTemplateTest(unittest.TestCase):
+    def test_render_matches_from_dict(self):
+        template = EmbedTemplate(SOURCE)
+        for member, count in (("a", 1), ("b", 22)):
+            embed = template.render(member=member, count=count)
+            self.assertEqual(embed.toJSON(), expected(member, count).toJSON())
+
+    def test_static_parts_are_not_validated_again(self):
+        template = EmbedTemplate(SOURCE)
+        with mock.patch.object(embed_object, "_FIELD") as field, \
+                mock.patch.object(embed_object, "_AUTHOR") as author, \
+                mock.patch.object(embed_module, "_HEAD") as head, \
+                mock.patch.object(embed_module, "validate_embed") as payload:
+            template.render(member="a", count=1)
+        field.check.assert_not_called()
+        author.check.assert_not_called()
+        head.check.assert_not_called()
+        payload.check.assert_not_called()
+
+    def test_filled_values_are_validated(self):
+        template = EmbedTemplate(SOURCE)
+        with self.assertRaises(SchemaError) as caught:
+            template.render(member="x" * 300, count="y" * 2000)
+        self.assertEqual(
+            [error.path for error in caught.exception.violations],
+            ["title", "fields[1].value"],
+        )
+
+    def test_total_length_is_checked(self):
+        template = EmbedTemplate({
+            "title": "{title}",
+            "description": "d" * 2000,
+            "footer": {"text": "{footer}"},
+            "fields": [{"name": "n", "value": "v" * 1000}] * 2 + [{"name": "{name}", "value": "{value}"}],
+        })
+        # 2000 + 2 * 1001 static characters
+        embed = template.render(title="t" * 256, footer="f" * 1000, name="n", value="v" * 741)
+        self.assertEqual(len(embed), 6000)
+        with self.assertRaises(SchemaError) as caught:
+            template.render(title="t" * 256, footer="f" * 1000, name="n", value="v" * 742)
+        self.assertEqual([error.path for error in caught.exception.violations], [""])
+        with self.assertRaises(SchemaError):
+            Embed.fromDict({
+                "title": "t" * 256,
+                "description": "d" * 2000,
+                "footer": {"text": "f" * 1000},
+                "fields": [{"name": "n", "value": "v" * 1000}] * 2 + [{"name": "n", "value": "v" * 742}],
+            })
+
+    def test_rendered_fields_are_independent(self):
+        template = EmbedTemplate({"title": "{a}", "fields": [{"name": "n", "value": "v"}]})
+        first = template.render(a="1")
+        first.add_field(name="x", value="y")
+        self.assertEqual(len(template.render(a="2").fields), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
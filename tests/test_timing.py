@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+
+from melonutils.core import add_logging, get_timings, reset_timings
+from melonutils.core.metrics import render_metrics
+
+
+def _metric(page, suffix, name):
+    prefix = 'melonutils_function_duration_seconds_{}{{function="{}"'.format(suffix, name)
+    line = next(line for line in page.splitlines() if line.startswith(prefix) and "le=" not in line)
+    return float(line.rsplit(" ", 1)[1])
+
+
+class AddLoggingTest(unittest.TestCase):
+    def tearDown(self):
+        reset_timings()
+
+    def test_counts_every_call(self):
+        func = add_logging(name="tests.plain")(lambda: None)
+        for _ in range(25):
+            func()
+        stats = get_timings("tests.plain")["tests.plain"]
+        self.assertEqual((stats.count, stats.calls), (25, 25))
+
+    def test_sampled_calls_are_counted(self):
+        func = add_logging(name="tests.sampled", sample_rate=0.1)(lambda: None)
+        for _ in range(1000):
+            func()
+        stats = get_timings("tests.sampled")["tests.sampled"]
+        self.assertEqual(stats.count, 100)
+        self.assertEqual(stats.calls, 1000)
+
+    def test_async_sampled_calls_are_counted(self):
+        @add_logging(name="tests.async", sample_rate=0.5)
+        async def func():
+            pass
+
+        async def main():
+            for _ in range(10):
+                await func()
+
+        asyncio.run(main())
+        stats = get_timings("tests.async")["tests.async"]
+        self.assertEqual((stats.count, stats.calls), (5, 10))
+
+    def test_metrics_scale_sampled_histograms(self):
+        func = add_logging(name="tests.metrics", sample_rate=0.1)(lambda: None)
+        for _ in range(1000):
+            func()
+        stats = get_timings("tests.metrics")["tests.metrics"]
+        page = render_metrics()
+        self.assertEqual(_metric(page, "count", "tests.metrics"), 1000)
+        self.assertAlmostEqual(_metric(page, "sum", "tests.metrics"), stats.total_ns * 10 / 1e9)
+        self.assertIn('melonutils_function_duration_seconds_bucket{function="tests.metrics",le="+Inf"} 1000', page)
+
+    def test_reset(self):
+        func = add_logging(name="tests.reset", sample_rate=0.5)(lambda: None)
+        func()
+        reset_timings("tests.reset")
+        self.assertEqual(get_timings("tests.reset")["tests.reset"].calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import unittest
+from datetime import datetime
+
+from discord import Color
+
+from melonutils.core import (
+    AuthorObject,
+    Embed,
+    EmbedType,
+    Field,
+    Fields,
+    FooterObject,
+    ImageObject,
+    LazyEmbed,
+    ProviderObject,
+    SchemaError,
+    VideoObject,
+)
+
+PAYLOADS = [
+    {},
+    {"title": "x"},
+    {"description": "only a description"},
+    {"title": "t", "description": None, "type": "rich"},
+    {
+        "type": "rich",
+        "title": "Server info",
+        "url": "https://example.com/info",
+        "description": "**bold** and `code`, ünïcödé ✓",
+        "color": 0x5865F2,
+        "timestamp": "2024-03-01T12:30:00+00:00",
+        "author": {"name": "bot", "url": "https://example.com", "icon_url": "https://cdn.discordapp.com/a.png"},
+        "footer": {"text": "page 1/3", "icon_url": "https://cdn.discordapp.com/f.png"},
+        "thumbnail": {"url": "https://cdn.discordapp.com/t.png", "height": 64, "width": 64},
+        "image": {"url": "https://cdn.discordapp.com/i.png"},
+        "provider": {"name": "provider", "url": "https://example.com"},
+        "fields": [
+            {"name": "a", "value": "b"},
+            {"name": "c", "value": "d", "inline": True},
+            {"name": "e", "value": "f", "inline": False},
+        ],
+    },
+    {"color": 0, "footer": {"text": "footer only"}, "author": {"name": "author only"}},
+    {"fields": [{"name": "#{}".format(i), "value": "player {}".format(i), "inline": i % 2 == 0} for i in range(25)]},
+    {"provider": {"name": "n"}, "image": {"url": "https://a.b/c.png"}, "footer": {"text": "t"}},
+]
+
+PARTS = [
+    (AuthorObject, {"name": "bot"}),
+    (AuthorObject, {"name": "bot", "url": "https://example.com", "icon_url": "https://example.com/a.png"}),
+    (FooterObject, {"text": "footer"}),
+    (FooterObject, {"text": "footer", "icon_url": "https://example.com/f.png"}),
+    (ImageObject, {"url": "https://example.com/i.png"}),
+    (ImageObject, {"url": "https://example.com/i.png", "height": 10, "width": 20}),
+    (VideoObject, {"url": "https://example.com/v.mp4", "height": 10, "width": 20}),
+    (ProviderObject, {"name": "provider"}),
+    (ProviderObject, {"name": "provider", "url": "https://example.com"}),
+    (Field, {"name": "a", "value": "b"}),
+    (Field, {"name": "a", "value": "b", "inline": True}),
+]
+
+
+def _validated(data):
+    # the keyword constructor, checking and building every part itself
+    color = data.get("color")
+    timestamp = data.get("timestamp")
+    return Embed(
+        embed_type=EmbedType.from_value(data.get("type") or EmbedType.RICH),
+        title=data.get("title"),
+        url=data.get("url"),
+        description=data.get("description") or "",
+        color=Color(color) if color is not None else None,
+        timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+        author=data.get("author"),
+        footer=data.get("footer"),
+        thumbnail=data.get("thumbnail"),
+        image=data.get("image"),
+        provider=data.get("provider"),
+        fields=data.get("fields"),
+    )
+
+
+class TrustedParityTest(unittest.TestCase):
+    def assertSameEmbed(self, trusted, validated):
+        self.assertEqual(trusted.toJSON(), validated.toJSON())
+        self.assertEqual(trusted.toDict(), validated.toDict())
+        self.assertEqual(trusted, validated)
+        self.assertEqual(len(trusted), len(validated))
+        for attr in ("title", "url", "description", "color", "timestamp", "type"):
+            self.assertEqual(getattr(trusted, attr), getattr(validated, attr), attr)
+        for attr in ("author", "footer", "thumbnail", "image", "provider", "fields"):
+            part, expected = getattr(trusted, attr), getattr(validated, attr)
+            self.assertIs(type(part), type(expected), attr)
+            if part is not None:
+                self.assertEqual(part._values(), expected._values(), attr)
+
+    def test_embed(self):
+        for data in PAYLOADS:
+            with self.subTest(data=data):
+                trusted = Embed.fromTrusted(data)
+                self.assertSameEmbed(trusted, Embed.fromDict(data))
+                self.assertSameEmbed(trusted, _validated(data))
+
+    def test_round_trip(self):
+        for data in PAYLOADS:
+            with self.subTest(data=data):
+                payload = Embed.fromDict(data).toDict()
+                self.assertSameEmbed(Embed.fromTrusted(payload), Embed.fromDict(payload))
+
+    def test_lazy_embed(self):
+        for data in PAYLOADS:
+            with self.subTest(data=data):
+                self.assertSameEmbed(LazyEmbed(data, trusted=True), LazyEmbed(data))
+                self.assertEqual(LazyEmbed(data, trusted=True).toJSON(), Embed.fromDict(data).toJSON())
+
+    def test_lazy_embed_validates_like_from_dict(self):
+        for data in (
+            {"color": "red"},
+            {"color": 0x1000000},
+            {"color": True},
+            {"timestamp": "yesterday"},
+            {"timestamp": 5},
+            {"title": "x" * 257, "fields": [{"name": "a"}], "footer": {"text": 1}},
+            {"description": "x" * 2048, "footer": {"text": "x" * 2048}, "fields": [{"name": "n", "value": "v" * 1000}] * 2},
+        ):
+            with self.subTest(data=data):
+                with self.assertRaises(SchemaError) as expected:
+                    Embed.fromDict(data)
+                with self.assertRaises(SchemaError) as caught:
+                    LazyEmbed(data)
+                self.assertEqual(caught.exception.violations, expected.exception.violations)
+                # trusted payloads are taken as they are
+                LazyEmbed(data, trusted=True)
+        self.assertEqual(LazyEmbed({"color": Color.red()}).color, Embed.fromDict({"color": Color.red()}).color)
+
+    def test_parts(self):
+        for cls, data in PARTS:
+            with self.subTest(cls=cls.__name__, data=data):
+                trusted, validated = cls.fromTrusted(data), cls.fromDict(data)
+                self.assertEqual(trusted, validated)
+                self.assertEqual(trusted._values(), validated._values())
+                self.assertEqual(trusted.toDict(), validated.toDict())
+
+    def test_fields(self):
+        for data in PAYLOADS:
+            fields = data.get("fields")
+            if fields is None:
+                continue
+            with self.subTest(count=len(fields)):
+                trusted, validated = Fields.fromTrusted(fields), Fields.fromDict(fields)
+                self.assertEqual(trusted, validated)
+                self.assertEqual(trusted.toDict(), validated.toDict())
+                self.assertEqual(list(trusted), list(validated))
+                self.assertEqual(list(trusted), [Field.fromDict(field) for field in fields])
+
+
+if __name__ == "__main__":
+    unittest.main()